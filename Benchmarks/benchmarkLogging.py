@@ -0,0 +1,53 @@
+from DiscretePlanning.Environments.HillClimber import HillClimber
+from DiscretePlanning.forwardSearchAlgorithms import ForwardBFS, ForwardDFS, ForwardDijkstraSearch, ForwardAStar
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from argparse import ArgumentParser
+from typing import List, Optional, Tuple
+import numpy as np
+
+# Compares the instrumented (logged) execution path of every forward search algorithm against its non-instrumented path
+# Usage: python -m Benchmarks.benchmarkLogging --size 12 --repeats 3
+
+def height_function(x: int, y: int) -> float:
+    return 10 * np.exp(-((x - 4) ** 2 + (y - 4) ** 2) / 10)
+
+def make_solver(name: str, problem, logFile):
+    if name == 'BFS':
+        return ForwardBFS(problem, logFile, createParent=True)
+    if name == 'DFS':
+        return ForwardDFS(problem, logFile, createParent=True)
+    if name == 'Dijkstra':
+        return ForwardDijkstraSearch(problem, logFile, createParent=True)
+    return ForwardAStar(problem, logFile, heuristic=None, createParent=True)
+
+def time_solver(name: str, size: int, logDirectory: Optional[str]) -> Tuple[float, Optional[List]]:
+    climber = HillClimber(height_function, (size, size), repr((0, 0)), {repr((size - 1, size - 1))})
+    logFile = None if logDirectory is None else Path(logDirectory) / f"{name}.json"
+    solver = make_solver(name, climber.problem, logFile)
+    start = perf_counter()
+    solution = solver.generateSolution()
+    return perf_counter() - start, solution
+
+def main():
+    parser = ArgumentParser(description="Benchmark logged against non-logged forward search")
+    parser.add_argument('--size', type=int, default=12, help="side length of the HillClimber grid")
+    parser.add_argument('--repeats', type=int, default=3, help="runs per configuration, the fastest is reported")
+    args = parser.parse_args()
+
+    print(f"{'Algorithm':<10}{'Logged (s)':>14}{'No Logging (s)':>16}{'Speedup':>10}")
+    for name in ['BFS', 'DFS', 'Dijkstra', 'AStar']:
+        logged, quiet = [], []
+        for _ in range(args.repeats):
+            with TemporaryDirectory() as logDirectory:
+                loggedTime, loggedSolution = time_solver(name, args.size, logDirectory)
+            quietTime, quietSolution = time_solver(name, args.size, None)
+            if loggedSolution != quietSolution:
+                raise RuntimeError(f"{name}: logged and non-logged searches returned different solutions")
+            logged.append(loggedTime)
+            quiet.append(quietTime)
+        print(f"{name:<10}{min(logged):>14.4f}{min(quiet):>16.4f}{min(logged) / min(quiet):>9.1f}x")
+
+if __name__ == '__main__':
+    main()
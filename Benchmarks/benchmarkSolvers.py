@@ -0,0 +1,163 @@
+from DiscretePlanning.Environments.HillClimber import HillClimber
+from DiscretePlanning.forwardSearchAlgorithms import ForwardBFS, ForwardDFS, ForwardDijkstraSearch, ForwardAStar
+from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from DiscretePlanning.logSerializers import createSerializer
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter, strftime
+from argparse import ArgumentParser
+from typing import Dict, Iterator, List, Optional
+import json
+import platform
+import random
+import tracemalloc
+import numpy as np
+
+# Runs every forward search algorithm on HillClimber grids and on random graphs, with and without logging, and writes
+# the results to a JSON file that can be compared against the results of another revision
+# Usage: python -m Benchmarks.benchmarkSolvers --output results.json [--compare baseline.json]
+
+ALGORITHMS = ('BFS', 'DFS', 'Dijkstra', 'AStar')
+RESULT_FORMAT_VERSION = 1
+
+def height_function(x, y):
+    return 10 * np.sin(x / 6) * np.cos(y / 9) + 0.1 * (x + y)
+
+def grid_problem(size: int) -> DiscretePlanningProblem:
+    climber = HillClimber(height_function, (size, size), (0, 0), {(size - 1, size - 1)}, stateEncoding='tuple')
+    return climber.problem
+
+def random_graph_problem(nodes: int, branching: int, seed: int) -> DiscretePlanningProblem:
+    """
+    Random directed graph over 0..nodes-1 with branching random edges per node plus an edge to the next node, so the
+    goal nodes-1 is always reachable from 0. Edge costs are uniform in [1, 10).
+    """
+    rng = random.Random(seed)
+    adjacency = [[node + 1 if node + 1 < nodes else 0] + [rng.randrange(nodes) for _ in range(branching)]
+                 for node in range(nodes)]
+    costs = [[rng.uniform(1.0, 10.0) for _ in successors] for successors in adjacency]
+    actions = [set(range(len(successors))) for successors in adjacency]
+    return DiscretePlanningProblem(lambda state: isinstance(state, int) and 0 <= state < nodes,
+                                   lambda state: actions[state],
+                                   lambda state, action: adjacency[state][action], 0, {nodes - 1},
+                                   costFunction=lambda state, action: costs[state][action])
+
+def make_solver(name: str, problem, logFile, log_options: Optional[Dict] = None):
+    if name == 'BFS':
+        return ForwardBFS(problem, logFile, createParent=True, log_options=log_options)
+    if name == 'DFS':
+        return ForwardDFS(problem, logFile, createParent=True, log_options=log_options)
+    if name == 'Dijkstra':
+        return ForwardDijkstraSearch(problem, logFile, createParent=True, log_options=log_options)
+    return ForwardAStar(problem, logFile, heuristic=None, createParent=True, log_options=log_options)
+
+def benchmark_cases(grid_sizes: List[int], graph_sizes: List[int], branchings: List[int], log_max_states: int) -> Iterator[Dict]:
+    """Yields one case description per benchmarked configuration, logging is only run on small state spaces"""
+    problems = [({'problem': 'grid', 'size': size, 'branching': 8}, size * size, lambda size=size: grid_problem(size))
+                for size in grid_sizes]
+    problems += [({'problem': 'random', 'size': nodes, 'branching': branching}, nodes,
+                  lambda nodes=nodes, branching=branching: random_graph_problem(nodes, branching, seed=nodes * 31 + branching))
+                 for nodes in graph_sizes for branching in branchings]
+    for description, states, factory in problems:
+        for algorithm in ALGORITHMS:
+            for logged in ([False, True] if states <= log_max_states else [False]):
+                yield {**description, 'algorithm': algorithm, 'logged': logged, 'factory': factory}
+
+def run_case(case: Dict, repeats: int, log_options: Optional[Dict] = None) -> Dict:
+    """
+    Times a case repeats times and reports the fastest run, peak memory is measured in one extra traced run since
+    tracemalloc slows allocation down
+    """
+    times, logBytes, solver = [], 0, None
+    # logs are recognized by suffix, the file name follows the log format
+    logName = 'log' + createSerializer((log_options or {}).get('format', 'json')).suffix
+    for _ in range(repeats):
+        problem = case['factory']()
+        with TemporaryDirectory() as logDirectory:
+            logFile = Path(logDirectory) / logName if case['logged'] else None
+            solver = make_solver(case['algorithm'], problem, logFile, log_options)
+            start = perf_counter()
+            solver.generateSolution()
+            times.append(perf_counter() - start)
+            logBytes = sum(path.stat().st_size for path in Path(logDirectory).iterdir())
+
+    problem = case['factory']()
+    with TemporaryDirectory() as logDirectory:
+        logFile = Path(logDirectory) / logName if case['logged'] else None
+        tracemalloc.start()
+        make_solver(case['algorithm'], problem, logFile, log_options).generateSolution()
+        _, peakMemory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    seconds = min(times)
+    metrics = solver.metrics
+    return {
+        **{key: value for key, value in case.items() if key != 'factory'},
+        'seconds': seconds,
+        'expansions': metrics.expansions,
+        'expansionsPerSecond': metrics.expansions / seconds if seconds > 0 else None,
+        'generated': metrics.generated,
+        'peakFrontier': metrics.peakFrontier,
+        'peakVisited': metrics.peakVisited,
+        'peakMemoryBytes': peakMemory,
+        'logBytes': logBytes,
+    }
+
+def case_key(result: Dict) -> str:
+    return f"{result['problem']}-{result['size']}-b{result['branching']}-{result['algorithm']}" \
+           f"{'-logged' if result['logged'] else ''}"
+
+def compare_results(baseline: Dict, current: Dict) -> None:
+    """Prints the time ratio of every case present in both result files, ratios above 1 are slowdowns"""
+    baselineResults = {case_key(result): result for result in baseline['results']}
+    print(f"{'Case':<40}{'Baseline (s)':>14}{'Current (s)':>14}{'Ratio':>8}")
+    for result in current['results']:
+        key = case_key(result)
+        if key not in baselineResults:
+            continue
+        before, after = baselineResults[key]['seconds'], result['seconds']
+        ratio = after / before if before > 0 else float('nan')
+        print(f"{key:<40}{before:>14.4f}{after:>14.4f}{ratio:>8.2f}")
+
+def main(argv: Optional[List[str]] = None):
+    parser = ArgumentParser(description="Benchmark forward search algorithms across grid sizes and branching factors")
+    parser.add_argument('--grid-sizes', type=int, nargs='+', default=[16, 32, 64], help="HillClimber grid side lengths")
+    parser.add_argument('--graph-sizes', type=int, nargs='+', default=[1000, 10000], help="random graph node counts")
+    parser.add_argument('--branching', type=int, nargs='+', default=[2, 8], help="random graph edges per node")
+    parser.add_argument('--log-max-states', type=int, default=1024,
+                        help="largest state space also benchmarked with logging enabled")
+    parser.add_argument('--log-format', default='json', help="log record format of logged runs, see SearchLogger")
+    parser.add_argument('--log-encoding', default='delta', choices=['snapshot', 'delta'],
+                        help="search memory encoding of logged runs, snapshots grow quadratically with the search")
+    parser.add_argument('--repeats', type=int, default=3, help="runs per configuration, the fastest is reported")
+    parser.add_argument('--output', type=Path, default=None, help="JSON file the results are written to")
+    parser.add_argument('--compare', type=Path, default=None, help="JSON results of a baseline run to compare against")
+    args = parser.parse_args(argv)
+
+    log_options = {'format': args.log_format, 'encoding': args.log_encoding}
+    results = []
+    print(f"{'Case':<40}{'Time (s)':>12}{'Expansions/s':>14}{'Peak MiB':>10}{'Log KiB':>10}")
+    for case in benchmark_cases(args.grid_sizes, args.graph_sizes, args.branching, args.log_max_states):
+        result = run_case(case, args.repeats, log_options)
+        results.append(result)
+        print(f"{case_key(result):<40}{result['seconds']:>12.4f}{result['expansionsPerSecond'] or 0:>14.0f}"
+              f"{result['peakMemoryBytes'] / 2 ** 20:>10.2f}{result['logBytes'] / 2 ** 10:>10.1f}", flush=True)
+
+    report = {
+        'version': RESULT_FORMAT_VERSION,
+        'created': strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'machine': platform.platform(),
+        'numpy': np.__version__,
+        'repeats': args.repeats,
+        'logOptions': log_options,
+        'results': results,
+    }
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=4))
+    if args.compare is not None:
+        compare_results(json.loads(args.compare.read_text()), report)
+    return report
+
+if __name__ == '__main__':
+    main()
@@ -1,15 +1,41 @@
-import json
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Set, Callable, Dict, Optional
-from json import loads, JSONDecodeError
-from collections import defaultdict
+from typing import Set, Callable, Dict, Iterator, List, Optional
+from json import JSONDecodeError
+from DiscretePlanning.logSerializers import LOG_SERIALIZERS, READ_CHUNK_SIZE, serializerForPath
+from collections import defaultdict, Counter
 from inspect import signature, Signature
 import os
+import re
+
+
+# log files written by SearchLogger in any of the built-in formats
+LOG_FILE_SUFFIXES = tuple(serializer.suffix for serializer in LOG_SERIALIZERS.values())
+
+
+def iter_log_events(path: Path, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[Dict]:
+    """
+    Yields the events of one log file in order, without loading the whole file.
+    The record format is recognized by the file suffix: JSON Lines files are decoded line by line, binary logs record by
+    record and JSON array files incrementally from fixed size chunks, so memory use is bounded by the chunk size and the
+    largest single event.
+
+    Parameters:
+    path: log file written by SearchLogger
+    chunk_size: number of characters read at a time from JSON array files
+    """
+    serializer = serializerForPath(path)
+    with path.open('rb' if serializer.binary else 'r') as file:
+        yield from serializer.iterRecords(file, chunk_size)
+
+
+def _natural_key(path: Path) -> List:
+    # orders log shards log.json, log_1.json, log_2.json, ..., log_10.json
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', path.name)]
 
 
 class AbstractAnimator(ABC):
-    """Abstract base class for animators that read JSON files to create animations."""
+    """Abstract base class for animators that read search log files (JSON, JSON Lines or binary) to create animations."""
 
     def __init__(self, json_directory: Path):
         """
@@ -26,11 +52,12 @@ class AbstractAnimator(ABC):
             raise ValueError(f'Directory does not contain any JSON files, Directory: {json_directory}')
 
         self.dir = json_directory
-        self.json_files = sorted(self.dir.glob('*.json'))
+        self.json_files = self._log_files()
         self.current_file_index = 0
         self.current_file = None
         self.memory = []
-        self._buff = []
+        self._reader = None
+        self._search_memory = None
 
         # Subscription variables
         self._event_to_callbackID = defaultdict(set)
@@ -40,53 +67,41 @@ class AbstractAnimator(ABC):
 
     def _get_next(self) -> Optional[Dict]:
         """
-        Fetches the next event in order from the series of JSON files.
+        Fetches the next event in order from the series of log files, events are read one at a time.
 
         Returns:
         dict: The next event dictionary, or None if the next event does not exist.
         """
-        if self.current_file_index >= len(self.json_files):
-            return None
-
-        # Index incrementation is now meaningful
-        if self.current_file is None:
-            try:
-                self._buff = json.loads(self.json_files[self.current_file_index].read_text())
+        while self.current_file_index < len(self.json_files):
+            if self._reader is None:
                 self.current_file = self.json_files[self.current_file_index]
-            except JSONDecodeError as err:
-                raise JSONDecodeError(
-                    f"Error decoding JSON in _get_next from {self.json_files[self.current_file_index]}: {err.msg}",
-                    doc=err.doc, pos=err.pos)
-            except IOError as io_err:
-                raise IOError(f"Error reading file {self.json_files[self.current_file_index]} in _get_next: {io_err}")
-            except Exception as err:
-                raise RuntimeError(
-                    f"Unexpected error in _get_next processing file {self.json_files[self.current_file_index]}: {err}")
-
-        while not self._buff:
-            self.current_file_index += 1
-            if self.current_file_index >= len(self.json_files):
-                return None
-            self.current_file = self.json_files[self.current_file_index]
+                self._reader = iter_log_events(self.current_file)
             try:
-                self._buff = json.loads(self.current_file.read_text())
+                event = next(self._reader, None)
             except JSONDecodeError as err:
-                raise JSONDecodeError(
-                    f"Error decoding JSON from {self.current_file}: {err.msg}",
-                    doc=err.doc, pos=err.pos)
+                self._reader = None
+                raise JSONDecodeError(f"Error decoding JSON from {self.current_file}: {err.msg}",
+                                      doc=err.doc, pos=err.pos)
             except IOError as io_err:
+                self._reader = None
                 raise IOError(f"Error reading file {self.current_file} in _get_next: {io_err}")
             except Exception as err:
+                self._reader = None
                 raise RuntimeError(f"Unexpected error in _get_next processing file {self.current_file}: {err}")
+            if event is not None:
+                return event
+            self._reader = None
+            self.current_file_index += 1
+        return None
 
-        # _buff is now populated
-        return self._buff.pop(0) if self._buff else None
+    def _log_files(self) -> List[Path]:
+        return sorted((file for file in self.dir.glob('*') if file.suffix in LOG_FILE_SUFFIXES), key=_natural_key)
 
     def _memory_callback(self, event: Dict):
         self.memory.append(event)
 
     def _update_JSON_files(self):
-        self.json_files = sorted(self.dir.glob('*.json'))
+        self.json_files = self._log_files()
 
     def _handle_event(self, event: Dict):
         """
@@ -98,6 +113,9 @@ class AbstractAnimator(ABC):
         #validate event
         self._validate_event(event)
         #event should be safe to use from here
+        entry = event["Entry"]
+        if "Keyframe" in entry or "Delta" in entry:
+            self._apply_search_memory(entry)
         event_type = event["Event"]
         callback_id_set = self._event_to_callbackID[event_type]
         for callback_id in callback_id_set:
@@ -108,6 +126,68 @@ class AbstractAnimator(ABC):
             callback(event)
         return
 
+    # ~~~ Delta Encoded Search Memory ~~~
+    def _apply_search_memory(self, entry: Dict) -> None:
+        """
+        Updates the search memory tracked for delta encoded logs with a "Keyframe" or "Delta" entry.
+        Frontier items are kept as a multiset in push order, so that pops can be applied in constant time.
+
+        Parameters:
+        entry (dict): The entry of a delta encoded event
+        """
+        keyframe = entry.get("Keyframe")
+        if keyframe is not None:
+            self._search_memory = {
+                "Frontier": Counter(self._freeze(item) for item in keyframe.get("Frontier", [])),
+                "Visitation Table": dict(keyframe.get("Visitation Table", {})),
+                "Cost Table": dict(keyframe.get("Cost Table", {}))
+            }
+            return
+
+        delta = entry["Delta"]
+        if self._search_memory is None:
+            raise ValueError(f'Delta encountered before any Keyframe, entry: {entry}')
+        memory = self._search_memory
+        memory["Visitation Table"].update(delta.get("Parents", {}))
+        memory["Cost Table"].update(delta.get("Costs", {}))
+        frontier = memory["Frontier"]
+        for item in delta.get("Pushed", []):
+            frontier[self._freeze(item)] += 1
+        for item in delta.get("Popped", []):
+            key = self._freeze(item)
+            if frontier[key] <= 1:
+                del frontier[key]
+            else:
+                frontier[key] -= 1
+        return
+
+    def reconstruct_snapshot(self) -> Optional[Dict]:
+        """
+        Rebuilds the full search memory at the most recently handled event of a delta encoded log.
+
+        Returns:
+        dict: A dictionary with "Frontier", "Visitation Table" and "Cost Table" keys in the same form as a snapshot
+        encoded log, or None if no keyframe has been handled yet.
+        """
+        if self._search_memory is None:
+            return None
+        memory = self._search_memory
+        return {
+            "Frontier": [self._thaw(item) for item, count in memory["Frontier"].items() for _ in range(count)],
+            "Visitation Table": dict(memory["Visitation Table"]),
+            "Cost Table": dict(memory["Cost Table"])
+        }
+
+    def _freeze(self, item):
+        if isinstance(item, list):
+            return tuple(self._freeze(element) for element in item)
+        return item
+
+    def _thaw(self, item):
+        if isinstance(item, tuple):
+            return [self._thaw(element) for element in item]
+        return item
+
     # ~~~ Validation Utilities ~~~
     def _validate_event(self, event: Dict) -> None:
         """
@@ -1,116 +1,277 @@
 from DiscretePlanning.planningSearchVisualization import VisualizableForwardSearch
 from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from DiscretePlanning.goalSets import GoalBitmap
 import numpy as np
-from typing import Set, Tuple, Callable
-from ast import literal_eval
+from math import sqrt
+from typing import Any, Dict, FrozenSet, Set, Tuple, Callable, Union
 
+# unit offset (dx, dy) of every action on the grid
+ACTION_OFFSETS = {
+    'right': (1, 0),
+    'left': (-1, 0),
+    'up': (0, 1),
+    'down': (0, -1),
+    'up-right': (1, 1),
+    'up-left': (-1, 1),
+    'down-right': (1, -1),
+    'down-left': (-1, -1),
+}
+
+# action leading back to the cell an action came from
+OPPOSITE_ACTIONS = {action: next(other for other, (ox, oy) in ACTION_OFFSETS.items() if (ox, oy) == (-dx, -dy))
+                    for action, (dx, dy) in ACTION_OFFSETS.items()}
+
+# fixed direction order of the last axis of the edge cost array
+DIRECTIONS = tuple(ACTION_OFFSETS)
+DIRECTION_INDEX = {action: index for index, action in enumerate(DIRECTIONS)}
+
+# 'string' states are repr((x, y)) strings, 'tuple' states are (x, y) tuples, 'index' states are packed ints y*W + x
+STATE_ENCODINGS = ('string', 'tuple', 'index')
 
 
 class HillClimber:
     def __init__(self, height_function: Callable[[int, int], float], size : Tuple[int,int],
-                 initialState: str, goalStates: Set[str],) -> None:
+                 initialState: Any, goalStates: Union[Set[Any], np.ndarray], stateEncoding: str = 'string',
+                 precomputeCosts: bool = True) -> None:
+        """
+        :param height_function: height of the terrain at grid coordinates (x, y)
+        :param size: (W, H) size of the grid
+        :param initialState: initial state, in the chosen state encoding
+        :param goalStates: set of goal states in the chosen state encoding, or a (W, H) boolean mask of the goal cells
+            indexed as [x, y] (ex. heightField >= h) that is stored as a GoalBitmap
+        :param stateEncoding: representation of the grid cells
+            Possible Values:
+                - 'string' repr((x, y)) strings, the original representation kept for existing logs (default)
+                - 'tuple' (x, y) tuples of ints
+                - 'index' ints packed as y*W + x
+        :param precomputeCosts: if True the cost of every edge is computed up front into a (W, H, 8) array so the
+            cost function is a lookup, if False edge costs are computed from the height field on demand
+            (the array holds 8 floats per cell, roughly 1 GiB for a 4k x 4k grid)
+        """
         self.height_function = height_function
         self.size = size
-        self.problem = DiscretePlanningProblem(belongingFunction = self._belongingFunction,
-                                               actionFunction = self._actionFunction,
-                                               transitionFunction = self._transitionFunction,
+        if stateEncoding not in STATE_ENCODINGS:
+            raise ValueError(f"Invalid State Encoding Provided, expected one of {STATE_ENCODINGS}")
+        self.stateEncoding = stateEncoding
+        self.heightField = self._evaluateHeightField(height_function, size)
+        self.edgeCosts = self._computeEdgeCosts(self.heightField) if precomputeCosts else None
+
+        # the action set of a cell only depends on whether each coordinate is on the low boundary, interior or
+        # high boundary of the grid, so the nine possible sets are computed once
+        representatives = [(0, 1, size[0] - 1), (0, 1, size[1] - 1)]
+        self._actionSets = [[frozenset(action for action, (dx, dy) in ACTION_OFFSETS.items()
+                                       if 0 <= representatives[0][cx] + dx < size[0] and 0 <= representatives[1][cy] + dy < size[1])
+                             for cy in range(3)] for cx in range(3)]
+        self._indexOffsets = {action: dy * size[0] + dx for action, (dx, dy) in ACTION_OFFSETS.items()}
+        # (action, dx, dy, direction index) of every action of the nine sets, in the iteration order of the set
+        self._actionSteps = [[tuple((action, *ACTION_OFFSETS[action], DIRECTION_INDEX[action]) for action in actions)
+                              for actions in column] for column in self._actionSets]
+
+        callbacks = {
+            'string': (self._belongingFunction, self._actionFunction, self._transitionFunction, self._costFunction, None),
+            'tuple': (self._tupleBelongingFunction, self._tupleActionFunction, self._tupleTransitionFunction, self._tupleCostFunction,
+                      self._tupleSuccessorFunction),
+            'index': (self._indexBelongingFunction, self._indexActionFunction, self._indexTransitionFunction, self._indexCostFunction,
+                      self._indexSuccessorFunction),
+        }
+        belongingFunction, actionFunction, transitionFunction, costFunction, successorFunction = callbacks[stateEncoding]
+        if isinstance(goalStates, np.ndarray):
+            goalStates = self.goalRegion(goalStates)
+        self.problem = DiscretePlanningProblem(belongingFunction = belongingFunction,
+                                               actionFunction = actionFunction,
+                                               transitionFunction = transitionFunction,
                                                initialState = initialState,
                                                goalStates = goalStates,
-                                               costFunction = self._costFunction)
+                                               costFunction = costFunction,
+                                               predecessorFunction = self._predecessorFunction,
+                                               successorFunction = successorFunction)
+
+    # ~~~ State Encoding ~~~
+    def encodeState(self, x: int, y: int) -> Any:
+        """
+        Returns the state of grid cell (x, y) in the climber's state encoding
+        """
+        if self.stateEncoding == 'tuple':
+            return (x, y)
+        if self.stateEncoding == 'index':
+            return y * self.size[0] + x
+        return repr((x, y))
+
+    def decodeState(self, state: Any) -> Tuple[int, int]:
+        """
+        Returns the grid coordinates (x, y) of a state in the climber's state encoding
+        """
+        if self.stateEncoding == 'tuple':
+            return state
+        if self.stateEncoding == 'index':
+            return state % self.size[0], state // self.size[0]
+        return self._parseState(state)
+
+    def compactStoreOptions(self) -> Dict:
+        """
+        Returns store_options for ForwardSearch solvers that keep parents and costs in flat arrays indexed by grid cell
+        """
+        return {'type': 'compact',
+                'stateToIndex': self._cellIndex,
+                'indexToState': self._cellState,
+                'size': self.size[0] * self.size[1]}
+
+    def _cellIndex(self, state: Any) -> int:
+        x, y = self.decodeState(state)
+        return y * self.size[0] + x
+
+    def _cellState(self, index: int) -> Any:
+        width = self.size[0]
+        return self.encodeState(index % width, index // width)
+
+    def goalRegion(self, mask: np.ndarray) -> GoalBitmap:
+        """
+        Returns the GoalBitmap of the cells selected by a (W, H) boolean mask indexed as [x, y], usable as goalStates
+        of the climber's problem without enumerating the region
+        """
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != (self.size[0], self.size[1]):
+            raise ValueError(f"Goal mask has shape {mask.shape}, expected {self.size}")
+        options = self.compactStoreOptions()
+        # transposed so cell (x, y) lands at y*W + x like the compact store index
+        return GoalBitmap(options['stateToIndex'], options['indexToState'], options['size'],
+                          mask.T.astype(np.uint8).tobytes())
+
+    def _parseState(self, state: str) -> Tuple[int, int]:
+        x, y = state[1:-1].split(',')
+        return int(x), int(y)
+
+    def _cellActions(self, x: int, y: int) -> FrozenSet[str]:
+        cx = 0 if x == 0 else (2 if x == self.size[0] - 1 else 1)
+        cy = 0 if y == 0 else (2 if y == self.size[1] - 1 else 1)
+        return self._actionSets[cx][cy]
+
+    @staticmethod
+    def _evaluateHeightField(height_function: Callable[[int, int], float], size: Tuple[int, int]) -> np.ndarray:
+        """
+        Evaluates the height function over the whole grid, returning a (W, H) array indexed as [x, y].
+        The function is called once on coordinate arrays when it supports them, and once per cell otherwise
+        """
+        xs, ys = np.meshgrid(np.arange(size[0]), np.arange(size[1]), indexing='ij')
+        try:
+            heights = np.asarray(height_function(xs, ys), dtype=np.float64)
+            if heights.shape == (size[0], size[1]):
+                return heights
+        except (TypeError, ValueError):
+            pass
+        heights = np.empty((size[0], size[1]), dtype=np.float64)
+        for x in range(size[0]):
+            for y in range(size[1]):
+                heights[x, y] = height_function(x, y)
+        return heights
+
+    @staticmethod
+    def _computeEdgeCosts(heights: np.ndarray) -> np.ndarray:
+        """
+        Returns a (W, H, 8) array holding the euclidean length of every edge over the terrain,
+        indexed as [x, y, DIRECTION_INDEX[action]], edges leaving the grid are inf
+        """
+        width, height = heights.shape
+        costs = np.full((width, height, len(DIRECTIONS)), np.inf)
+        for index, action in enumerate(DIRECTIONS):
+            dx, dy = ACTION_OFFSETS[action]
+            source = (slice(max(0, -dx), width - max(0, dx)), slice(max(0, -dy), height - max(0, dy)))
+            target = (slice(max(0, dx), width - max(0, -dx)), slice(max(0, dy), height - max(0, -dy)))
+            rise = heights[target] - heights[source]
+            costs[source + (index,)] = np.sqrt(dx * dx + dy * dy + rise * rise)
+        return costs
 
+    def _cellCost(self, x: int, y: int, action: str) -> float:
+        if self.edgeCosts is not None:
+            return float(self.edgeCosts[x, y, DIRECTION_INDEX[action]])
+        dx, dy = ACTION_OFFSETS[action]
+        rise = self.heightField[x + dx, y + dy] - self.heightField[x, y]
+        return sqrt(dx * dx + dy * dy + rise * rise)
 
+    def _cellSteps(self, x: int, y: int) -> Tuple[Tuple[str, int, int, int], ...]:
+        cx = 0 if x == 0 else (2 if x == self.size[0] - 1 else 1)
+        cy = 0 if y == 0 else (2 if y == self.size[1] - 1 else 1)
+        return self._actionSteps[cx][cy]
+
+    def _cellEdgeCosts(self, x: int, y: int) -> list:
+        """
+        Returns the costs of the eight edges leaving cell (x, y) in DIRECTIONS order, inf for edges leaving the grid
+        """
+        if self.edgeCosts is not None:
+            return self.edgeCosts[x, y].tolist()
+        return [self._cellCost(x, y, action) if action in self._cellActions(x, y) else float('inf') for action in DIRECTIONS]
+
+    def _predecessorFunction(self, state: Any) -> Set[Tuple[Any, str]]:
+        # moves are reversible, the predecessors of a cell are its neighbours using the opposite action
+        problem = self.problem
+        return {(problem.transitionFunction(state, action), OPPOSITE_ACTIONS[action])
+                for action in problem.actionFunction(state)}
+
+    # ~~~ 'string' encoding ~~~
     def _belongingFunction(self, state: str) -> bool:
-        coordinates = literal_eval(state)
-        x,y = coordinates[0],coordinates[1]
-        if type(x) is not int  or type(y) is not int:
+        try:
+            x, y = self._parseState(state)
+        except (ValueError, TypeError, AttributeError):
             return False
         if x < 0 or x > self.size[0] - 1  or y < 0 or y > self.size[1] - 1:
             return False
         return True
 
     def _actionFunction(self, state: str) -> Set[str]:
-        coordinates = literal_eval(state)
-        x, y = coordinates[0], coordinates[1]
-        actionSet = set()
-        #rectilinear transitions
-        if x == 0:
-            actionSet.add('right')
-        elif x == self.size[0] - 1:
-            actionSet.add('left')
-        else:
-            actionSet.add('left')
-            actionSet.add('right')
-
-        if y == 0:
-            actionSet.add('up')
-        elif y == self.size[1] - 1:
-            actionSet.add('down')
-        else:
-            actionSet.add('down')
-            actionSet.add('up')
-
-        #Diagonal Transitions:
-        #boundary Cases
-        if x ==0 or x==self.size[0]-1 or y ==0 or y==self.size[1]-1:
-            if (x,y) == (0,0):
-                actionSet.add('up-right')
-            elif (x,y) == (self.size[0]-1,0):
-                actionSet.add('up-left')
-            elif (x,y) == (self.size[0]-1,self.size[1]-1):
-                actionSet.add('down-left')
-            elif (x,y) == (0,self.size[1]-1):
-                actionSet.add('down-right')
-            elif x == 0:
-                actionSet.add('down-right')
-                actionSet.add('up-right')
-            elif y == 0:
-                actionSet.add('up-right')
-                actionSet.add('up-left')
-            elif x == self.size[0]-1:
-                actionSet.add('down-left')
-                actionSet.add('up-left')
-            elif y == self.size[1]-1:
-                actionSet.add('down-right')
-                actionSet.add('down-left')
-        else:
-            actionSet.add('up-right')
-            actionSet.add('up-left')
-            actionSet.add('down-right')
-            actionSet.add('down-left')
-
-        return actionSet
+        x, y = self._parseState(state)
+        return set(self._cellActions(x, y))
 
     def _transitionFunction(self, state: str, action: str) -> str:
-        coordinates = literal_eval(state)
-        x, y = coordinates[0], coordinates[1]
-        if action == 'right':
-            x +=1
-        elif action == 'left':
-            x -=1
-        elif action == 'up':
-            y +=1
-        elif action == 'down':
-            y -=1
-        elif action == 'down-right':
-            x += 1
-            y -= 1
-        elif action == 'down-left':
-            x -= 1
-            y -= 1
-        elif action == 'up-right':
-            y += 1
-            x += 1
-        elif action == 'up-left':
-            y += 1
-            x -= 1
-        return repr((x,y))
+        x, y = self._parseState(state)
+        dx, dy = ACTION_OFFSETS[action]
+        return repr((x + dx, y + dy))
 
     def _costFunction(self, state: str, action: str) -> float:
-        x,y = literal_eval(state)[0], literal_eval(state)[1]
-        coordinates = np.array([x,y,self.height_function(x,y)])
-        x_prime, y_prime = literal_eval(self._transitionFunction(state, action))[0],literal_eval(self._transitionFunction(state, action))[1]
-        coordinates_prime = np.array([x_prime, y_prime, self.height_function(x_prime, y_prime)])
-        return float(np.linalg.norm(coordinates_prime-coordinates))
+        x, y = self._parseState(state)
+        return self._cellCost(x, y, action)
+
+    # ~~~ 'tuple' encoding ~~~
+    def _tupleBelongingFunction(self, state: Tuple[int, int]) -> bool:
+        if type(state) is not tuple or len(state) != 2:
+            return False
+        x, y = state
+        if type(x) is not int or type(y) is not int:
+            return False
+        return 0 <= x < self.size[0] and 0 <= y < self.size[1]
+
+    def _tupleActionFunction(self, state: Tuple[int, int]) -> FrozenSet[str]:
+        return self._cellActions(state[0], state[1])
+
+    def _tupleTransitionFunction(self, state: Tuple[int, int], action: str) -> Tuple[int, int]:
+        dx, dy = ACTION_OFFSETS[action]
+        return (state[0] + dx, state[1] + dy)
+
+    def _tupleCostFunction(self, state: Tuple[int, int], action: str) -> float:
+        return self._cellCost(state[0], state[1], action)
+
+    def _tupleSuccessorFunction(self, state: Tuple[int, int]) -> list:
+        x, y = state
+        costs = self._cellEdgeCosts(x, y)
+        return [(action, (x + dx, y + dy), costs[index]) for action, dx, dy, index in self._cellSteps(x, y)]
+
+    # ~~~ 'index' encoding ~~~
+    def _indexBelongingFunction(self, state: int) -> bool:
+        return type(state) is int and 0 <= state < self.size[0] * self.size[1]
+
+    def _indexActionFunction(self, state: int) -> FrozenSet[str]:
+        return self._cellActions(state % self.size[0], state // self.size[0])
+
+    def _indexTransitionFunction(self, state: int, action: str) -> int:
+        return state + self._indexOffsets[action]
+
+    def _indexCostFunction(self, state: int, action: str) -> float:
+        return self._cellCost(state % self.size[0], state // self.size[0], action)
+
+    def _indexSuccessorFunction(self, state: int) -> list:
+        width = self.size[0]
+        x, y = state % width, state // width
+        costs = self._cellEdgeCosts(x, y)
+        return [(action, state + dy * width + dx, costs[index]) for action, dx, dy, index in self._cellSteps(x, y)]
 
     def solve(self, solver: VisualizableForwardSearch) -> str:
             solution = solver.generateSolution()
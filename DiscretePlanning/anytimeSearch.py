@@ -0,0 +1,222 @@
+from DiscretePlanning.planningSearch import ForwardSearch
+from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from math import inf
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+import heapq
+
+class AnytimeSolution(NamedTuple):
+    """
+    A solution published by an anytime search
+
+    solution : list of states from the initial state to a goal state
+    cost : cost of the solution
+    weight : heuristic inflation factor of the search pass that found it
+    bound : proven suboptimality bound, the solution costs at most bound times the least cost
+    elapsed : seconds since the search started
+    expansions : states expanded since the search started
+    """
+    solution: List[Any]
+    cost: float
+    weight: float
+    bound: float
+    elapsed: float
+    expansions: int
+
+
+class ForwardARAStar(ForwardSearch):
+    """
+    Anytime repairing A*, a series of weighted A* passes with decreasing weights that reuse the costs and parents of
+    the previous passes. States whose cost improves after they were expanded in a pass are held back as inconsistent
+    and requeued by the next pass, so every pass only repairs the previous search instead of starting over.
+    Every improved solution is published with a proven suboptimality bound, and the search stops once the bound
+    reaches 1 (the solution is optimal for an admissible heuristic) or a time or expansion budget is exhausted.
+
+    Attributes
+    ----------
+    heuristic : X -> R^+
+        Admissible estimate of the cost from a state to a goal state
+    initialWeight, weightStep : float
+        Weight of the first pass, and decrease of the weight between passes
+    timeBudget : float
+        Seconds after which the search stops, None for no limit
+    expansionBudget : int
+        Expansions after which the search stops, None for no limit
+    costTable, visitedTable :
+        Least costs found so far and the matching parents, kept across passes
+    solutions : list of AnytimeSolution
+        Every solution published by the last search, each costing less than the previous one
+
+    Methods
+    -------
+    iterSolutions : Runs the search and yields each improved solution as soon as it is found.
+    """
+    def __init__(self, problem: DiscretePlanningProblem, heuristic: Optional[Callable] = None, initialWeight: float = 3.0,
+                 weightStep: float = 0.5, timeBudget: Optional[float] = None, expansionBudget: Optional[int] = None,
+                 store_options: Optional[Dict] = None, metrics_options: Optional[Dict] = None) -> None:
+        """
+        :param problem: Planning problem to solve, must have a cost function
+        :param heuristic: Admissible heuristic, defaults to 0 (the passes then behave as Dijkstra's algorithm)
+        :param initialWeight: Heuristic inflation factor of the first pass, at least 1.0
+        :param weightStep: Positive decrease of the weight between passes
+        :param timeBudget: Seconds after which no further improvement is attempted, None for no limit
+        :param expansionBudget: Expansions after which no further improvement is attempted, None for no limit
+        :param store_options: Dictionary of options dictating how costs and parents are stored, see ForwardSearch
+        :param metrics_options: Dictionary of options dictating which SearchMetrics are collected, see ForwardSearch
+        """
+        super().__init__(problem, {'type': 'heapq'}, store_options, metrics_options)
+        if self.problem.costFunction is None:
+            raise ValueError("No cost function provided for given Problem")
+        if initialWeight < 1.0:
+            raise ValueError("initialWeight must be at least 1.0")
+        if weightStep <= 0.0:
+            raise ValueError("weightStep must be positive")
+        self.heuristic = heuristic
+        if self.heuristic is None:
+            self.heuristic = lambda state: 0.0
+        self.initialWeight = initialWeight
+        self.weightStep = weightStep
+        self.timeBudget = timeBudget
+        self.expansionBudget = expansionBudget
+        self.costTable = self._createCostTable()
+        self.solutions: List[AnytimeSolution] = []
+
+    def _search(self) -> Optional[List[Any]]:
+        best = None
+        for best in self.iterSolutions():
+            pass
+        return None if best is None else best.solution
+
+    def iterSolutions(self) -> Iterator[AnytimeSolution]:
+        """
+        Runs the passes and yields each solution as soon as it improves on the previous one
+        """
+        problem = self.problem
+        # the passes of one search share their tables, a new search starts over
+        self.costTable = costTable = self._createCostTable()
+        self.visitedTable = visitedTable = self._createParentTable()
+        self.frontier.clear()
+        self.expansions = self.stalePops = 0
+        self._start = perf_counter()
+        self._heuristics = {} # memoized heuristic values, frontier keys are rebuilt with the weight of every pass
+        self._closed, self._inconsistent, self._open = set(), set(), set()
+        self._goals = set() # goal states reached so far, goal sets may be predicates that can not be enumerated
+        self._generated = self._duplicates = self._peakFrontier = 0
+        self.solutions = []
+
+        root = problem.initialState
+        costTable[root] = 0.0
+        visitedTable[root] = None
+        self._open.add(root)
+        if problem.is_goal_state(root):
+            self._goals.add(root)
+        weight = self.initialWeight
+        while True:
+            self._rebuildFrontier(weight)
+            complete = self._improvePath(weight)
+            goal = self._bestGoal()
+            if goal is None:
+                break # the budget ran out before reaching a goal, or no goal is reachable
+            cost = costTable[goal]
+            bound = self._suboptimalityBound(cost, weight) if complete else \
+                (self.solutions[-1].bound if self.solutions else inf)
+            if not self.solutions or cost < self.solutions[-1].cost:
+                self._generateSolutionPath(goal, visitedTable)
+                published = AnytimeSolution(self.solution, cost, weight, bound, perf_counter() - self._start,
+                                            self.expansions)
+                self.solutions.append(published)
+                self._recordCounters()
+                yield published
+            elif bound < self.solutions[-1].bound:
+                self.solutions[-1] = self.solutions[-1]._replace(bound=bound)
+            if not complete or bound <= 1.0:
+                break
+            weight = max(1.0, weight - self.weightStep)
+            # a new pass starts, inconsistent states are requeued and every state may be expanded again
+            self._open |= self._inconsistent
+            self._inconsistent.clear()
+            self._closed.clear()
+        self._recordCounters()
+
+    def _suboptimalityBound(self, cost: float, weight: float) -> float:
+        """
+        Bound of a solution found by a completed pass, the least cost is at least the least g + h among the states that
+        can still be improved (queued or inconsistent), and at least cost / weight
+        """
+        if cost == 0.0:
+            return 1.0
+        costTable = self.costTable
+        lowerBound = min((costTable[state] + self._h(state) for state in self._open | self._inconsistent), default=inf)
+        if lowerBound <= 0.0:
+            return weight
+        return max(1.0, min(weight, cost / lowerBound))
+
+    def _h(self, state: Any) -> float:
+        heuristics = self._heuristics
+        value = heuristics.get(state)
+        if value is None:
+            value = heuristics[state] = self.heuristic(state)
+        return value
+
+    def _rebuildFrontier(self, weight: float) -> None:
+        costTable = self.costTable
+        self.frontier[:] = [(costTable[state] + weight * self._h(state), state) for state in self._open]
+        heapq.heapify(self.frontier)
+
+    def _bestGoal(self) -> Any:
+        return min(self._goals, key=self.costTable.__getitem__, default=None)
+
+    def _budgetExhausted(self) -> bool:
+        if self.expansionBudget is not None and self.expansions >= self.expansionBudget:
+            return True
+        return self.timeBudget is not None and perf_counter() - self._start >= self.timeBudget
+
+    def _improvePath(self, weight: float) -> bool:
+        """
+        Expands states in order of g + weight * h until no queued state can improve the best goal
+        :return: False if the pass was cut short by the budget
+        """
+        problem = self.problem
+        costTable, visitedTable = self.costTable, self.visitedTable
+        frontier, openStates, closed, inconsistent = self.frontier, self._open, self._closed, self._inconsistent
+        goals = self._goals
+        goalKey = min((costTable[goal] + weight * self._h(goal) for goal in goals), default=inf)
+        while frontier and frontier[0][0] < goalKey:
+            if self._budgetExhausted():
+                return False
+            key, state = self._heapPop()
+            if state not in openStates or key != costTable[state] + weight * self._h(state):
+                self.stalePops += 1
+                continue
+            openStates.discard(state)
+            closed.add(state)
+            self.expansions += 1
+            cost = costTable[state]
+            for _, successor, edgeCost in problem.get_successors(state):
+                self._generated += 1
+                newCost = cost + edgeCost
+                if successor in costTable and newCost >= costTable[successor]:
+                    self._duplicates += 1
+                    continue
+                costTable[successor] = newCost
+                visitedTable[successor] = state
+                if successor in closed:
+                    inconsistent.add(successor)
+                else:
+                    openStates.add(successor)
+                    self._heapPush((newCost + weight * self._h(successor), successor))
+                if problem.is_goal_state(successor):
+                    goals.add(successor)
+                    goalKey = min(goalKey, newCost + weight * self._h(successor))
+            if len(frontier) > self._peakFrontier:
+                self._peakFrontier = len(frontier)
+        return True
+
+    def _recordCounters(self) -> None:
+        metrics = self.metrics
+        metrics.expansions = self.expansions
+        metrics.generated = self._generated
+        metrics.duplicates = self._duplicates
+        metrics.stalePops = self.stalePops
+        metrics.peakFrontier = self._peakFrontier
+        metrics.peakVisited = len(self.visitedTable)
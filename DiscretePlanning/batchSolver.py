@@ -0,0 +1,159 @@
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from time import perf_counter
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional, Set, Tuple
+from DiscretePlanning.forwardSearchAlgorithms import ForwardDijkstraSearch
+from DiscretePlanning.goalSets import GoalBitmap
+from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from DiscretePlanning.planningSearch import DiscretePlanningSolver
+
+class QueryResult(NamedTuple):
+    """
+    Outcome of one (initialState, goalStates) query of a BatchSolver
+
+    solution : list of states from the initial state to a goal state, None if no goal is reachable
+    elapsed : seconds spent in generateSolution
+    expansions : states expanded by the solver, None if the solver does not count them
+    """
+    initialState: Any
+    goalStates: Set[Any]
+    solution: Optional[List[Any]]
+    elapsed: float
+    expansions: Optional[int]
+
+# problem built by the pool initializer, one per worker process
+_workerProblem: Optional[DiscretePlanningProblem] = None
+_workerSolverFactory: Optional[Callable] = None
+
+def _buildProblem(problemFactory: Callable[[], Any]) -> DiscretePlanningProblem:
+    built = problemFactory()
+    # environments such as HillClimber hold their problem as an attribute
+    return built if isinstance(built, DiscretePlanningProblem) else built.problem
+
+def _retarget(problem: DiscretePlanningProblem, initialState: Any, goalStates: Set[Any]) -> DiscretePlanningProblem:
+    """
+    Shallow copy of a problem with a new initial state and goal set, callbacks and the edge cost cache are shared
+    """
+    if not problem.belongingFunction(initialState):
+        raise ValueError("Initial State not in State Space")
+    if not isinstance(goalStates, GoalBitmap) and not all(problem.belongingFunction(state) for state in goalStates):
+        raise ValueError("Some Goal state is not in the State Space")
+    query = copy(problem)
+    query.initialState = initialState
+    query.goalStates = goalStates
+    query.goalPredicate = None # the query goals replace the goals of the shared problem
+    return query
+
+def _solveQuery(problem: DiscretePlanningProblem, solverFactory: Callable, initialState: Any, goalStates: Set[Any]) -> QueryResult:
+    solver = solverFactory(_retarget(problem, initialState, goalStates))
+    start = perf_counter()
+    solution = solver.generateSolution()
+    elapsed = perf_counter() - start
+    return QueryResult(initialState, goalStates, solution, elapsed, getattr(solver, 'expansions', None))
+
+def _initializeWorker(problemFactory: Callable[[], Any], solverFactory: Callable) -> None:
+    global _workerProblem, _workerSolverFactory
+    _workerProblem = _buildProblem(problemFactory)
+    _workerSolverFactory = solverFactory
+
+def _solveWorkerQuery(query: Tuple[Any, Set[Any]]) -> QueryResult:
+    return _solveQuery(_workerProblem, _workerSolverFactory, *query)
+
+def _validatePlan(problem: DiscretePlanningProblem, initialState: Any, goalStates: Set[Any],
+                  solution: Optional[List[Any]], actions: Optional[List[Any]]) -> bool:
+    if not solution:
+        return False
+    return DiscretePlanningSolver(_retarget(problem, initialState, goalStates)).validateSolution(solution, actions)
+
+def _validateWorkerPlan(plan: Tuple[Any, Set[Any], Optional[List[Any]], Optional[List[Any]]]) -> bool:
+    return _validatePlan(_workerProblem, *plan)
+
+def _normalizePlan(plan) -> Tuple[Any, Set[Any], Optional[List[Any]], Optional[List[Any]]]:
+    if isinstance(plan, QueryResult):
+        return plan.initialState, plan.goalStates, plan.solution, None
+    if len(plan) == 3:
+        return (*plan, None)
+    initialState, goalStates, solution, actions = plan
+    return initialState, goalStates, solution, actions
+
+class BatchSolver:
+    """
+    Solves many (initialState, goalStates) queries over the same state space in parallel using a process pool
+
+    ...
+
+    Attributes
+    ----------
+    problemFactory : () -> DiscretePlanningProblem
+        Picklable callable building the problem, or an environment exposing it as .problem (e.g. HillClimber).
+        It is called once per worker, so precomputation done while building (height fields, edge cost tables) and the
+        problem's edge cost cache are shared by every query the worker solves
+    solverFactory : DiscretePlanningProblem -> DiscretePlanningSolver
+        Picklable callable building a solver for a problem, e.g. a solver class
+    maxWorkers : int
+        Number of worker processes, None uses the executor default and 0 or 1 solves in the calling process
+    chunkSize : int
+        Number of queries sent to a worker at a time
+
+    Methods
+    -------
+    solve : Solves a list of queries and returns their QueryResults in the order of the queries
+
+    validate : Validates a list of plans and returns whether each is valid, in the order of the plans
+    """
+    def __init__(self, problemFactory: Callable[[], Any], solverFactory: Callable = ForwardDijkstraSearch,
+                 maxWorkers: Optional[int] = None, chunkSize: int = 1):
+        """
+        :param problemFactory: Picklable callable returning a DiscretePlanningProblem or an environment holding one as .problem
+        :param solverFactory: Picklable callable returning a solver for a problem, defaults to ForwardDijkstraSearch
+        :param maxWorkers: Number of worker processes, None for the executor default, 0 or 1 to solve serially
+        :param chunkSize: Number of queries dispatched to a worker at a time
+        """
+        if maxWorkers is not None and maxWorkers < 0:
+            raise ValueError("maxWorkers must be None or non-negative")
+        if chunkSize < 1:
+            raise ValueError("chunkSize must be positive")
+        self.problemFactory = problemFactory
+        self.solverFactory = solverFactory
+        self.maxWorkers = maxWorkers
+        self.chunkSize = chunkSize
+
+    def solve(self, queries: Iterable[Tuple[Any, Set[Any]]]) -> List[QueryResult]:
+        """
+        Solves every query, results are returned in query order regardless of which worker finished first
+
+        :param queries: Iterable of (initialState, goalStates) pairs
+        :return: List of QueryResult, one per query
+        """
+        queries = [(initialState, goalStates) for initialState, goalStates in queries]
+        if not queries:
+            return []
+        if self.maxWorkers is not None and self.maxWorkers <= 1:
+            problem = _buildProblem(self.problemFactory)
+            return [_solveQuery(problem, self.solverFactory, *query) for query in queries]
+
+        workers = self.maxWorkers if self.maxWorkers is None else min(self.maxWorkers, len(queries))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_initializeWorker,
+                                 initargs=(self.problemFactory, self.solverFactory)) as executor:
+            return list(executor.map(_solveWorkerQuery, queries, chunksize=self.chunkSize))
+
+    def validate(self, plans: Iterable[Any]) -> List[bool]:
+        """
+        Validates every plan with DiscretePlanningSolver.validateSolution, in parallel like solve. Plans without a
+        solution are invalid
+
+        :param plans: Iterable of QueryResults, (initialState, goalStates, solution) or
+            (initialState, goalStates, solution, actions) tuples, actions as taken by validateSolution
+        :return: List of bool, one per plan
+        """
+        plans = [_normalizePlan(plan) for plan in plans]
+        if not plans:
+            return []
+        if self.maxWorkers is not None and self.maxWorkers <= 1:
+            problem = _buildProblem(self.problemFactory)
+            return [_validatePlan(problem, *plan) for plan in plans]
+
+        workers = self.maxWorkers if self.maxWorkers is None else min(self.maxWorkers, len(plans))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_initializeWorker,
+                                 initargs=(self.problemFactory, self.solverFactory)) as executor:
+            return list(executor.map(_validateWorkerPlan, plans, chunksize=self.chunkSize))
@@ -0,0 +1,223 @@
+from DiscretePlanning.planningSearch import ForwardSearch
+from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from DiscretePlanning.forwardSearchAlgorithms import PRIORITY_QUEUE_TYPES
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class BidirectionalSearch(ForwardSearch):
+    """
+    Base class of searches that grow a forward frontier from the initial state and a backward frontier from every goal
+    state, using problem.predecessorFunction, until the two meet.
+
+    Attributes
+    ----------
+    visitedTable : forward visited state -> preceding state (None for the initial state)
+    successorTable : backward visited state -> next state towards a goal (None for goal states)
+    backwardFrontier : frontier of the backward search, same queue type as frontier
+    meetingState : state where the returned path joins the two searches
+    expansions : number of states expanded by both searches
+    metrics : SearchMetrics of both searches, peakFrontier and peakVisited add up the entries of the two directions
+    """
+    def __init__(self, problem: DiscretePlanningProblem, queue_options: Optional[Dict] = None,
+                 store_options: Optional[Dict] = None, metrics_options: Optional[Dict] = None) -> None:
+        if problem.predecessorFunction is None:
+            raise ValueError("Bidirectional search requires a predecessor function for given Problem")
+        if problem.goalStates is None or problem.goalPredicate is not None:
+            raise ValueError("Bidirectional search requires goals given as an enumerable goalStates collection")
+        super().__init__(problem, queue_options, store_options, metrics_options)
+        self.backwardFrontier, backwardPush, backwardPop = self._createFrontier(self.queue_type)
+        if backwardPush is not None:
+            self._backwardPush = backwardPush
+            self._backwardPop = backwardPop
+        self.successorTable = self._createParentTable()
+        self.meetingState = None
+        self.expansions = 0
+
+    def _resetSearch(self) -> None:
+        super()._resetSearch()
+        self.backwardFrontier, backwardPush, backwardPop = self._createFrontier(self.queue_type)
+        if backwardPush is not None:
+            self._backwardPush = backwardPush
+            self._backwardPop = backwardPop
+        self.successorTable = self._createParentTable()
+        self.meetingState = None
+        self._generated = self._duplicates = 0
+
+    def _recordMetrics(self, generated: int, duplicates: int, peakFrontier: int, pops: int) -> None:
+        super()._recordMetrics(generated, duplicates, peakFrontier, pops)
+        metrics = self.metrics
+        metrics.pushes += self._unpoppedPushes(self.backwardFrontier)
+        metrics.peakFrontier = max(peakFrontier, len(self.frontier) + len(self.backwardFrontier))
+        metrics.peakVisited = len(self.visitedTable) + len(self.successorTable)
+
+    def _finish(self, meetingState: Any, peakFrontier: int) -> Optional[List[Any]]:
+        """
+        Records the metrics of the search and joins the paths through the meeting state, None if the searches did not meet
+        """
+        # every popped entry was either expanded or skipped as stale
+        self._recordMetrics(self._generated, self._duplicates, peakFrontier, self.expansions + self.stalePops)
+        if meetingState is None:
+            return None
+        return self._joinPaths(meetingState)
+
+    def _successors(self, state: Any) -> Iterator[Any]:
+        return (successor for _, successor, _ in self.problem.get_successors(state, False))
+
+    def _predecessors(self, state: Any) -> Iterator[Any]:
+        # predecessorFunction gives (predecessor, action) pairs, see DiscretePlanningProblem.get_prev_states
+        return (pair[0] for pair in self.problem.predecessorFunction(state))
+
+    def _joinPaths(self, meetingState: Any) -> List[Any]:
+        self.meetingState = meetingState
+        self._generateSolutionPath(meetingState, self.visitedTable)
+        state = self.successorTable[meetingState]
+        while state is not None:
+            self.solution.append(state)
+            state = self.successorTable[state]
+        return self.solution
+
+
+class BidirectionalBFS(BidirectionalSearch):
+    """
+    Bidirectional breadth first search, returns a solution with the fewest transitions.
+    Whole layers of the smaller frontier are expanded at a time and the best meeting point of a layer is kept.
+    """
+    def __init__(self, problem: DiscretePlanningProblem, store_options: Optional[Dict] = None,
+                 metrics_options: Optional[Dict] = None) -> None:
+        super().__init__(problem, {'type': 'deque'}, store_options, metrics_options)
+
+    def _search(self) -> Optional[List[Any]]:
+        problem = self.problem
+        forwardDepth = {problem.initialState: 0}
+        backwardDepth = {}
+        self.visitedTable[problem.initialState] = None
+        self.frontier.append(problem.initialState)
+        for goal in problem.goalStates:
+            backwardDepth[goal] = 0
+            self.successorTable[goal] = None
+            self.backwardFrontier.append(goal)
+        if problem.initialState in backwardDepth:
+            return self._finish(problem.initialState, len(self.frontier) + len(self.backwardFrontier))
+
+        peakFrontier = 0
+        while self.frontier and self.backwardFrontier:
+            peakFrontier = max(peakFrontier, len(self.frontier) + len(self.backwardFrontier))
+            if len(self.frontier) <= len(self.backwardFrontier):
+                meetingState = self._expandLayer(self.frontier, self.visitedTable, forwardDepth, backwardDepth,
+                                                 self._successors)
+            else:
+                meetingState = self._expandLayer(self.backwardFrontier, self.successorTable, backwardDepth,
+                                                 forwardDepth, self._predecessors)
+            if meetingState is not None:
+                return self._finish(meetingState, peakFrontier)
+        return self._finish(None, peakFrontier)
+
+    def _expandLayer(self, frontier, table, depth: Dict, otherDepth: Dict, neighbours) -> Any:
+        """
+        Expands every state of the current layer of one frontier
+        :return: the meeting state of the shortest path through this layer, None if the searches did not meet
+        """
+        bestLength, meetingState = None, None
+        for _ in range(len(frontier)):
+            state = frontier.popleft()
+            self.expansions += 1
+            for neighbour in neighbours(state):
+                self._generated += 1
+                if neighbour in table:
+                    self._duplicates += 1
+                    continue
+                table[neighbour] = state
+                depth[neighbour] = depth[state] + 1
+                frontier.append(neighbour)
+                if neighbour in otherDepth:
+                    length = depth[neighbour] + otherDepth[neighbour]
+                    if bestLength is None or length < bestLength:
+                        bestLength, meetingState = length, neighbour
+        return meetingState
+
+
+class BidirectionalDijkstraSearch(BidirectionalSearch):
+    """
+    Bidirectional Dijkstra search, returns a least cost solution.
+    The frontier with fewer entries is expanded one state at a time, every relaxation that reaches a state known to
+    the other search updates the best path cost mu, and the search stops once the sum of both frontier minima
+    reaches mu.
+    """
+    def __init__(self, problem: DiscretePlanningProblem, store_options: Optional[Dict] = None,
+                 queue_options: Optional[Dict] = None, metrics_options: Optional[Dict] = None) -> None:
+        queueOptions = {'type': 'heapq'}
+        if queue_options is not None:
+            queueOptions.update(queue_options)
+        if queueOptions['type'] not in PRIORITY_QUEUE_TYPES:
+            raise ValueError(f"{type(self).__name__} requires a priority queue type, one of {PRIORITY_QUEUE_TYPES}")
+        super().__init__(problem, queueOptions, store_options, metrics_options)
+        if self.problem.costFunction is None:
+            raise ValueError("No cost function provided for given Problem")
+        self.costTable = self._createCostTable()
+        self.backwardCostTable = self._createCostTable()
+        self.solutionCost = None
+
+    def _resetSearch(self) -> None:
+        super()._resetSearch()
+        self.costTable = self._createCostTable()
+        self.backwardCostTable = self._createCostTable()
+        self.solutionCost = None
+
+    def _search(self) -> Optional[List[Any]]:
+        problem = self.problem
+        costTable, backwardCostTable = self.costTable, self.backwardCostTable
+        costTable[problem.initialState] = 0.0
+        self.visitedTable[problem.initialState] = None
+        self._heapPush((0.0, problem.initialState))
+        for goal in problem.goalStates:
+            backwardCostTable[goal] = 0.0
+            self.successorTable[goal] = None
+            self._backwardPush((0.0, goal))
+
+        bestCost, meetingState = float('inf'), None
+        if problem.initialState in backwardCostTable:
+            bestCost, meetingState = 0.0, problem.initialState
+
+        peakFrontier = 0
+        while self.frontier and self.backwardFrontier:
+            peakFrontier = max(peakFrontier, len(self.frontier) + len(self.backwardFrontier))
+            if self.frontier[0][0] + self.backwardFrontier[0][0] >= bestCost:
+                break
+            if len(self.frontier) <= len(self.backwardFrontier):
+                cost, state = self._heapPop()
+                if cost > costTable[state]: # stale heapq entry
+                    self.stalePops += 1
+                    continue
+                self.expansions += 1
+                for _, successor, edgeCost in problem.get_successors(state):
+                    self._generated += 1
+                    newCost = cost + edgeCost
+                    if successor in costTable:
+                        self._duplicates += 1
+                    if successor not in costTable or newCost < costTable[successor]:
+                        costTable[successor] = newCost
+                        self.visitedTable[successor] = state
+                        self._heapPush((newCost, successor))
+                        if successor in backwardCostTable and newCost + backwardCostTable[successor] < bestCost:
+                            bestCost, meetingState = newCost + backwardCostTable[successor], successor
+            else:
+                cost, state = self._backwardPop()
+                if cost > backwardCostTable[state]: # stale heapq entry
+                    self.stalePops += 1
+                    continue
+                self.expansions += 1
+                for predecessor, action in problem.predecessorFunction(state):
+                    self._generated += 1
+                    newCost = cost + problem.get_edge_cost(predecessor, action)
+                    if predecessor in backwardCostTable:
+                        self._duplicates += 1
+                    if predecessor not in backwardCostTable or newCost < backwardCostTable[predecessor]:
+                        backwardCostTable[predecessor] = newCost
+                        self.successorTable[predecessor] = state
+                        self._backwardPush((newCost, predecessor))
+                        if predecessor in costTable and newCost + costTable[predecessor] < bestCost:
+                            bestCost, meetingState = newCost + costTable[predecessor], predecessor
+
+        if meetingState is not None:
+            self.solutionCost = bestCost
+        return self._finish(meetingState, peakFrontier)
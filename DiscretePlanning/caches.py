@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from typing import Any, Dict, Hashable
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Bounded mapping with least recently used eviction and hit/miss statistics
+
+    Attributes
+    ----------
+    maxSize : int
+        Maximum number of entries kept, a size of 0 disables caching
+    hits, misses, evictions : int
+        Lookup and eviction counters since creation or the last clear()
+    """
+    def __init__(self, maxSize: int) -> None:
+        if maxSize < 0:
+            raise ValueError("Cache size must be non-negative")
+        self.maxSize = maxSize
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value of a key and marks it as most recently used, or default on a miss
+        """
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value of a key without marking it as used or counting the lookup, or default on a miss
+        """
+        return self._data.get(key, default)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Caches a value, evicting the least recently used entry when the cache is full
+        """
+        if self.maxSize == 0:
+            return
+        data = self._data
+        if key in data:
+            data.move_to_end(key)
+        data[key] = value
+        if len(data) > self.maxSize:
+            data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Drops every entry and resets the statistics
+        """
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._data), "maxSize": self.maxSize, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,175 +1,334 @@
 from DiscretePlanning.planningSearchVisualization import VisualizableForwardSearch
 from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from DiscretePlanning.shortestPathTree import ShortestPathTree
 from pathlib import Path
-from typing import Any, Callable
-import heapq
+from typing import Any, Callable, Dict, Optional
+
+PRIORITY_QUEUE_TYPES = ('heapq', 'indexed')
+
+# Every algorithm below runs instrumented when given a logFile and without any logging work when logFile is None,
+# log entries are only built inside "if self.instrumented" blocks so both paths share the same search logic
 
 class ForwardBFS(VisualizableForwardSearch):
-    def __init__(self, problem : DiscretePlanningProblem, logFile : Path, createParent: bool = False) -> None:
+    usesEdgeCosts = False
+
+    def __init__(self, problem : DiscretePlanningProblem, logFile : Optional[Path] = None, createParent: bool = False,
+                 log_options: Optional[Dict] = None, store_options: Optional[Dict] = None,
+                 metrics_options: Optional[Dict] = None) -> None:
         queueOptions = {'type' : 'deque'}
-        super().__init__(problem, logFile, queueOptions, createParent)
+        super().__init__(problem, logFile, queueOptions, createParent, log_options, store_options, metrics_options)
 
-    def addToFrontier(self, state: Any, currentState: Any = None, action: Any = None ):
+    def addToFrontier(self, state: Any, currentState: Any = None, action: Any = None, edgeCost: Optional[float] = None):
         self.frontier.append(state)
+        if self.instrumented:
+            self._recordPush(state)
 
     def expandFrontier(self) -> Any:
-        return self.frontier.popleft() #FIFO behaviour enabled
+        state = self.frontier.popleft() #FIFO behaviour enabled
+        if self.instrumented:
+            self._recordPop(state)
+        return state
 
 class ForwardDFS(VisualizableForwardSearch):
-    def __init__(self, problem : DiscretePlanningProblem, logFile : Path, createParent: bool = False) -> None:
+    usesEdgeCosts = False
+
+    def __init__(self, problem : DiscretePlanningProblem, logFile : Optional[Path] = None, createParent: bool = False,
+                 log_options: Optional[Dict] = None, store_options: Optional[Dict] = None,
+                 metrics_options: Optional[Dict] = None) -> None:
         queueOptions = {'type' : 'deque'}
-        super().__init__(problem, logFile, queueOptions, createParent)
+        super().__init__(problem, logFile, queueOptions, createParent, log_options, store_options, metrics_options)
 
-    def addToFrontier(self, state: Any, currentState: Any = None, action: Any = None):
+    def addToFrontier(self, state: Any, currentState: Any = None, action: Any = None, edgeCost: Optional[float] = None):
         self.frontier.append(state)
+        if self.instrumented:
+            self._recordPush(state)
 
     def expandFrontier(self) -> Any:
-        return self.frontier.pop() #LIFO behaviour enabled
+        state = self.frontier.pop() #LIFO behaviour enabled
+        if self.instrumented:
+            self._recordPop(state)
+        return state
 
 class ForwardDijkstraSearch(VisualizableForwardSearch):
-    def __init__(self, problem : DiscretePlanningProblem, logFile : Path, createParent: bool = False) -> None:
+    def __init__(self, problem : DiscretePlanningProblem, logFile : Optional[Path] = None, createParent: bool = False,
+                 log_options: Optional[Dict] = None, store_options: Optional[Dict] = None,
+                 queue_options: Optional[Dict] = None, metrics_options: Optional[Dict] = None) -> None:
         queueOptions = {'type': 'heapq'}
-        super().__init__(problem, logFile, queueOptions, createParent)
+        if queue_options is not None:
+            queueOptions.update(queue_options)
+        if queueOptions['type'] not in PRIORITY_QUEUE_TYPES:
+            raise ValueError(f"{type(self).__name__} requires a priority queue type, one of {PRIORITY_QUEUE_TYPES}")
+        super().__init__(problem, logFile, queueOptions, createParent, log_options, store_options, metrics_options)
         if self.problem.costFunction is None:
             raise ValueError("No cost function provided for given Problem")
-        self.costTable = {self.problem.initialState: 0.0}
+        self.costTable = self._createCostTable()
+        self.costTable[self.problem.initialState] = 0.0
 
-    def addToFrontier(self, state: Any, currentState: Any = None, action: Any = None):
+    def _resetSearch(self) -> None:
+        super()._resetSearch()
+        self.costTable = self._createCostTable()
+        self.costTable[self.problem.initialState] = 0.0
+
+    def addToFrontier(self, state: Any, currentState: Any = None, action: Any = None, edgeCost: Optional[float] = None):
         # Compute Cost
         if currentState is not None and action is not None:
-            cost = self.costTable[currentState] + self.problem.get_cost(currentState, action)
+            edge_cost = self.problem.get_edge_cost(currentState, action) if edgeCost is None else edgeCost
+            cost = self.costTable[currentState] + edge_cost
 
-            self.logger.logState("State being added recognized as a successor, computing cost",
-                                 {"Frontier": str(self.frontier), "Visitation Table": self.visitedTable,
-                                  "Considered State": state, "Predecessor": currentState, "Action": action,
-                                  "Cost Table": self.costTable, "Cost": cost, "Edge Cost": self.problem.get_cost(currentState, action)})
+            if self.instrumented:
+                self._logEvent("State being added recognized as a successor, computing cost",
+                               {"Considered State": state, "Predecessor": currentState, "Action": action,
+                                "Cost": cost, "Edge Cost": edge_cost})
 
         else:
             cost  = self.costTable[state] #this branch should only execute for initial state
             if cost == 0.0: # this if statement is unnecessary but i included it just to guard against weird errors
-                heapq.heappush(self.frontier, (cost, state))
-            self.logger.logState("State being added recognized as initial state, deferring to cost table",
-                                 {"Frontier": str(self.frontier), "Visitation Table": self.visitedTable
-                                     , "Considered State": state, "Cost Table": self.costTable, "Cost" : cost})
-        self.logger.logWrite(options={"createParent": self.parentOption})
+                replaced = self._heapPush((cost, state))
+                if self.instrumented:
+                    self._recordPush((cost, state), replaced)
+            if self.instrumented:
+                self._logEvent("State being added recognized as initial state, deferring to cost table",
+                               {"Considered State": state, "Cost" : cost})
+        if self.instrumented:
+            self.logger.logWrite(options={"createParent": self.parentOption})
         # Determine how to modify Frontier
         if state not in self.costTable or cost < self.costTable[state]:
             self.costTable[state] = cost #add or update cost table
-            heapq.heappush(self.frontier, (cost, state)) #reorder priority Queue
+            replaced = self._heapPush((cost, state)) #reorder priority Queue
             self.visitedTable[state] = currentState
-            self.logger.logState("State being added either does not have associated cost or a better cost was found, updating memory",
-                                 {"Frontier": str(self.frontier), "Visitation Table": self.visitedTable,
-                                  "Considered State": state, "Cost Table": self.costTable, "Cost" : cost})
-            self.logger.logWrite(options={"createParent": self.parentOption})
+            if self.instrumented:
+                self._recordCost(state, cost)
+                self._recordPush((cost, state), replaced)
+                self._recordParent(state, currentState)
+                self._logEvent("State being added either does not have associated cost or a better cost was found, updating memory",
+                               {"Considered State": state, "Cost" : cost})
+                self.logger.logWrite(options={"createParent": self.parentOption})
         return
 
     def expandFrontier(self) -> Any:
-        return heapq.heappop(self.frontier)[1]  # Pop the state with the lowest cost
+        item = self._heapPop()  # Pop the state with the lowest cost
+        if item[0] > self.costTable[item[1]]:
+            self.stalePops += 1 # a cheaper entry of the state was pushed later, and already popped
+        if self.instrumented:
+            self._recordPop(item)
+        return item[1]
 
-    def resolveDuplicateSuccessor(self, state: Any, currentState: Any = None, action: Any = None):
+    def resolveDuplicateSuccessor(self, state: Any, currentState: Any = None, action: Any = None,
+                                  edgeCost: Optional[float] = None):
         # We have to potentially reorder based on cost here
-        new_cost = self.costTable[currentState] + self.problem.get_cost(currentState, action)
-        self.logger.logState("New path to state found, computing new cost",
-                             {"Frontier": str(self.frontier), "Visitation Table": self.visitedTable,
-                                  "Duplicate State": state, "Predecessor": currentState, "Action": action,
-                                  "Cost Table": self.costTable, "New Cost": new_cost,
-                              "Edge Cost": self.problem.get_cost(currentState, action)})
-        self.logger.logWrite(options={"createParent": self.parentOption})
+        edge_cost = self.problem.get_edge_cost(currentState, action) if edgeCost is None else edgeCost
+        new_cost = self.costTable[currentState] + edge_cost
+        if self.instrumented:
+            self._logEvent("New path to state found, computing new cost",
+                           {"Duplicate State": state, "Predecessor": currentState, "Action": action,
+                            "New Cost": new_cost, "Edge Cost": edge_cost})
+            self.logger.logWrite(options={"createParent": self.parentOption})
         # if computed cost is better we have to update cost table & reorder queue
         if new_cost < self.costTable[state]:
             self.costTable[state] = new_cost
-            heapq.heappush(self.frontier, (new_cost, state))
+            replaced = self._heapPush((new_cost, state))
             self.visitedTable[state] = currentState  # Update the visited table with the predecessor
-            self.logger.logState("New cost better than old cost, updating memory",
-                                 {"Frontier": str(self.frontier), "Visitation Table": self.visitedTable,
-                                  "Duplicate State": state, "Cost Table": self.costTable, "New Cost" : new_cost,
-                                  "Old Cost": self.costTable[state]})
-            self.logger.logWrite(options={"createParent": self.parentOption})
+            if self.instrumented:
+                self._recordCost(state, new_cost)
+                self._recordPush((new_cost, state), replaced)
+                self._recordParent(state, currentState)
+                self._logEvent("New cost better than old cost, updating memory",
+                               {"Duplicate State": state, "New Cost" : new_cost, "Old Cost": self.costTable[state]})
+                self.logger.logWrite(options={"createParent": self.parentOption})
         return
 
+    def generateShortestPathTree(self, costBound: Optional[float] = None) -> ShortestPathTree:
+        """
+        Runs the search without stopping at goal states, until the frontier is exhausted or every state within the
+        cost bound is settled
+        :param costBound: States with a least cost above the bound are left out of the tree, None searches exhaustively
+        :return: ShortestPathTree holding the cost and visited tables of the search, the search counters are exposed
+            as self.metrics
+        """
+        return self._measured(self._shortestPathTree, costBound)
+
+    def _shortestPathTree(self, costBound: Optional[float]) -> ShortestPathTree:
+        problem = self.problem
+        visitedTable = self.visitedTable
+        costTable = self.costTable
+        self.addToFrontier(problem.initialState)
+        visitedTable[problem.initialState] = None
+        generated = duplicates = peakFrontier = pops = 0
+        while self.frontier:
+            if len(self.frontier) > peakFrontier:
+                peakFrontier = len(self.frontier)
+            cost, currentState = self._heapPop()
+            pops += 1
+            if cost > costTable[currentState]:
+                self.stalePops += 1
+                continue # stale heapq entry, the state was settled at a lower cost
+            if costBound is not None and cost > costBound:
+                break
+            self.expansions += 1
+            for action, successor, edgeCost in problem.get_successors(currentState):
+                generated += 1
+                if successor not in visitedTable:
+                    visitedTable[successor] = currentState
+                    self.addToFrontier(successor, currentState, action, edgeCost)
+                else:
+                    duplicates += 1
+                    self.resolveDuplicateSuccessor(successor, currentState, action, edgeCost)
+        self._recordMetrics(generated, duplicates, peakFrontier, pops)
+
+        if costBound is not None:
+            # states still on the frontier hold tentative costs, only those above the bound can be inexact
+            for state in [state for state, cost in costTable.items() if cost > costBound]:
+                del costTable[state]
+                del visitedTable[state]
+        if self.instrumented:
+            self.logger.logWrite(options={"createParent": self.parentOption})
+            self.logger.closeLog()
+            self.logger._reset()
+        return ShortestPathTree(problem.initialState, costTable, visitedTable, costBound)
+
 class ForwardAStar(VisualizableForwardSearch):
-    def __init__(self, problem : DiscretePlanningProblem, logFile : Path, heuristic : Callable, createParent: bool = False) -> None:
+    def __init__(self, problem : DiscretePlanningProblem, logFile : Optional[Path] = None, heuristic : Callable = None, createParent: bool = False,
+                 log_options: Optional[Dict] = None, store_options: Optional[Dict] = None,
+                 queue_options: Optional[Dict] = None, metrics_options: Optional[Dict] = None) -> None:
         queueOptions = {'type': 'heapq'}
-        super().__init__(problem, logFile, queueOptions, createParent)
+        if queue_options is not None:
+            queueOptions.update(queue_options)
+        if queueOptions['type'] not in PRIORITY_QUEUE_TYPES:
+            raise ValueError(f"{type(self).__name__} requires a priority queue type, one of {PRIORITY_QUEUE_TYPES}")
+        super().__init__(problem, logFile, queueOptions, createParent, log_options, store_options, metrics_options)
         if self.problem.costFunction is None:
             raise ValueError("No cost function provided for given Problem")
-        self.costTable = {self.problem.initialState: 0.0}
+        self.costTable = self._createCostTable()
+        self.costTable[self.problem.initialState] = 0.0
         self.heuristic = heuristic
         if self.heuristic is None:
             self.heuristic  = lambda state: 0.0 # Default to Djikstra
+        self._improved = set() # states pushed again with a lower cost, see expandFrontier
+
+    def _resetSearch(self) -> None:
+        super()._resetSearch()
+        self.costTable = self._createCostTable()
+        self.costTable[self.problem.initialState] = 0.0
+        self._improved = set()
 
-    def addToFrontier(self, state: Any, currentState: Any = None, action: Any = None):
+    def addToFrontier(self, state: Any, currentState: Any = None, action: Any = None, edgeCost: Optional[float] = None):
         # Compute Cost
-        printDictionary = {"Visitation Table": self.visitedTable, "Considered State": state, "Predecessor": currentState, "Action": action,
-                           "Cost Table": self.costTable}
+        if self.instrumented:
+            printDictionary = {"Considered State": state, "Predecessor": currentState, "Action": action}
         if currentState is not None and action is not None:
-            c_cost = self.costTable[currentState] + self.problem.get_cost(currentState, action)
+            edge_cost = self.problem.get_edge_cost(currentState, action) if edgeCost is None else edgeCost
+            c_cost = self.costTable[currentState] + edge_cost
 
-            printDictionary["C-Cost"] = c_cost
-            printDictionary["Edge Cost"] = self.problem.get_cost(currentState, action)
+            if self.instrumented:
+                printDictionary["C-Cost"] = c_cost
+                printDictionary["Edge Cost"] = edge_cost
 
-            self.logger.logState("State being added recognized as a successor, computing cost", printDictionary)
-            self.logger.logWrite(options={"createParent": self.parentOption})
+                self._logEvent("State being added recognized as a successor, computing cost", printDictionary)
+                self.logger.logWrite(options={"createParent": self.parentOption})
 
-            del printDictionary["C-Cost"]
-            del printDictionary["Edge Cost"]
+                del printDictionary["C-Cost"]
+                del printDictionary["Edge Cost"]
 
         else:
             c_cost  = self.costTable[state] #this branch should only execute for initial state
-            printDictionary["C-Cost"] = c_cost
 
-            self.logger.logState("State being added recognized as initial state, deferring to cost table",printDictionary)
-            self.logger.logWrite(options={"createParent": self.parentOption})
+            if self.instrumented:
+                printDictionary["C-Cost"] = c_cost
 
-            del printDictionary["C-Cost"]
+                self._logEvent("State being added recognized as initial state, deferring to cost table",printDictionary)
+                self.logger.logWrite(options={"createParent": self.parentOption})
+
+                del printDictionary["C-Cost"]
 
         g_cost = self.heuristic(state)
         total_cost = g_cost + c_cost
-        printDictionary["C-Cost"] = c_cost
-        printDictionary["G-Cost"] = g_cost
-        printDictionary["Total Cost"] = total_cost
-        self.logger.logState("Computed Heuristic for State under consideration", printDictionary)
+        if self.instrumented:
+            printDictionary["C-Cost"] = c_cost
+            printDictionary["G-Cost"] = g_cost
+            printDictionary["Total Cost"] = total_cost
+            self._logEvent("Computed Heuristic for State under consideration", printDictionary)
 
         # Determine how to modify Frontier
         if c_cost == 0.0:  # this if statement is unnecessary but i included it just to guard against weird errors
-            heapq.heappush(self.frontier, (total_cost, state))
-            self.logger.logWrite(options={"createParent": self.parentOption})
+            replaced = self._heapPush((total_cost, state))
+            if self.instrumented:
+                self._recordPush((total_cost, state), replaced)
+                self.logger.logWrite(options={"createParent": self.parentOption})
 
         if state not in self.costTable or c_cost < self.costTable[state]:
             self.costTable[state] = c_cost #add or update cost table
-            heapq.heappush(self.frontier, (total_cost, state)) #reorder priority Queue
+            replaced = self._heapPush((total_cost, state)) #reorder priority Queue
             self.visitedTable[state] = currentState
-            self.logger.logState("State being added either does not have associated cost or a better cost was found, updating memory", printDictionary)
-            self.logger.logWrite(options={"createParent": self.parentOption})
+            if self.instrumented:
+                self._recordCost(state, c_cost)
+                self._recordPush((total_cost, state), replaced)
+                self._recordParent(state, currentState)
+                self._logEvent("State being added either does not have associated cost or a better cost was found, updating memory", printDictionary)
+                self.logger.logWrite(options={"createParent": self.parentOption})
         return
 
     def expandFrontier(self) -> Any:
-        return heapq.heappop(self.frontier)[1]  # Pop the state with the lowest cost
+        item = self._heapPop()  # Pop the state with the lowest cost
+        state = item[1]
+        # only states whose cost was lowered can have superseded entries, the heuristic is recomputed for those alone
+        if state in self._improved and item[0] > self.costTable[state] + self.heuristic(state):
+            self.stalePops += 1
+        if self.instrumented:
+            self._recordPop(item)
+        return state
 
-    def resolveDuplicateSuccessor(self, state: Any, currentState: Any = None, action: Any = None):
-        printDictionary = {"Visitation Table": self.visitedTable, "Duplicate State": state, "Predecessor": currentState, "Action": action,
-                           "Cost Table": self.costTable}
+    def resolveDuplicateSuccessor(self, state: Any, currentState: Any = None, action: Any = None,
+                                  edgeCost: Optional[float] = None):
         # We have to potentially reorder based on cost here
-        new_cost = self.costTable[currentState] + self.problem.get_cost(currentState, action)
-        printDictionary["New C-Cost"] = new_cost
-        printDictionary["Edge Cost"] = self.problem.get_cost(currentState, action)
-        self.logger.logState("New path to state found, computing new cost",printDictionary)
-        self.logger.logWrite(options={"createParent": self.parentOption})
-        del printDictionary["Edge Cost"]
+        edge_cost = self.problem.get_edge_cost(currentState, action) if edgeCost is None else edgeCost
+        new_cost = self.costTable[currentState] + edge_cost
+        if self.instrumented:
+            printDictionary = {"Duplicate State": state, "Predecessor": currentState, "Action": action,
+                               "New C-Cost": new_cost, "Edge Cost": edge_cost}
+            self._logEvent("New path to state found, computing new cost",printDictionary)
+            self.logger.logWrite(options={"createParent": self.parentOption})
+            del printDictionary["Edge Cost"]
 
         # if computed cost is better we have to update cost table & reorder queue
         if new_cost < self.costTable[state]:
             self.costTable[state] = new_cost
+            self._improved.add(state)
             g_cost = self.heuristic(state)
             total_new_cost = g_cost + new_cost
 
-            heapq.heappush(self.frontier, (total_new_cost, state))
+            replaced = self._heapPush((total_new_cost, state))
             self.visitedTable[state] = currentState  # Update the visited table with the predecessor
 
-            printDictionary["G-Cost"] = g_cost
-            printDictionary["New Total Cost"] = total_new_cost
-            printDictionary["Old C-Cost"] = self.costTable[state]
+            if self.instrumented:
+                self._recordCost(state, new_cost)
+                self._recordPush((total_new_cost, state), replaced)
+                self._recordParent(state, currentState)
 
-            self.logger.logState("New cost better than old cost, updating memory",printDictionary)
-            self.logger.logWrite(options={"createParent": self.parentOption})
+                printDictionary["G-Cost"] = g_cost
+                printDictionary["New Total Cost"] = total_new_cost
+                printDictionary["Old C-Cost"] = self.costTable[state]
+
+                self._logEvent("New cost better than old cost, updating memory",printDictionary)
+                self.logger.logWrite(options={"createParent": self.parentOption})
         return
+
+class ForwardWeightedAStar(ForwardAStar):
+    """
+    Weighted A*, orders the frontier by f = g + weight * h. With an admissible heuristic the returned solution costs at
+    most weight times the least cost, and larger weights expand fewer states on the way to a goal.
+    """
+    def __init__(self, problem : DiscretePlanningProblem, logFile : Optional[Path] = None, heuristic : Callable = None,
+                 weight: float = 1.5, createParent: bool = False, log_options: Optional[Dict] = None,
+                 store_options: Optional[Dict] = None, queue_options: Optional[Dict] = None,
+                 metrics_options: Optional[Dict] = None) -> None:
+        """
+        :param weight: Inflation factor of the heuristic, at least 1.0, 1.0 is plain A*
+        see ForwardAStar for the other parameters
+        """
+        if weight < 1.0:
+            raise ValueError("weight must be at least 1.0")
+        super().__init__(problem, logFile, heuristic, createParent, log_options, store_options, queue_options,
+                         metrics_options)
+        self.weight = weight
+        baseHeuristic = self.heuristic
+        self.heuristic = lambda state: weight * baseHeuristic(state)
@@ -0,0 +1,85 @@
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+# maps every byte to a 0/1 flag
+_FLAGS = bytes([0] + [1] * 255)
+
+class GoalBitmap:
+    """
+    Dense goal region stored as one byte per state over a bijection between the state space and 0..size-1, as used by
+    the 'compact' store option. Membership tests are O(1) and the region is never materialized as a set of states.
+    Usable wherever a goal set is expected (goalStates), and callable as a goal predicate.
+
+    ...
+
+    Attributes
+    ----------
+    stateToIndex : X -> int
+        Bijection from the state space to 0..size-1, only defined on states of the state space
+    indexToState : int -> X
+        Inverse of stateToIndex, used to enumerate the goal states
+    size : int
+        Number of states of the state space
+    bits : bytearray
+        bits[stateToIndex(state)] is non zero if state is a goal state
+    """
+    def __init__(self, stateToIndex: Callable[[Any], int], indexToState: Callable[[int], Any], size: int,
+                 bits: Optional[Iterable[int]] = None) -> None:
+        """
+        :param stateToIndex: Bijection from the state space to 0..size-1
+        :param indexToState: Inverse of stateToIndex
+        :param size: Number of states of the state space
+        :param bits: size flags (bytes, bytearray or iterable of ints / bools) marking goal indices, None for no goals
+        """
+        self.stateToIndex = stateToIndex
+        self.indexToState = indexToState
+        self.size = size
+        self.bits = bytearray(size) if bits is None else bytearray(bits).translate(_FLAGS)
+        if len(self.bits) != size:
+            raise ValueError(f"Goal bitmap holds {len(self.bits)} flags, expected {size}")
+        self._count = size - self.bits.count(0)
+
+    @classmethod
+    def fromStates(cls, states: Iterable[Any], stateToIndex: Callable[[Any], int], indexToState: Callable[[int], Any],
+                   size: int) -> 'GoalBitmap':
+        """Builds the bitmap of an explicit collection of goal states"""
+        bitmap = cls(stateToIndex, indexToState, size)
+        for state in states:
+            bitmap.add(state)
+        return bitmap
+
+    @classmethod
+    def fromPredicate(cls, predicate: Callable[[Any], bool], stateToIndex: Callable[[Any], int],
+                      indexToState: Callable[[int], Any], size: int) -> 'GoalBitmap':
+        """Precomputes a goal predicate over the whole state space"""
+        return cls(stateToIndex, indexToState, size, (1 if predicate(indexToState(index)) else 0 for index in range(size)))
+
+    def add(self, state: Any) -> None:
+        index = self.stateToIndex(state)
+        if not 0 <= index < self.size:
+            raise ValueError(f"State {state!r} is outside of the goal bitmap")
+        if not self.bits[index]:
+            self.bits[index] = 1
+            self._count += 1
+
+    def __contains__(self, state: Any) -> bool:
+        try:
+            index = self.stateToIndex(state)
+        except (TypeError, ValueError, AttributeError):
+            return False
+        return 0 <= index < self.size and self.bits[index] != 0
+
+    __call__ = __contains__
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Any]:
+        # bytearray.find locates the next goal flag in C, goal regions are usually a few runs of ones
+        bits, indexToState = self.bits, self.indexToState
+        index = bits.find(1)
+        while index >= 0:
+            yield indexToState(index)
+            index = bits.find(1, index + 1)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(size={self.size}, goals={self._count})'
@@ -0,0 +1,203 @@
+from time import perf_counter
+from typing import Any, List, Optional, Set, Tuple
+import heapq
+import numpy as np
+from DiscretePlanning.planningSearch import DiscretePlanningSolver
+from DiscretePlanning.searchMetrics import SearchMetrics
+from DiscretePlanning.goalSets import GoalBitmap
+from DiscretePlanning.Environments.HillClimber import HillClimber, ACTION_OFFSETS, DIRECTIONS
+
+GRID_ALGORITHMS = ('dijkstra', 'astar')
+# goal counts up to which the default heuristic measures the distance to every goal, larger goal regions are bounded
+# by their bounding box in (x, y, height) space
+EXACT_HEURISTIC_GOALS = 16
+
+
+class GridSearch(DiscretePlanningSolver):
+    """
+    Dijkstra / A* over an 8-connected HillClimber grid using flat NumPy arrays.
+    Cells are identified by their flat index y*W + x, g-costs, parents and closed flags are arrays of length W*H and
+    the frontier is a heap of (priority, index) tuples. Edge costs are read in place from the climber's (W, H, 8) edge
+    cost array, so no problem callbacks run during the search. Solutions are lists of states in the climber's state encoding,
+    like ForwardSearch solutions, and can be checked with validateSolution.
+
+    Attributes
+    ----------
+    costs : np.ndarray
+        g-cost of every cell (inf if never reached)
+    parents : np.ndarray
+        flat index of the predecessor of every cell (-1 for the initial cell and unreached cells)
+    closed : np.ndarray
+        True for every expanded cell
+    expansions : int
+        Number of expansions of the last search, cells reopened by an inconsistent heuristic count once per expansion
+    metrics : SearchMetrics
+        Counters of the last search. The eight neighbours of a cell are relaxed as one vector, so generated and
+        duplicates are not counted, and no problem callbacks run to be timed
+    """
+    def __init__(self, climber: HillClimber, algorithm: str = 'dijkstra', heuristic: Optional[np.ndarray] = None) -> None:
+        """
+        :param climber: grid environment to solve, its problem is used to validate solutions
+        :param algorithm: 'dijkstra' (default) or 'astar'
+        :param heuristic: Optional (W, H) array of admissible cost-to-go estimates used by 'astar', defaults to the
+            straight line distance over the terrain to the closest goal (to the goals' bounding box for more than
+            EXACT_HEURISTIC_GOALS goals). Inconsistent heuristics stay optimal, cells
+            reached again through a cheaper path after their expansion are reopened
+        """
+        super().__init__(climber.problem)
+        if algorithm not in GRID_ALGORITHMS:
+            raise ValueError(f"Invalid Grid Algorithm Provided, expected one of {GRID_ALGORITHMS}")
+        if climber.problem.goalStates is None or climber.problem.goalPredicate is not None:
+            raise ValueError("Grid search requires goals given as a goal set or goal mask, not a goal predicate")
+        self.climber = climber
+        self.algorithm = algorithm
+        width, height = climber.size
+        self.size = width * height
+
+        edgeCosts = climber.edgeCosts
+        if edgeCosts is None:
+            edgeCosts = HillClimber._computeEdgeCosts(climber.heightField)
+        # view of the [x, y] ordered array, row x*H + y holds the costs of the eight edges leaving cell (x, y), inf for
+        # edges leaving the grid. Transposing it to the flat y*W + x order would copy W*H*8 floats
+        self._edgeRows = edgeCosts.reshape(self.size, len(DIRECTIONS))
+        self._offsets = np.array([dy * width + dx for dx, dy in (ACTION_OFFSETS[action] for action in DIRECTIONS)],
+                                 dtype=np.int64)
+
+        self._start = self._flatIndex(climber.problem.initialState)
+        self._isGoal = self._goalMask(climber.problem.goalStates)
+        if algorithm == 'astar':
+            if heuristic is None:
+                heuristic = self._terrainDistance()
+            self.heuristic = np.ascontiguousarray(np.asarray(heuristic, dtype=np.float64).T).reshape(self.size)
+        else:
+            self.heuristic = None
+
+        self.costs = np.full(self.size, np.inf)
+        self.parents = np.full(self.size, -1, dtype=np.int64)
+        self.closed = np.zeros(self.size, dtype=bool)
+        self.expansions = 0
+        self.metrics = SearchMetrics()
+
+    @classmethod
+    def fromHeights(cls, heights: np.ndarray, initialState: Tuple[int, int], goalStates: Set[Tuple[int, int]],
+                    algorithm: str = 'dijkstra', heuristic: Optional[np.ndarray] = None,
+                    stateEncoding: str = 'tuple') -> "GridSearch":
+        """
+        Builds a solver for a (W, H) height array indexed as [x, y], states are given in the chosen encoding
+        """
+        heights = np.asarray(heights, dtype=np.float64)
+        climber = HillClimber(lambda x, y: heights[x, y], heights.shape, initialState, goalStates,
+                              stateEncoding=stateEncoding)
+        return cls(climber, algorithm, heuristic)
+
+    def generateSolution(self) -> Optional[List[Any]]:
+        self.metrics = SearchMetrics()
+        start = perf_counter()
+        solution = self._search()
+        self.metrics.elapsed = perf_counter() - start
+        return solution
+
+    def _search(self) -> Optional[List[Any]]:
+        costs, parents, closed = self.costs, self.parents, self.closed
+        costs.fill(np.inf)
+        parents.fill(-1)
+        closed.fill(False)
+        edgeRows, offsets, heuristic = self._edgeRows, self._offsets, self.heuristic
+        width, height = self.climber.size
+        isGoal = self._isGoal
+
+        start = self._start
+        costs[start] = 0.0
+        frontier = [(0.0 if heuristic is None else float(heuristic[start]), start)]
+        expansions = stalePops = 0
+        pushes = peakFrontier = 1
+        solution = None
+        while frontier:
+            if len(frontier) > peakFrontier:
+                peakFrontier = len(frontier)
+            priority, index = heapq.heappop(frontier)
+            # stale entry left behind by a cheaper push, a closed cell whose entry is current was reached again through
+            # a cheaper path and is reopened
+            if priority > costs[index] + (0.0 if heuristic is None else heuristic[index]):
+                stalePops += 1
+                continue
+            closed[index] = True
+            expansions += 1
+            if isGoal[index]:
+                solution = self.solution = self._solutionPath(index)
+                break
+
+            neighbours = index + offsets
+            candidateCosts = costs[index] + edgeRows[(index % width) * height + index // width]
+            # edges leaving the grid cost inf, so clipped out of range neighbours never compare as better
+            better = candidateCosts < costs.take(neighbours, mode='clip')
+            if not better.any():
+                continue
+            improved = neighbours[better]
+            improvedCosts = candidateCosts[better]
+            costs[improved] = improvedCosts
+            parents[improved] = index
+            priorities = improvedCosts if heuristic is None else improvedCosts + heuristic[improved]
+            pushes += len(improved)
+            for priority, neighbour in zip(priorities.tolist(), improved.tolist()):
+                heapq.heappush(frontier, (priority, neighbour))
+
+        self.expansions = expansions
+        metrics = self.metrics
+        metrics.expansions = expansions
+        metrics.pushes = pushes
+        metrics.stalePops = stalePops
+        metrics.peakFrontier = peakFrontier
+        metrics.peakVisited = int(np.count_nonzero(costs < np.inf))
+        return solution
+
+    def _solutionPath(self, index: int) -> List[Any]:
+        width = self.climber.size[0]
+        encode = self.climber.encodeState
+        parents = self.parents
+        path = []
+        while index != -1:
+            path.append(encode(index % width, index // width))
+            index = int(parents[index])
+        path.reverse()
+        return path
+
+    def _flatIndex(self, state: Any) -> int:
+        x, y = self.climber.decodeState(state)
+        return y * self.climber.size[0] + x
+
+    def _goalMask(self, goalStates) -> np.ndarray:
+        """
+        Flat y*W + x mask of the goal cells, goal regions given as the climber's goalRegion bitmap are used as they are
+        """
+        if isinstance(goalStates, GoalBitmap) and goalStates.size == self.size \
+                and goalStates.stateToIndex == self.climber._cellIndex:
+            return np.frombuffer(goalStates.bits, dtype=np.uint8).astype(bool)
+        isGoal = np.zeros(self.size, dtype=bool)
+        for state in goalStates:
+            isGoal[self._flatIndex(state)] = True
+        return isGoal
+
+    def _terrainDistance(self) -> np.ndarray:
+        """
+        Straight line distance in (x, y, height) space from every cell to the closest goal, or to the bounding box of
+        the goals when there are more than EXACT_HEURISTIC_GOALS of them. Both are consistent heuristics since every
+        edge cost is the straight line length of that edge, and the distance to a point or a box is 1-Lipschitz
+        """
+        width, height = self.climber.size
+        heights = self.climber.heightField
+        xs, ys = np.meshgrid(np.arange(width), np.arange(height), indexing='ij')
+        goals = np.flatnonzero(self._isGoal)
+        if len(goals) > EXACT_HEURISTIC_GOALS:
+            goalXs, goalYs = goals % width, goals // width
+            goalHeights = heights[goalXs, goalYs]
+            dx = np.maximum(0, np.maximum(goalXs.min() - xs, xs - goalXs.max()))
+            dy = np.maximum(0, np.maximum(goalYs.min() - ys, ys - goalYs.max()))
+            dh = np.maximum(0.0, np.maximum(goalHeights.min() - heights, heights - goalHeights.max()))
+            return np.sqrt(dx ** 2 + dy ** 2 + dh ** 2)
+        distance = np.full((width, height), np.inf)
+        for goal in goals.tolist():
+            gx, gy = goal % width, goal // width
+            np.minimum(distance, np.sqrt((xs - gx) ** 2 + (ys - gy) ** 2 + (heights - heights[gx, gy]) ** 2),
+                       out=distance)
+        return distance
@@ -0,0 +1,209 @@
+from json import dumps, loads, JSONDecoder, JSONDecodeError
+from pathlib import Path
+from struct import Struct
+from typing import BinaryIO, Dict, Iterator, TextIO, Union
+import re
+
+# characters (or bytes) read from a log file at a time by the streaming readers
+READ_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DECODER = JSONDecoder()
+
+
+class LogSerializer:
+    """
+    Record format of the files written by SearchLogger and read back by AbstractAnimator.
+    A log file holds the header, then every serialized record preceded by the separator (from the second record on)
+    and followed by the terminator, then the footer once the log is closed. Files of a format are recognized by suffix.
+
+    Attributes
+    ----------
+    suffix : str
+        File suffix of logs written in this format
+    binary : bool
+        True if records are bytes and files are opened in binary mode
+    header, separator, terminator, footer : str or bytes
+        Framing written around records, of the same type as the records
+    """
+    suffix = ''
+    binary = False
+    header = ''
+    separator = ''
+    terminator = ''
+    footer = ''
+
+    @property
+    def mode(self) -> str:
+        return 'ab' if self.binary else 'a'
+
+    def join(self, chunks) -> Union[str, bytes]:
+        return (b'' if self.binary else '').join(chunks)
+
+    def serialize(self, entry: Dict) -> Union[str, bytes]:
+        """
+        Serializes one JSON compatible log entry into a record
+        """
+        raise NotImplementedError("serialize must be implemented by subclasses.")
+
+    def lineCount(self, record: Union[str, bytes]) -> int:
+        """
+        Number of lines a record counts for against SearchLogger.maxLines
+        """
+        return 1
+
+    def iterRecords(self, file: Union[TextIO, BinaryIO], chunkSize: int = READ_CHUNK_SIZE) -> Iterator[Dict]:
+        """
+        Yields the entries of an open log file one at a time, in bounded memory
+        """
+        raise NotImplementedError("iterRecords must be implemented by subclasses.")
+
+
+class JsonArraySerializer(LogSerializer):
+    """A JSON array of indented entries, the original log format"""
+    suffix = '.json'
+    header = '[\n'
+    separator = ',\n'
+    footer = '\n]'
+
+    def serialize(self, entry: Dict) -> str:
+        return dumps(entry, indent=4)
+
+    def lineCount(self, record: str) -> int:
+        return record.count('\n') + 1
+
+    def iterRecords(self, file: TextIO, chunkSize: int = READ_CHUNK_SIZE) -> Iterator[Dict]:
+        # decodes one array element at a time from fixed size chunks
+        buffer, position, eof = '', 0, False
+        state = 'open' # 'open' -> 'first' -> ('separator' <-> 'value') -> 'closed'
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()
+            if position >= len(buffer):
+                if eof:
+                    break
+                buffer, position = file.read(chunkSize), 0
+                eof = not buffer
+                continue
+
+            char = buffer[position]
+            if state == 'open':
+                if char != '[':
+                    raise JSONDecodeError("Expecting '['", buffer, position)
+                position += 1
+                state = 'first'
+            elif state == 'closed':
+                raise JSONDecodeError("Extra data", buffer, position)
+            elif char == ']' and state in ('first', 'separator'):
+                position += 1
+                state = 'closed'
+            elif state == 'separator':
+                if char != ',':
+                    raise JSONDecodeError("Expecting ',' delimiter", buffer, position)
+                position += 1
+                state = 'value'
+            else:
+                try:
+                    event, end = _DECODER.raw_decode(buffer, position)
+                    # a scalar ending with the buffer may continue in the next chunk
+                    complete = eof or end < len(buffer) or isinstance(event, (dict, list, str))
+                except JSONDecodeError:
+                    if eof:
+                        raise
+                    complete = False
+                if not complete:
+                    # keep the partial event and read at least as much again, so large events take O(log n) reads
+                    chunk = file.read(max(chunkSize, len(buffer) - position))
+                    buffer, position = buffer[position:] + chunk, 0
+                    eof = not chunk
+                    continue
+                position = end
+                state = 'separator'
+                yield event
+
+        if state != 'closed':
+            raise JSONDecodeError("Expecting ']'", buffer, position)
+
+
+class JsonLinesSerializer(LogSerializer):
+    """JSON Lines, one compact entry per line, appended without any bracket bookkeeping"""
+    suffix = '.jsonl'
+    terminator = '\n'
+
+    def serialize(self, entry: Dict) -> str:
+        return dumps(entry, separators=(',', ':'))
+
+    def iterRecords(self, file: TextIO, chunkSize: int = READ_CHUNK_SIZE) -> Iterator[Dict]:
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                yield loads(line)
+            except JSONDecodeError as err:
+                raise JSONDecodeError(f"{err.msg} (line {line_number})", doc=err.doc, pos=err.pos)
+
+
+class BinaryRecordSerializer(LogSerializer):
+    """
+    Length-prefixed binary records: a file magic, then for every entry a little-endian uint32 payload length followed
+    by the entry as compact UTF-8 JSON. Records are encoded by the C JSON encoder in a single pass and can be skipped
+    or read without scanning for delimiters.
+    """
+    suffix = '.slog'
+    binary = True
+    header = b'SLOG\x01'
+    separator = b''
+    terminator = b''
+    footer = b''
+    RECORD_LENGTH = Struct('<I')
+
+    def serialize(self, entry: Dict) -> bytes:
+        payload = dumps(entry, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        return self.RECORD_LENGTH.pack(len(payload)) + payload
+
+    def iterRecords(self, file: BinaryIO, chunkSize: int = READ_CHUNK_SIZE) -> Iterator[Dict]:
+        magic = file.read(len(self.header))
+        if not magic:
+            return
+        if magic != self.header:
+            raise ValueError(f"Not a binary search log, unexpected file header {magic!r}")
+        lengthSize = self.RECORD_LENGTH.size
+        while True:
+            prefix = file.read(lengthSize)
+            if not prefix:
+                return
+            if len(prefix) < lengthSize:
+                raise ValueError("Truncated binary log record length")
+            length, = self.RECORD_LENGTH.unpack(prefix)
+            payload = file.read(length)
+            if len(payload) < length:
+                raise ValueError("Truncated binary log record")
+            yield loads(payload)
+
+
+# built-in formats, selected by name through SearchLogger's logFormat and recognized by suffix when reading
+LOG_SERIALIZERS = {
+    'json': JsonArraySerializer,
+    'jsonl': JsonLinesSerializer,
+    'binary': BinaryRecordSerializer,
+}
+
+
+def createSerializer(logFormat: Union[str, LogSerializer]) -> LogSerializer:
+    """
+    Returns the serializer of a built-in format name, or the given serializer instance
+    """
+    if isinstance(logFormat, LogSerializer):
+        return logFormat
+    if logFormat not in LOG_SERIALIZERS:
+        raise ValueError(f"Invalid Log Format Provided, expected one of {tuple(LOG_SERIALIZERS)} or a LogSerializer")
+    return LOG_SERIALIZERS[logFormat]()
+
+
+def serializerForPath(path: Path) -> LogSerializer:
+    """
+    Returns the serializer of a log file based on its suffix, defaulting to the JSON array format
+    """
+    for serializerClass in LOG_SERIALIZERS.values():
+        if path.suffix == serializerClass.suffix:
+            return serializerClass()
+    return JsonArraySerializer()
@@ -0,0 +1,271 @@
+from DiscretePlanning.planningSearch import ForwardSearch
+from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from itertools import count
+from math import inf
+from typing import Any, Callable, Dict, List, Optional
+import heapq
+
+_EXHAUSTED = object()
+
+class ForwardIDAStar(ForwardSearch):
+    """
+    Iterative deepening A*, a sequence of depth first searches each pruning states whose f = g + h exceeds a cost
+    bound, the bound of the next iteration being the least f pruned by the previous one. Only the current path is
+    stored, so memory is O(depth), at the price of re-expanding states reached by several paths.
+    Returns least cost solutions if the heuristic is admissible.
+
+    Attributes
+    ----------
+    heuristic : X -> R^+
+        Admissible estimate of the cost from a state to a goal state
+    iterations : int
+        Number of depth first searches run by the last generateSolution
+    solutionCost : float
+        Cost of the returned solution, None if no solution was found
+    """
+    def __init__(self, problem: DiscretePlanningProblem, heuristic: Optional[Callable] = None,
+                 metrics_options: Optional[Dict] = None) -> None:
+        super().__init__(problem, {'type': 'deque'}, None, metrics_options)
+        if self.problem.costFunction is None:
+            raise ValueError("No cost function provided for given Problem")
+        self.heuristic = heuristic
+        if self.heuristic is None:
+            self.heuristic = lambda state: 0.0
+        self.iterations = 0
+        self.solutionCost = None
+
+    def _search(self) -> Optional[List[Any]]:
+        problem = self.problem
+        bound = self.heuristic(problem.initialState)
+        self.iterations = 0
+        self._generated = self._duplicates = self._peakDepth = 0
+        solution = None
+        while bound < inf:
+            self.iterations += 1
+            solution, bound = self._boundedSearch(bound)
+            if solution is not None:
+                break
+        metrics = self.metrics
+        metrics.expansions = self.expansions
+        metrics.generated = self._generated
+        metrics.duplicates = self._duplicates
+        metrics.peakFrontier = metrics.peakVisited = self._peakDepth
+        return solution
+
+    def _boundedSearch(self, bound: float):
+        """
+        Depth first search of the states with f <= bound, iterative so deep paths do not hit the recursion limit
+        :return: (solution, None) if a goal state was reached, otherwise (None, least f above the bound)
+        """
+        problem = self.problem
+        heuristic = self.heuristic
+        root = problem.initialState
+        if problem.is_goal_state(root):
+            return self._finish([root], 0.0), None
+        path, costs, onPath = [root], [0.0], {root}
+        successors = [iter(problem.get_successors(root))]
+        self.expansions += 1
+        nextBound = inf
+        # every iteration expands the same states again, each expansion calls problem.get_successors for its successors
+        while successors:
+            triple = next(successors[-1], _EXHAUSTED)
+            if triple is _EXHAUSTED:
+                successors.pop()
+                onPath.discard(path.pop())
+                costs.pop()
+                continue
+            _, successor, edgeCost = triple
+            self._generated += 1
+            if successor in onPath:
+                self._duplicates += 1
+                continue
+            cost = costs[-1] + edgeCost
+            f = cost + heuristic(successor)
+            if f > bound:
+                if f < nextBound:
+                    nextBound = f
+                continue
+            path.append(successor)
+            if problem.is_goal_state(successor):
+                return self._finish(path, cost), None
+            costs.append(cost)
+            onPath.add(successor)
+            successors.append(iter(problem.get_successors(successor)))
+            self.expansions += 1
+            if len(path) > self._peakDepth:
+                self._peakDepth = len(path)
+        return None, nextBound
+
+    def _finish(self, path: List[Any], cost: float) -> List[Any]:
+        self.solution = list(path)
+        self.solutionCost = cost
+        return self.solution
+
+
+class _SMANode:
+    __slots__ = ('state', 'parent', 'g', 'f', 'depth', 'children', 'forgotten', 'expanded', 'alive',
+                 'openStamp', 'leafStamp')
+
+    def __init__(self, state: Any, parent: Optional['_SMANode'], g: float, f: float, depth: int) -> None:
+        self.state = state
+        self.parent = parent
+        self.g = g
+        self.f = f
+        self.depth = depth
+        self.children: Dict[Any, '_SMANode'] = {}
+        self.forgotten: Dict[Any, float] = {} # state of a pruned child -> its backed up f
+        self.expanded = False
+        self.alive = True
+        self.openStamp = None
+        self.leafStamp = None
+
+
+class ForwardSMAStar(ForwardSearch):
+    """
+    Simplified memory-bounded A*, an A* search tree holding at most nodeBudget nodes. When the budget is exceeded the
+    leaf with the highest f (shallowest on ties) is pruned and its f is backed up into its parent, which is queued
+    again to regenerate the pruned branch if it becomes the most promising one. Successors are generated all at once.
+    Returns least cost solutions if the heuristic is admissible and the least cost solution has at most nodeBudget
+    states, solutions that do not fit in the budget are not found. The tree holds at most nodeBudget nodes between
+    expansions, an expansion adds up to one branching factor of nodes before the worst leaves are pruned. Budgets
+    close to the solution length make the search regenerate pruned branches many times.
+
+    Attributes
+    ----------
+    heuristic : X -> R^+
+        Admissible estimate of the cost from a state to a goal state
+    nodeBudget : int
+        Maximum number of search tree nodes kept in memory
+    solutionCost : float
+        Cost of the returned solution, None if no solution was found
+    """
+    def __init__(self, problem: DiscretePlanningProblem, heuristic: Optional[Callable] = None, nodeBudget: int = 1 << 16,
+                 metrics_options: Optional[Dict] = None) -> None:
+        super().__init__(problem, {'type': 'deque'}, None, metrics_options)
+        if self.problem.costFunction is None:
+            raise ValueError("No cost function provided for given Problem")
+        if nodeBudget < 2:
+            raise ValueError("nodeBudget must be at least 2")
+        self.heuristic = heuristic
+        if self.heuristic is None:
+            self.heuristic = lambda state: 0.0
+        self.nodeBudget = nodeBudget
+        self.solutionCost = None
+
+    def _search(self) -> Optional[List[Any]]:
+        problem = self.problem
+        self._open: List = [] # (f, -depth, stamp, node) of leaves and of nodes with forgotten children
+        self._leaves: List = [] # (-f, depth, stamp, node) of prunable leaves
+        self._stamps = count()
+        self._nodes = 1
+        self._generated = self._pruned = 0
+        peakNodes = 1
+        root = _SMANode(problem.initialState, None, 0.0, self.heuristic(problem.initialState), 0)
+        self._queue(root)
+        solution = None
+        while self._open:
+            key, _, stamp, node = heapq.heappop(self._open)
+            if stamp != node.openStamp or not node.alive:
+                continue # superseded entry
+            node.openStamp = None
+            if key == inf:
+                break
+            if problem.is_goal_state(node.state):
+                solution = self._finish(node)
+                break
+            self._expand(node)
+            peakNodes = max(peakNodes, self._nodes)
+            while self._nodes > self.nodeBudget:
+                self._pruneWorstLeaf()
+
+        metrics = self.metrics
+        metrics.expansions = self.expansions
+        metrics.generated = self._generated
+        metrics.duplicates = self._pruned # pruned nodes, regenerated if their branch becomes promising again
+        metrics.peakFrontier = metrics.peakVisited = peakNodes
+        return solution
+
+    def _expand(self, node: _SMANode) -> None:
+        """
+        Generates the successors of a node on its first expansion, and its forgotten successors afterwards
+        """
+        problem = self.problem
+        onPath = set()
+        ancestor = node
+        while ancestor is not None:
+            onPath.add(ancestor.state)
+            ancestor = ancestor.parent
+        forgotten = node.forgotten
+        firstExpansion = not node.expanded
+        node.expanded = True
+        self.expansions += 1
+        cheapest = {}
+        for _, successor, edgeCost in problem.get_successors(node.state):
+            if successor in onPath or successor in node.children:
+                continue
+            if not firstExpansion and successor not in forgotten:
+                continue
+            # parallel edges to the same successor collapse into the cheapest one, the tree keeps one child per state
+            if successor not in cheapest or edgeCost < cheapest[successor]:
+                cheapest[successor] = edgeCost
+        for successor, edgeCost in cheapest.items():
+            self._generated += 1
+            g = node.g + edgeCost
+            # pathmax keeps f non-decreasing along paths, a pruned branch keeps its backed up f
+            f = max(g + self.heuristic(successor), node.f, forgotten.pop(successor, 0.0))
+            child = _SMANode(successor, node, g, f, node.depth + 1)
+            # a non goal state with no room left for its successors can not lead to a solution within the budget
+            if child.depth + 2 > self.nodeBudget and not problem.is_goal_state(successor):
+                child.f = inf
+            node.children[successor] = child
+            self._nodes += 1
+            self._queue(child)
+            self._pushLeaf(child)
+        forgotten.clear()
+        node.leafStamp = None # has children or is a dead end, either way not a leaf to prune by budget
+        if not node.children:
+            # dead end, every successor is on the path
+            node.f = inf
+            if node.parent is not None:
+                self._prune(node)
+
+    def _pruneWorstLeaf(self) -> None:
+        while True:
+            _, _, stamp, node = heapq.heappop(self._leaves)
+            if stamp == node.leafStamp and node.alive and not node.children:
+                self._prune(node)
+                return
+
+    def _prune(self, node: _SMANode) -> None:
+        """Removes a leaf from the tree and backs its f up into its parent, which is queued to regenerate it"""
+        parent = node.parent
+        node.alive = False
+        self._nodes -= 1
+        self._pruned += 1
+        del parent.children[node.state]
+        parent.forgotten[node.state] = node.f
+        if not parent.children:
+            parent.f = min(parent.forgotten.values())
+            if parent.parent is not None:
+                self._pushLeaf(parent)
+        self._queue(parent)
+
+    def _queue(self, node: _SMANode) -> None:
+        key = node.f if not node.expanded else min(node.forgotten.values(), default=inf)
+        if node.expanded and node.children:
+            key = max(key, node.f)
+        node.openStamp = next(self._stamps)
+        heapq.heappush(self._open, (key, -node.depth, node.openStamp, node))
+
+    def _pushLeaf(self, node: _SMANode) -> None:
+        node.leafStamp = next(self._stamps)
+        heapq.heappush(self._leaves, (-node.f, node.depth, node.leafStamp, node))
+
+    def _finish(self, node: _SMANode) -> List[Any]:
+        self.solutionCost = node.g
+        self.solution = []
+        while node is not None:
+            self.solution.append(node.state)
+            node = node.parent
+        self.solution.reverse()
+        return self.solution
@@ -0,0 +1,157 @@
+from math import inf, isclose
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Union
+import heapq
+import pickle
+from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from DiscretePlanning.stateStore import CompactCostTable, createStateIndex
+
+PATTERN_DATABASE_VERSION = 2
+# states whose cost-to-go is checked against the problem's edges when a table is loaded from a cache file
+CACHE_CHECK_SAMPLES = 64
+
+class PatternDatabase:
+    """
+    Exact cost-to-go table computed by a backward Dijkstra search from the goal states, usable as an O(1) heuristic
+    by ForwardAStar. Built over the problem itself it is the perfect heuristic, built over an abstraction of the
+    problem (ex. a coarser grid) it is admissible as long as abstract edges cost no more than the edges they abstract.
+
+    ...
+
+    Attributes
+    ----------
+    problem : DiscretePlanningProblem
+        Problem searched backward, its predecessorFunction and costFunction are required
+    goalStates : set
+        States the cost-to-go is measured to
+    abstraction : X -> abstract state
+        Maps states queried by the heuristic to states of the searched problem, None for the identity
+    costToGo : Mapping
+        state -> least cost to a goal state, dictionary or CompactCostTable
+    expansions : int
+        States expanded while building the table, 0 if it was loaded from the cache
+
+    Methods
+    -------
+    __call__ : Given a state, return its cost-to-go, inf if no goal state can be reached from it.
+    """
+    def __init__(self, problem: DiscretePlanningProblem, goalStates: Optional[Set[Any]] = None,
+                 abstraction: Optional[Callable[[Any], Any]] = None, store_options: Optional[Dict] = None,
+                 cacheFile: Optional[Union[str, Path]] = None, cacheKey: Hashable = None):
+        """
+        :param problem: Problem to search backward, the concrete problem or an abstraction of it
+        :param goalStates: States of problem to measure the cost-to-go to, defaults to problem.goalStates, required if
+            the problem has a goalPredicate
+        :param abstraction: Maps queried states to states of problem, None if they are the same states
+        :param store_options: Table storage, same options as ForwardSearch ('dict' default or 'compact')
+        :param cacheFile: Pickle file the table is loaded from if it was built for the same goal states, abstraction and
+            cacheKey and agrees with the problem's edge costs on a sample of states, and saved to otherwise. Only use
+            cache files from trusted sources as they are unpickled
+        :param cacheKey: Picklable tag of the map and costs the table is built for (ex. a version or a hash of the
+            height field), stored in the cache file and compared on load. The sampled cost check only catches some
+            changes of the problem, pass a key whenever the same cache file may see different problems
+        """
+        if problem.predecessorFunction is None:
+            raise ValueError("No predecessor function provided for given Problem")
+        if problem.costFunction is None:
+            raise ValueError("No cost function provided for given Problem")
+        if goalStates is None and (problem.goalStates is None or problem.goalPredicate is not None):
+            raise ValueError("The backward search requires enumerable goal states, not a goal predicate")
+        self.problem = problem
+        self.goalStates = set(problem.goalStates if goalStates is None else goalStates)
+        self.abstraction = abstraction
+        self.cacheKey = cacheKey
+        self.store_options = {} if store_options is None else store_options
+        self.expansions = 0
+        self.costToGo = self._createTable()
+
+        cacheFile = None if cacheFile is None else Path(cacheFile)
+        if cacheFile is None or not self._load(cacheFile):
+            self._build()
+            if cacheFile is not None:
+                self._save(cacheFile)
+
+    def __call__(self, state: Any) -> float:
+        if self.abstraction is not None:
+            state = self.abstraction(state)
+        costToGo = self.costToGo
+        return costToGo[state] if state in costToGo else inf
+
+    def _createTable(self):
+        storeType = self.store_options.get('type', 'dict')
+        if storeType == 'dict':
+            return {}
+        if storeType == 'compact':
+            return CompactCostTable(createStateIndex(self.store_options))
+        raise ValueError("Invalid Store Type Provided")
+
+    def _build(self) -> None:
+        problem = self.problem
+        costToGo = self.costToGo
+        frontier = []
+        for goal in self.goalStates:
+            costToGo[goal] = 0.0
+            frontier.append((0.0, goal))
+        heapq.heapify(frontier)
+        while frontier:
+            cost, state = heapq.heappop(frontier)
+            if cost > costToGo[state]:
+                continue # stale entry
+            self.expansions += 1
+            for predecessor, action in problem.predecessorFunction(state):
+                predecessorCost = cost + problem.get_edge_cost(predecessor, action)
+                if predecessor not in costToGo or predecessorCost < costToGo[predecessor]:
+                    costToGo[predecessor] = predecessorCost
+                    heapq.heappush(frontier, (predecessorCost, predecessor))
+
+    def _save(self, cacheFile: Path) -> None:
+        data = {'version': PATTERN_DATABASE_VERSION, 'key': self._cacheIdentity(),
+                'costToGo': dict(self.costToGo.items())}
+        with cacheFile.open('wb') as file:
+            pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _load(self, cacheFile: Path) -> bool:
+        """
+        Fills the table from a cache file, returns False if it is missing, was built for other goal states, another
+        abstraction or cacheKey, or disagrees with the problem's edge costs
+        """
+        if not cacheFile.is_file():
+            return False
+        with cacheFile.open('rb') as file:
+            data = pickle.load(file)
+        if not isinstance(data, dict) or data.get('version') != PATTERN_DATABASE_VERSION \
+                or data.get('key') != self._cacheIdentity() or not self._agreesWithProblem(data['costToGo']):
+            return False
+        costToGo = self.costToGo
+        for state, cost in data['costToGo'].items():
+            costToGo[state] = cost
+        return True
+
+    def _cacheIdentity(self) -> Dict[str, Any]:
+        abstraction = self.abstraction
+        abstractionName = None if abstraction is None else \
+            f"{getattr(abstraction, '__module__', None)}.{getattr(abstraction, '__qualname__', type(abstraction).__qualname__)}"
+        return {'goalStates': self.goalStates, 'abstraction': abstractionName, 'cacheKey': self.cacheKey}
+
+    def _agreesWithProblem(self, costToGo: Dict[Any, float]) -> bool:
+        """
+        Checks the Bellman equation of a loaded table on up to CACHE_CHECK_SAMPLES evenly spread states: the cost-to-go
+        of a non goal state is the least edge cost plus cost-to-go over its successors
+        """
+        problem = self.problem
+        belongingFunction = problem.belongingFunction
+        states = list(costToGo)
+        step = max(1, len(states) // CACHE_CHECK_SAMPLES)
+        for state in states[::step][:CACHE_CHECK_SAMPLES]:
+            cost = costToGo[state]
+            if state in self.goalStates:
+                if cost != 0.0:
+                    return False
+                continue
+            if not belongingFunction(state):
+                return False
+            best = min((edgeCost + costToGo[successor] for _, successor, edgeCost in problem.get_successors(state)
+                        if successor in costToGo), default=inf)
+            if not isclose(cost, best, rel_tol=1e-9, abs_tol=1e-12):
+                return False
+        return True
@@ -0,0 +1,162 @@
+from array import array
+from collections.abc import Sequence
+from typing import Any, Iterable, Iterator, List, Optional
+from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from DiscretePlanning.stateStore import StateInterner
+
+STATE_ID_TYPECODE = 'I'
+ACTION_ID_TYPECODE = 'I'
+COST_TYPECODE = 'd'
+
+class Plan(Sequence):
+    """
+    Solution path stored as the ids of its states and actions in typed arrays, with the cumulative cost of every
+    state. States and actions are interned by index objects (StateInterner, StateEncoder or a solver's stateIndex)
+    that are meant to be shared by many plans, so a plan holds no Python object per step.
+    A plan is a sequence of its states, actions[i] leads from plan[i] to plan[i + 1]. Slicing with step 1 returns a
+    plan over the same arrays without copying them.
+
+    ...
+
+    Attributes
+    ----------
+    stateIndex : StateInterner or StateEncoder
+        Maps the state ids of the plan to states
+    actionIndex : StateInterner
+        Maps the action ids of the plan to actions
+    stateIds : memoryview
+        Id of every state of the plan
+    actionIds : memoryview
+        Id of every action of the plan, one less than there are states
+    cumulativeCosts : memoryview
+        Cost from the first state of the unsliced plan to every state, None if the problem has no cost function
+
+    Methods
+    -------
+    fromStates : Builds the plan of a list of states, recovering the actions from the problem's successors.
+
+    totalCost : Cost of the plan, None if the problem has no cost function.
+
+    actions : List of the actions of the plan.
+
+    nbytes : Bytes of the arrays viewed by the plan.
+    """
+    # tens of thousands of plans may be kept, memoryviews are only created on access
+    __slots__ = ('_stateIds', '_actionIds', '_costs', '_start', '_stop', 'stateIndex', 'actionIndex')
+
+    def __init__(self, stateIds: array, actionIds: array, cumulativeCosts: Optional[array], stateIndex: Any,
+                 actionIndex: StateInterner, start: int = 0, stop: Optional[int] = None) -> None:
+        """
+        :param stateIds: Ids of the states in stateIndex
+        :param actionIds: Ids of the actions in actionIndex, one less than there are states
+        :param cumulativeCosts: Cumulative cost of every state, None if unknown
+        :param stateIndex: Interning layer of the states
+        :param actionIndex: Interning layer of the actions
+        :param start, stop: Range of the states of the arrays viewed by the plan, defaults to all of them
+        """
+        stop = len(stateIds) if stop is None else stop
+        if stop <= start:
+            raise ValueError("Provided Plan is Empty")
+        if len(actionIds) != len(stateIds) - 1:
+            raise ValueError("Provided Plan needs one action per transition")
+        if cumulativeCosts is not None and len(cumulativeCosts) != len(stateIds):
+            raise ValueError("Provided Plan needs one cumulative cost per state")
+        self._stateIds = stateIds
+        self._actionIds = actionIds
+        self._costs = cumulativeCosts
+        self._start = start
+        self._stop = stop
+        self.stateIndex = stateIndex
+        self.actionIndex = actionIndex
+
+    @classmethod
+    def fromStates(cls, problem: DiscretePlanningProblem, states: Iterable[Any], stateIndex: Any = None,
+                   actionIndex: Optional[StateInterner] = None) -> 'Plan':
+        """
+        Builds the plan of a path of states, the action of every step is recovered from the problem's (cached)
+        successors, the cheapest one if several actions lead to the same state
+
+        :param problem: Problem the path is a solution of
+        :param states: Nonempty iterable of states, each a successor of the previous one
+        :param stateIndex: Interning layer of the states, share one across plans (ex. a solver's stateIndex),
+            defaults to a new StateInterner
+        :param actionIndex: Interning layer of the actions, share one across plans, defaults to a new StateInterner
+        """
+        stateIndex = StateInterner() if stateIndex is None else stateIndex
+        actionIndex = StateInterner() if actionIndex is None else actionIndex
+        hasCosts = problem.costFunction is not None or problem.successorFunction is not None
+        stateIds, actionIds, cumulativeCosts = [], [], []
+        previous, cost = None, 0.0
+        for state in states:
+            if stateIds:
+                action, stepCost = cls._recoverAction(problem, previous, state)
+                actionIds.append(actionIndex.intern(action))
+                if stepCost is None:
+                    hasCosts = False
+                else:
+                    cost += stepCost
+            stateIds.append(stateIndex.intern(state))
+            cumulativeCosts.append(cost)
+            previous = state
+        # arrays built from lists are allocated at their exact size
+        return cls(array(STATE_ID_TYPECODE, stateIds), array(ACTION_ID_TYPECODE, actionIds),
+                   array(COST_TYPECODE, cumulativeCosts) if hasCosts else None, stateIndex, actionIndex)
+
+    @staticmethod
+    def _recoverAction(problem: DiscretePlanningProblem, state: Any, nextState: Any):
+        best = None
+        for action, successor, cost in problem.get_successors(state):
+            if successor == nextState and (best is None or (cost is not None and cost < best[1])):
+                best = (action, cost)
+        if best is None:
+            raise ValueError(f"No action leads from {state!r} to {nextState!r}")
+        return best
+
+    @property
+    def stateIds(self) -> memoryview:
+        return memoryview(self._stateIds)[self._start:self._stop]
+
+    @property
+    def actionIds(self) -> memoryview:
+        return memoryview(self._actionIds)[self._start:self._stop - 1]
+
+    @property
+    def cumulativeCosts(self) -> Optional[memoryview]:
+        return None if self._costs is None else memoryview(self._costs)[self._start:self._stop]
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                raise ValueError("Plans can only be sliced with a step of 1")
+            return Plan(self._stateIds, self._actionIds, self._costs, self.stateIndex, self.actionIndex,
+                        self._start + start, self._start + stop)
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("Plan index out of range")
+        return self.stateIndex.state(self._stateIds[self._start + key])
+
+    def __iter__(self) -> Iterator[Any]:
+        state = self.stateIndex.state
+        return (state(index) for index in self.stateIds)
+
+    @property
+    def actions(self) -> List[Any]:
+        action = self.actionIndex.state
+        return [action(index) for index in self.actionIds]
+
+    @property
+    def totalCost(self) -> Optional[float]:
+        costs = self._costs
+        return None if costs is None else costs[self._stop - 1] - costs[self._start]
+
+    @property
+    def nbytes(self) -> int:
+        return self.stateIds.nbytes + self.actionIds.nbytes + (0 if self._costs is None else self.cumulativeCosts.nbytes)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(states={len(self)}, totalCost={self.totalCost})'
@@ -1,4 +1,9 @@
-from typing import Callable, List, Set, Any
+from typing import Callable, Iterable, List, Optional, Sequence, Set, Tuple, Any
+from DiscretePlanning.caches import LRUCache
+from DiscretePlanning.goalSets import GoalBitmap
+
+COST_CACHE_SIZE = 1 << 16
+SUCCESSOR_CACHE_SIZE = 0
 class DiscretePlanningProblem: 
     """
         A class to represent a Discrete Planning Problem based on Formulation 2.1
@@ -12,21 +17,43 @@ class DiscretePlanningProblem:
             A function that takes a state and returns a set of action state pairs that lead to the state i.e U^{-1}(x)
         transitionFunction : X x U(x) -> X
             A function that takes a state and an action as input and returns the resulting state.
+        successorFunction : X -> [(u, x', cost)]
+            Optional batched form of actionFunction, transitionFunction and costFunction returning every
+            (action, successor, cost) triple of a state in one call
         initialState : 
             The initial state of the problem represented as a string as in stateSpace
         goalStates : set
-            A list of goal states for the planning Problem
+            A list of goal states for the planning Problem, any container supporting `in` (ex. a GoalBitmap), or None
+            if goals are only described by goalPredicate
+        goalPredicate : X -> T/F
+            Optional callback recognizing goal states, a state is a goal if it is in goalStates or accepted by it
         actionSpace : set
             A set object corresponding to the union of action sets across all sets
             
+        costCache : LRUCache
+            Bounded cache of (state, action) -> edge cost used by get_edge_cost
+        successorCache : LRUCache
+            Opt-in bounded cache of state -> (action, successor, cost) triples used by get_successors, shared by every
+            solver of the problem, disabled (size 0) by default
+
         Methods
         -------
+        get_cost : Given a state and an action, return the validated cost of the transition.
+
+        get_edge_cost : Given a state and an action known to be valid, return the (cached) cost of the transition.
+
         get_prev_states : Given a state, return an array of possible predecessor states.
 
+        get_successors : Given a state known to be valid, return its (action, successor, cost) triples.
+
         get_next_states : Given a state, return an array of possible next states.
     """
 
-    def __init__(self,belongingFunction: Callable[[Any], bool], actionFunction: Callable[[Any], Set[Any]], transitionFunction: Callable[[Any, Any], Any], initialState: Any, goalStates: Set[Any], actionSpace: Set[Any] = None, predecessorFunction: Callable[[Any], Set[Any]] = None, costFunction :Callable = None):
+    def __init__(self,belongingFunction: Callable[[Any], bool], actionFunction: Callable[[Any], Set[Any]], transitionFunction: Callable[[Any, Any], Any], initialState: Any, goalStates: Set[Any], actionSpace: Set[Any] = None, predecessorFunction: Callable[[Any], Set[Any]] = None, costFunction :Callable = None,
+                 costCacheSize: int = COST_CACHE_SIZE, validateCosts: bool = False,
+                 goalPredicate: Callable[[Any], bool] = None, validateGoals: bool = True,
+                 successorFunction: Callable[[Any], Iterable[Tuple[Any, Any, float]]] = None,
+                 successorCacheSize: int = SUCCESSOR_CACHE_SIZE):
         """
         Initialize the planning problem.
         
@@ -35,32 +62,59 @@ class DiscretePlanningProblem:
         :param predecessorFunction: A function that takes a state and returns a set of actions state pairs that lead to the state i.e U^{-1}(x)
         :param transitionFunction: A function that takes a state and an action as input and returns the resulting state.
         :param initialState: The initial state of the problem represented as a string as in stateSpace
-        :param goalStates: A set of goal states for the planning Problem
+        :param goalStates: A set of goal states for the planning Problem, any container supporting `in` such as a
+            GoalBitmap, or None if goalPredicate describes the goals
         :param actionSpace: A set object corresponding to the union of action sets across all sets - optional
         :param costFunction: A function that takes a state and an action as input and gives a non-negative (float) cost associated with the transition as output
+        :param costCacheSize: Maximum number of edge costs memoized by get_edge_cost, 0 disables the cache
+        :param validateCosts: Debug option, if True get_edge_cost validates its inputs and outputs like get_cost
+        :param goalPredicate: Callback taking a state and returning True for goal states, for goal regions too large to
+            enumerate. Predicates are not validated up front, they are only ever asked about states reached by a search
+        :param validateGoals: If True every explicit goal state is checked with belongingFunction on construction,
+            set to False for large goal sets known to be valid. GoalBitmap goals only hold states of the state space
+            and are never checked
+        :param successorFunction: A function that takes a state and returns all of its (action, successor, cost)
+            triples in one call, must agree with actionFunction, transitionFunction and costFunction (cost may be None
+            if there is no costFunction) - optional, used by get_successors instead of one callback call per action
+        :param successorCacheSize: Maximum number of states whose successors are memoized by get_successors, 0 (default)
+            disables the cache. Only worth enabling when the same states are expanded by repeated searches, and only
+            valid if the callbacks are deterministic
         """
         # belonging function f: X -> T/F
         self.belongingFunction = belongingFunction
 
+        # successors are memoized until one of the callbacks producing them is replaced
+        self.successorCache = LRUCache(successorCacheSize)
+
         # action function f: X -> U(x)
         self.actionFunction = actionFunction
 
         # transition function f: X x U(x) -> X
         self.transitionFunction = transitionFunction
 
+        # successor function f: X -> [(u, x', cost)]
+        self.successorFunction = successorFunction
+
         # predecessor function f: X -> U^{-1}(x)
         self.predecessorFunction = predecessorFunction
 
         # cost function f: X x U(x) -> R^+
+        self.costCache = LRUCache(costCacheSize)
+        self.validateCosts = validateCosts
         self.costFunction = costFunction
 
         if not belongingFunction(initialState):
             raise ValueError("Initial State not in State Space")
         self.initialState = initialState
         
-        if not all(belongingFunction(state) for state in goalStates):
-            raise ValueError("Some Goal state is not in the State Space")
-        self.goalStates = goalStates
+        if goalStates is None and goalPredicate is None:
+            raise ValueError("No Goal states or Goal predicate provided")
+        if validateGoals and goalStates is not None and not isinstance(goalStates, GoalBitmap):
+            if not all(belongingFunction(state) for state in goalStates):
+                raise ValueError("Some Goal state is not in the State Space")
+        self._goalStates = goalStates
+        self._goalPredicate = goalPredicate
+        self._bindGoalTest()
         
         self.actionSpace = actionSpace
 
@@ -86,6 +140,95 @@ class DiscretePlanningProblem:
 
         return cost
 
+    @property
+    def costFunction(self) -> Callable:
+        return self._costFunction
+
+    @costFunction.setter
+    def costFunction(self, costFunction: Callable) -> None:
+        # memoized costs belong to the previous cost function
+        self._costFunction = costFunction
+        self.costCache.clear()
+        self.successorCache.clear()
+
+    @property
+    def actionFunction(self) -> Callable:
+        return self._actionFunction
+
+    @actionFunction.setter
+    def actionFunction(self, actionFunction: Callable) -> None:
+        self._actionFunction = actionFunction
+        self.successorCache.clear()
+
+    @property
+    def transitionFunction(self) -> Callable:
+        return self._transitionFunction
+
+    @transitionFunction.setter
+    def transitionFunction(self, transitionFunction: Callable) -> None:
+        self._transitionFunction = transitionFunction
+        self.successorCache.clear()
+
+    @property
+    def successorFunction(self) -> Callable:
+        return self._successorFunction
+
+    @successorFunction.setter
+    def successorFunction(self, successorFunction: Callable) -> None:
+        self._successorFunction = successorFunction
+        self.successorCache.clear()
+
+    def get_edge_cost(self, state: Any, action: Any) -> float:
+        """
+        Given a state and an action associated with the state will return cost of transition, for trusted callers
+        (ex. solvers) that obtained the action from actionFunction(state). Inputs and outputs are not validated unless
+        the problem was created with validateCosts=True, costs are memoized in a bounded LRU cache.
+        :param state: The current State belonging to the defined State Space
+        :param action:  An action associated with the state
+        :return: a non-negative cost obtained through user provided callback
+        """
+        key = (state, action)
+        cost = self.costCache.get(key)
+        if cost is None:
+            if self.validateCosts:
+                cost = self.get_cost(state, action)
+            else:
+                cost = self._costFunction(state, action)
+            self.costCache.put(key, cost)
+        return cost
+
+    def get_successors(self, state: Any, withCosts: bool = True) -> Sequence[Tuple[Any, Any, Optional[float]]]:
+        """
+        Given a state, return every (action, successor, cost) triple leaving it, for trusted callers (ex. solvers) that
+        only query states of the state space. Triples come from successorFunction if one was provided, and from
+        actionFunction, transitionFunction and costFunction otherwise (cost is None without a cost function).
+        If the successor cache is enabled results are memoized in it and shared by every solver of the problem.
+        :param state: The current State belonging to the defined State Space
+        :param withCosts: If False the caller ignores costs (ex. BFS), costFunction is not called and costs may be None
+        :return: sequence of (action, successor, cost) triples
+        """
+        cache = self.successorCache
+        if not cache.maxSize:
+            return self._generateSuccessors(state, withCosts)
+        successors = cache.get(state)
+        if successors is None:
+            successors = tuple(self._generateSuccessors(state, withCosts))
+            # cost-free triples are not cached when costs are known, later callers may need them
+            if withCosts or self._costFunction is None or self._successorFunction is not None:
+                cache.put(state, successors)
+        return successors
+
+    def _generateSuccessors(self, state: Any, withCosts: bool) -> Sequence[Tuple[Any, Any, Optional[float]]]:
+        if self._successorFunction is not None:
+            return self._successorFunction(state)
+        # costs bypass the edge cost cache, every state is usually expanded once per search
+        transitionFunction = self._transitionFunction
+        costFunction = (self.get_cost if self.validateCosts else self._costFunction) if withCosts else None
+        if costFunction is None:
+            return [(action, transitionFunction(state, action), None) for action in self._actionFunction(state)]
+        return [(action, transitionFunction(state, action), costFunction(state, action))
+                for action in self._actionFunction(state)]
+
     def get_next_states(self, state) -> list: 
         """
         Given a state, return an array of possible next states.
@@ -95,10 +238,8 @@ class DiscretePlanningProblem:
         """
         if not self.belongingFunction(state):
             raise ValueError("State Not Found in State Space")
-        
-        actions = self.actionFunction(state)
 
-        return [self.transitionFunction(state,action) for action in actions]
+        return [successor for _, successor, _ in self.get_successors(state, False)]
 
     def get_prev_states(self, state) -> list:
         """
@@ -117,9 +258,41 @@ class DiscretePlanningProblem:
 
     def is_goal_state(self, state: Any) -> bool:
         """
-        Given a state, return true if state belongs to goal states return false otherwise
+        Given a state, return true if state belongs to goal states or is accepted by the goal predicate, return false
+        otherwise
 
         :param state: the potential goal state
         """
-        #TODO: we can achieve this functionality for countable Goal Sets using a callback made by the user
-        return state in self.goalStates
+        return self._isGoal(state)
+
+    @property
+    def goalStates(self):
+        return self._goalStates
+
+    @goalStates.setter
+    def goalStates(self, goalStates) -> None:
+        self._goalStates = goalStates
+        self._bindGoalTest()
+
+    @property
+    def goalPredicate(self) -> Callable[[Any], bool]:
+        return self._goalPredicate
+
+    @goalPredicate.setter
+    def goalPredicate(self, goalPredicate: Callable[[Any], bool]) -> None:
+        self._goalPredicate = goalPredicate
+        self._bindGoalTest()
+
+    def _bindGoalTest(self) -> None:
+        # the goal test is resolved once here, is_goal_state runs once per expansion
+        goalStates, goalPredicate = self._goalStates, self._goalPredicate
+        if goalPredicate is None:
+            self._isGoal = goalStates.__contains__
+        elif goalStates is None:
+            self._isGoal = goalPredicate
+        else:
+            # a bound method rather than a closure, problems are pickled to BatchSolver worker processes
+            self._isGoal = self._inGoalStatesOrPredicate
+
+    def _inGoalStatesOrPredicate(self, state: Any) -> bool:
+        return state in self._goalStates or self._goalPredicate(state)
@@ -1,7 +1,17 @@
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Callable, Dict, Iterator, TextIO, Union
 from collections import deque
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from time import perf_counter
 import heapq
 from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from DiscretePlanning.plan import Plan
+from DiscretePlanning.stateStore import createStateIndex, CompactParentTable, CompactCostTable
+from DiscretePlanning.priorityQueue import IndexedPriorityQueue
+from DiscretePlanning.searchMetrics import SearchMetrics, timedCallbacks
+
+SOLUTION_CHUNK_SIZE = 1 << 16
 
 
 
@@ -9,6 +19,7 @@ class DiscretePlanningSolver:
     def __init__(self, problem: DiscretePlanningProblem):
         self.problem = problem
         self.solution = []
+        self.stateIndex = None # interning layer of compact solvers, shared with the plans they generate
         return
         
     def generateSolution(self) -> Optional[List[Any]]:
@@ -19,40 +30,105 @@ class DiscretePlanningSolver:
         :return: A list of states representing the solution path, or None if no solution exists.
         """
         raise NotImplementedError("The solve method must be implemented by subclasses.")
+
+    def generatePlan(self, stateIndex=None, actionIndex=None) -> Optional[Plan]:
+        """
+        Solves the planning problem and returns the solution as a compact Plan of state and action ids
+
+        :param stateIndex: Interning layer of the states, share one across plans, defaults to the solver's stateIndex
+            for 'compact' stores and to a new StateInterner otherwise
+        :param actionIndex: Interning layer of the actions, share one across plans, defaults to a new StateInterner
+        :return: Plan of the solution, or None if no solution exists
+        """
+        solution = self.generateSolution()
+        if solution is None:
+            return None
+        if stateIndex is None:
+            stateIndex = self.stateIndex
+        return Plan.fromStates(self.problem, solution, stateIndex, actionIndex)
     
-    def validateSolution(self, solution: List[Any]) -> bool:
+    def validateSolution(self, solution: List[Any], actions: Optional[List[Any]] = None) -> bool:
         """
         Determines if a successful solution provided by the solver is valid given the problem
         
-        :param solution: Nonempty List of states representing the solution path.
-        :return: A list of states representing the solution path, or None if no solution exists.
+        :param solution: Nonempty List of states or Plan representing the solution path.
+        :param actions: Optional list of the len(solution) - 1 actions taken along the path, as produced by the
+            problem's actionFunction, defaults to the actions of a Plan. When given every step is checked against the
+            cached successors of its state, or with one actionFunction and one transitionFunction call if none are
+            cached, instead of generating every successor
+        :return: True if the solution starts at the initial state, ends at a goal state and every step is a transition
         """
-        if solution == []:
+        if len(solution) == 0:
             raise ValueError("Provided Plan is Empty")
+        if actions is None and isinstance(solution, Plan):
+            actions = solution.actions
+        if actions is not None and len(actions) != len(solution) - 1:
+            raise ValueError("Provided Plan needs one action per transition")
         
-        if solution[0] != self.problem.initialState:
+        problem = self.problem
+        if solution[0] != problem.initialState:
             return False
         
-        if solution[-1] not in self.problem.goalStates:
+        if not problem.is_goal_state(solution[-1]):
             return False
+
+        belongingFunction = problem.belongingFunction
+        if actions is not None:
+            peek = problem.successorCache.peek
+            actionFunction, transitionFunction = problem.actionFunction, problem.transitionFunction
+            for state, action, nextState in zip(solution, actions, islice(solution, 1, None)):
+                if not belongingFunction(state):
+                    return False
+                successors = peek(state)
+                if successors is None:
+                    # the transition function may be defined for actions that are not applicable in this state
+                    if action not in actionFunction(state) or transitionFunction(state, action) != nextState:
+                        return False
+                    continue
+                for cachedAction, successor, _ in successors:
+                    if cachedAction == action:
+                        if successor != nextState:
+                            return False
+                        break
+                else:
+                    return False # the action is not applicable in this state
+            return True
         
         for i in range(len(solution) - 1):
             state = solution[i]
 
-            if not self.problem.belongingFunction(state):
+            if not belongingFunction(state):
                 return False
 
-            possible_succesors = self.problem.get_next_states(state)
-            if solution[i+1] not in possible_succesors:
+            # successors found by the search are reused from the problem's successor cache if it is enabled
+            nextState = solution[i+1]
+            if not any(successor == nextState for _, successor, _ in problem.get_successors(state, False)):
                 return False
 
         return True
+
+    def validateSolutions(self, solutions: List[Optional[List[Any]]],
+                          actions: Optional[List[Optional[List[Any]]]] = None) -> List[bool]:
+        """
+        Validates a batch of solutions of the problem, see validateSolution. Missing (None or empty) solutions are
+        invalid. Use BatchSolver.validate to validate plans of several queries in parallel
+
+        :param solutions: List of solutions, lists of states
+        :param actions: Optional list holding the actions of every solution, or None for solutions without actions
+        :return: List of bool, one per solution
+        """
+        if actions is None:
+            actions = [None] * len(solutions)
+        elif len(actions) != len(solutions):
+            raise ValueError("Provided actions do not match the provided solutions")
+        return [bool(solution) and self.validateSolution(solution, solutionActions)
+                for solution, solutionActions in zip(solutions, actions)]
     
     def stringifySolution(self, solution: List[Any], options=None):
         """
         Converts the solution path into a formatted string.
 
-        :param solution: List of states representing the solution path.
+        :param solution: List of states or Plan representing the solution path.
         :param options: Dictionary of options to customize the output.
             Possible options:
             - 'separator': String to separate states (default: ' -> ').
@@ -60,75 +136,260 @@ class DiscretePlanningSolver:
             - 'include_indices': Bool, whether to include indices (default: False).
         :return: A formatted string representing the solution path.
         """
+        return ''.join(self.iterSolutionChunks(solution, options))
+
+    def iterSolutionChunks(self, solution: List[Any], options=None) -> Iterator[str]:
+        """
+        Formats the solution path lazily, yielding the string of stringifySolution in chunks so that no formatted
+        string is kept per state.
+
+        :param solution: List of states or Plan representing the solution path.
+        :param options: Dictionary of options to customize the output, the options of stringifySolution and
+            - 'chunk_size': Int, number of characters after which a chunk is yielded (default: SOLUTION_CHUNK_SIZE).
+        :return: Iterator over consecutive chunks of the formatted solution path.
+        """
         if options is None:
             options = {}
         separator = options.get('separator', ' -> ')
         state_formatter = options.get('state_formatter', str)
         include_indices = options.get('include_indices', False)
+        chunk_size = options.get('chunk_size', SOLUTION_CHUNK_SIZE)
 
+        # checked before the generator is created so a missing solution is reported by the call itself
         if not solution:
             raise ValueError("Solution not found")
-        
-        formatted_solution = []
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        return self._formatSolution(solution, separator, state_formatter, include_indices, chunk_size)
+
+    def writeSolution(self, solution: List[Any], file: Union[str, Path, TextIO], options=None) -> int:
+        """
+        Streams the formatted solution path to a file, see iterSolutionChunks.
+
+        :param solution: List of states or Plan representing the solution path.
+        :param file: Path of the file to (over)write, or a text file-like object to write to.
+        :param options: Dictionary of options to customize the output, see iterSolutionChunks.
+        :return: Number of characters written.
+        """
+        chunks = self.iterSolutionChunks(solution, options)
+        if not isinstance(file, (str, Path)):
+            return sum(file.write(chunk) for chunk in chunks)
+        with open(file, 'w', encoding='utf-8') as output:
+            return sum(output.write(chunk) for chunk in chunks)
+
+    @staticmethod
+    def _formatSolution(solution: List[Any], separator: str, state_formatter: Callable[[Any], str],
+                        include_indices: bool, chunk_size: int) -> Iterator[str]:
+        parts, size = [], 0
         for i, state in enumerate(solution):
             formatted_state = state_formatter(state)
             if include_indices:
-                formatted_solution.append(f"{i+1}. {formatted_state}")
-            else:
-                formatted_solution.append(formatted_state)
+                formatted_state = f"{i+1}. {formatted_state}"
+            if i:
+                parts.append(separator)
+                size += len(separator)
+            parts.append(formatted_state)
+            size += len(formatted_state)
+            if size >= chunk_size:
+                yield ''.join(parts)
+                parts, size = [], 0
+        if parts:
+            yield ''.join(parts)
 
-        return separator.join(formatted_solution)
-# TODO: it might be better for a solution to be represented as a list of state action pairs
-#       this way solutions to multi-graph state-transition graphs are not ambiguous
 class ForwardSearch(DiscretePlanningSolver):
-    def __init__(self, problem: DiscretePlanningProblem, queue_options=None):
+    # False for algorithms that ignore edge costs, their successors are generated without calling the cost function
+    usesEdgeCosts = True
+
+    def __init__(self, problem: DiscretePlanningProblem, queue_options=None, store_options=None, metrics_options=None):
+        """
+        :param problem: Planning problem to solve, must be an instance of DiscretePlanningProblem
+        :param queue_options: Dictionary of options dictating what kind of priority queue to initialize
+            Possible Options:
+                - 'type' : Indicates the type of priority queue to initialize
+                    Possible Values:
+                        - 'deque' to use deque queue from collections package (default)
+                        - 'heapq' to use a binary heap of (priority, state) tuples using the heapq package
+                        - 'indexed' to use an IndexedPriorityQueue, a binary heap supporting decrease-key
+                  Priority queue types expose _heapPush(item) and _heapPop() for (priority, state) items,
+                  _heapPush returns the item replaced by a decrease-key (always None for 'heapq')
+        :param store_options: Dictionary of options dictating how visited states, parents and costs are stored
+            Possible Options:
+                - 'type' : Indicates the kind of tables to initialize
+                    Possible Values:
+                        - 'dict' to key dictionaries by state objects (default)
+                        - 'compact' to intern states to dense integer ids and keep parents and costs in array columns
+                - 'stateToIndex', 'indexToState', 'size' : Optional for 'compact', a bijection between states and
+                  0..size-1 used in place of interning, ex. packed grid coordinates. Without a bijection the StateInterner
+                  keeps a dictionary and a list of every reached state, which uses about as much memory as the 'dict'
+                  tables (more for BFS, whose only table is the parent table), the compact store only saves memory with a
+                  bijection such as HillClimber.compactStoreOptions()
+        :param metrics_options: Dictionary of options dictating which SearchMetrics are collected, counters are always
+            collected and exposed as self.metrics after generateSolution
+            Possible Options:
+                - 'timeCallbacks' : Bool, times the problem's actionFunction, transitionFunction and costFunction
+                  callbacks by wrapping them for the duration of the search (default: False)
+        """
         super().__init__(problem)
-        self.visitedTable = {}
+        if store_options is None:
+            store_options = {}
+        self.store_type = store_options.get('type', 'dict')
+        if self.store_type == 'dict':
+            self.stateIndex = None
+        elif self.store_type == 'compact':
+            self.stateIndex = createStateIndex(store_options)
+        else:
+            raise ValueError("Invalid Store Type Provided")
+        self.visitedTable = self._createParentTable()
+        self.expansions = 0 # states taken off the frontier by the last search
+        self.stalePops = 0 # superseded heap entries among them, counted by priority queue algorithms
+        if metrics_options is None:
+            metrics_options = {}
+        self.timeCallbacks = metrics_options.get('timeCallbacks', False)
+        self.metrics = SearchMetrics()
         if queue_options is None:
             queue_options = {}
         self.queue_type = queue_options.get('type','deque')
-        if self.queue_type == 'deque':
-                self.frontier = deque()
-        elif self.queue_type == 'heapq':
-                self.frontier = [] #empty lists are already heapified
-        else:
-            raise ValueError("Invalid Queue Type Provided")
+        self.frontier, heapPush, heapPop = self._createFrontier(self.queue_type)
+        if heapPush is not None:
+            self._heapPush = heapPush
+            self._heapPop = heapPop
         return
 
-    def addToFrontier(self, state: Any, currentState: Any = None, action: Any = None ):
-        """Add a state to the frontier. Overridden by specific algorithms."""
+    @staticmethod
+    def _createFrontier(queue_type: str):
+        """
+        Creates an empty frontier of the given queue type
+        :return: (frontier, push, pop), push and pop are the (priority, state) operations of priority queue types and
+            None for 'deque'
+        """
+        if queue_type == 'deque':
+                return deque(), None, None
+        elif queue_type == 'heapq':
+                frontier = [] #empty lists are already heapified
+                return frontier, partial(heapq.heappush, frontier), partial(heapq.heappop, frontier)
+        elif queue_type == 'indexed':
+                frontier = IndexedPriorityQueue() # one entry per state, pushing a queued state updates its priority
+                return frontier, frontier.push, frontier.pop
+        raise ValueError("Invalid Queue Type Provided")
+
+    def addToFrontier(self, state: Any, currentState: Any = None, action: Any = None, edgeCost: Optional[float] = None):
+        """Add a state to the frontier, edgeCost is the cost of action if already known. Overridden by specific algorithms."""
         raise NotImplementedError("addToFrontier must be implemented by subclasses.")
 
     def expandFrontier(self) -> Any:
         """Pop a state from the frontier. Overridden by specific algorithms."""
         raise NotImplementedError("expandFrontier must be implemented by subclasses.")
 
-    def resolveDuplicateSuccessor(self, state: Any, currentState: Any = None, action: Any = None):
-        """Resolve a duplicate successor. Overridden by some specific algorithms."""
+    def resolveDuplicateSuccessor(self, state: Any, currentState: Any = None, action: Any = None,
+                                  edgeCost: Optional[float] = None):
+        """Resolve a duplicate successor, edgeCost is the cost of action if already known. Overridden by some specific algorithms."""
         return
 
     def generateSolution(self) -> Optional[List[Any]]:
+        """
+        Searches for a path from the initial state to a goal state, the search counters are exposed as self.metrics
+        :return: List of states from the initial state to a goal state, None if no goal state is reachable
+        """
+        return self._measured(self._search)
+
+    def _measured(self, search: Callable, *args) -> Any:
+        """
+        Runs search(*args) from a cleared search memory, its counters and timers are exposed as self.metrics
+        :return: The result of search
+        """
+        self._resetSearch()
+        self.metrics = metrics = SearchMetrics()
+        start = perf_counter()
+        if self.timeCallbacks:
+            with timedCallbacks(self.problem, metrics):
+                result = search(*args)
+        else:
+            result = search(*args)
+        metrics.elapsed = perf_counter() - start
+        return result
+
+    def _resetSearch(self) -> None:
+        """Discards the frontier, tables and counters of a previous search, extended by algorithms keeping more memory"""
+        self.solution = []
+        self.visitedTable = self._createParentTable()
+        self.frontier, heapPush, heapPop = self._createFrontier(self.queue_type)
+        if heapPush is not None:
+            self._heapPush = heapPush
+            self._heapPop = heapPop
+        self.expansions = 0
+        self.stalePops = 0
+
+    def _search(self) -> Optional[List[Any]]:
         problem = self.problem
         visitedTable = self.visitedTable # if entry present state visited, value corresponds to preceding value
+        frontier = self.frontier
+        usesEdgeCosts = self.usesEdgeCosts
         self.addToFrontier(problem.initialState)
         visitedTable[problem.initialState] = None
-        while self.frontier:
+        solution = None
+        generated = duplicates = peakFrontier = 0
+        while frontier:
+            if len(frontier) > peakFrontier:
+                peakFrontier = len(frontier)
             currentState = self.expandFrontier()
+            self.expansions += 1
 
             if problem.is_goal_state(currentState):
                 self._generateSolutionPath(currentState, visitedTable)
-                return self.solution
+                solution = self.solution
+                break
 
-            for action in problem.actionFunction(currentState):
-                successor = problem.transitionFunction(currentState, action)
+            for action, successor, edgeCost in problem.get_successors(currentState, usesEdgeCosts):
+                generated += 1
                 if successor not in visitedTable:
                     visitedTable[successor] = currentState
-                    self.addToFrontier(successor, currentState, action)
+                    self.addToFrontier(successor, currentState, action, edgeCost)
                 else:
-                    self.resolveDuplicateSuccessor(successor, currentState, action)
-        return None
+                    duplicates += 1
+                    self.resolveDuplicateSuccessor(successor, currentState, action, edgeCost)
+        self._recordMetrics(generated, duplicates, peakFrontier, self.expansions)
+        return solution
+
+    def _recordMetrics(self, generated: int, duplicates: int, peakFrontier: int, pops: int) -> None:
+        """
+        Fills self.metrics with the counters of a finished search
+        :param pops: Number of entries taken off the frontier, one per expansion unless stale entries are skipped
+        """
+        metrics = self.metrics
+        metrics.expansions = self.expansions
+        metrics.generated = generated
+        metrics.duplicates = duplicates
+        metrics.pushes = pops + self._unpoppedPushes(self.frontier)
+        metrics.stalePops = self.stalePops
+        metrics.peakFrontier = max(peakFrontier, len(self.frontier))
+        metrics.peakVisited = len(self.visitedTable)
+
+    @staticmethod
+    def _unpoppedPushes(frontier) -> int:
+        """
+        Number of pushes into a frontier that were not popped, every pushed entry is either popped, still queued or,
+        for an 'indexed' queue, replaced by a later push of the same state
+        """
+        if isinstance(frontier, IndexedPriorityQueue):
+            return len(frontier) + frontier.replacements
+        return len(frontier)
+
+    def _createParentTable(self):
+        """Creates an empty visitation table (state -> preceding state) of the configured store type"""
+        if self.stateIndex is None:
+            return {}
+        return CompactParentTable(self.stateIndex)
+
+    def _createCostTable(self):
+        """Creates an empty cost table (state -> cost) of the configured store type, sharing the state ids"""
+        if self.stateIndex is None:
+            return {}
+        return CompactCostTable(self.stateIndex)
 
     def _generateSolutionPath(self, currentState: Any, visitedTable: Dict):
+        if isinstance(visitedTable, CompactParentTable):
+            self.solution = visitedTable.pathTo(currentState)
+            return
         self.solution = []
         while currentState is not None:
             self.solution.append(currentState)
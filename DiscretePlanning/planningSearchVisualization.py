@@ -1,19 +1,51 @@
 from DiscretePlanning.planningProblem import DiscretePlanningProblem
 from DiscretePlanning.planningSearch import DiscretePlanningSolver, ForwardSearch
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from json import dumps, dump
+from DiscretePlanning.logSerializers import LogSerializer, createSerializer
+from typing import Dict, Any, Optional, List, Union
+from collections.abc import Mapping
 from logging import basicConfig, WARNING, warning
+from queue import Queue, Empty
+from threading import Thread
 
 MAX_LINES_PER_FILE = 20000
+LOG_QUEUE_SIZE = 256
+KEYFRAME_INTERVAL = 1000
+# values the JSON encoder writes as they are
+JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+def ensureParentDirectory(file: Path, createParent: bool) -> None:
+    """
+    Ensures the parent directory of a log or plan file exists
+    :param file: Path of the file about to be written
+    :param createParent: determines if the parent directory should be created when missing
+    """
+    if not file.parent.exists():
+        if not createParent:
+            raise ValueError(f'Parent Directory {file.parent} does not exist')
+        try:
+            file.parent.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            raise IOError(f"Failed to create directory {file.parent}: {e}")
 
 class SearchLogger():
-    def __init__(self, logFile: Path, maxLines: int = MAX_LINES_PER_FILE) -> None:
+    def __init__(self, logFile: Path, maxLines: int = MAX_LINES_PER_FILE,
+                 logFormat: Union[str, LogSerializer] = 'json') -> None:
         """
         Initializes an instance of search logger
         :param logFile: path to Logfile, by default relative to repository root
         :param maxLine: Optional, determines threshold after which the logFile is switched to a new index
+        :param logFormat: Optional, record format of the log file, a LogSerializer or the name of a built-in one.
+            Logs are recognized by suffix when replayed, so logFile must end with the suffix of its format
+            Possible Values:
+                - 'json' a JSON array of indented entries, closed by closeLog (default, '.json')
+                - 'jsonl' JSON Lines, one compact entry per line, appended without any bracket bookkeeping ('.jsonl')
+                - 'binary' length-prefixed binary records, see BinaryRecordSerializer ('.slog')
         """
+        self.serializer = createSerializer(logFormat)
+        suffix = self.serializer.suffix
+        if suffix and logFile.suffix != suffix:
+            raise ValueError(f"Log file {logFile} does not end with '{suffix}', the suffix its log format is read back by")
         self.logFile = logFile
         self.stem = logFile.stem
         self.log_entries = []
@@ -31,11 +63,11 @@ class SearchLogger():
         :param event: Meant to indicate the step in the search algorithm being executed
         :param entry: A dictionary containing any state variables needed to communicate program state, ex. frontier, visited states, etc
         """
-        safe_entry = self._makeSafe(entry)
+        # entries are only made JSON compatible here, they are serialized once by logWrite
         try:
-            dumps(safe_entry)
+            safe_entry = self._makeSafe(entry)
             self.log_entries.append({"Event": event, "Entry": safe_entry})
-        except (ValueError, TypeError) as err:
+        except (ValueError, TypeError, RecursionError) as err:
             self.log_entries.append({"Event": event, "Entry": "<unstringifiable entry>", "Error": str(err)})
             warning(f'Failed to Stringify Log Entry: {err}')
 
@@ -55,30 +87,9 @@ class SearchLogger():
         create_parent = options.get("createParent", False)
 
         # Ensure the directory exists
-        if not self.logFile.parent.exists():
-            if not create_parent:
-                raise ValueError(f'Parent Directory {self.logFile.parent} does not exist')
-            try:
-                self.logFile.parent.mkdir(parents=True, exist_ok=True)
-            except Exception as e:
-                raise IOError(f"Failed to create directory {self.logFile.parent}: {e}")
-
-        # Check if the file exists to determine how to write (open/close brackets)
-        is_new_file = not self.logFile.exists()
+        self._ensureParentDirectory(create_parent)
 
-        with open(self.logFile.resolve(), 'a') as file:
-
-            for i, entry in enumerate(self.log_entries):
-                if is_new_file and i == 0:
-                    file.write("[\n")
-                entry.update({"Log Entry Number": self.entryNumber})
-                self.entryNumber += 1
-                json_entry = dumps(entry, indent=4)
-                if not is_new_file or i > 0:
-                    file.write(",\n")  # Add a comma between entries if not the first one
-                file.write(json_entry)
-
-                self.lines += json_entry.count('\n') + 1
+        self._writeRecords()
 
         if self.lines >= self.maxLines:
             self.closeLog()
@@ -87,20 +98,62 @@ class SearchLogger():
         self._reset()
         return
 
+    def _writeRecords(self) -> None:
+        """
+        Appends the current log entries to the log file, each entry is serialized exactly once
+        """
+        serializer = self.serializer
+        chunks = []
+        with open(self.logFile.resolve(), serializer.mode) as file:
+            # an empty pre-existing file is treated as new
+            has_records = file.tell() > 0
+            for entry in self.log_entries:
+                entry.update({"Log Entry Number": self.entryNumber})
+                self.entryNumber += 1
+                record = serializer.serialize(entry)
+                chunks.append(serializer.separator if has_records else serializer.header)
+                chunks.append(record)
+                chunks.append(serializer.terminator)
+                has_records = True
+                self.lines += serializer.lineCount(record)
+            file.write(serializer.join(chunks))
+        return
+
     def closeLog(self) -> None:
         """
-        Closes the JSON array in the log file, ensuring valid JSON formatting.
+        Writes the footer of the log format if the log file does not end with it yet, ex. closes the JSON array of the
+        'json' format ensuring valid JSON formatting, formats without a footer need no closing.
         Must be called at the end of execution of search algorithm
         """
+        footer = self.serializer.footer
+        if not footer:
+            return
+        if isinstance(footer, str):
+            footer = footer.encode()
         is_new_file = not self.logFile.exists()
         if is_new_file:
             return
 
-        with open(self.logFile.resolve(), 'r+') as file:
-            content = file.read().strip()
-            if content and content[-1] != ']':
-                file.seek(0, 2)  # Move to the end of the file
-                file.write("\n]")
+        with open(self.logFile.resolve(), 'rb+') as file:
+            # only the tail of the file is read, scanning backwards past trailing whitespace
+            position = file.seek(0, 2)
+            while position > 0:
+                step = min(64, position)
+                position -= step
+                file.seek(position)
+                tail = file.read(step).rstrip()
+                if tail:
+                    if not tail.endswith(footer.strip()):
+                        file.seek(0, 2)  # Move to the end of the file
+                        file.write(footer)
+                    return
+
+    def _ensureParentDirectory(self, create_parent: bool) -> None:
+        """
+        Ensures the parent directory of the current log file exists
+        :param create_parent: determines if the parent directory should be created when missing
+        """
+        ensureParentDirectory(self.logFile, create_parent)
 
     def _switchLogFile(self):
         """
@@ -128,103 +181,406 @@ class SearchLogger():
         return
 
     def _makeSafe(self, entry: Dict) -> Dict:
-        """Recursively ensures that the dictionary keys are stringifiable and values are serializable."""
-        safe_entry = {}
+        """Recursively ensures that the dictionary keys are strings and values are JSON compatible, by type."""
         if entry is None:
-            return safe_entry
-        for key, value in entry.items():
-            safe_key = str(key)
+            return {}
+        scalarTypes = JSON_SCALAR_TYPES
+        makeSafeValue = self._makeSafeValue
+        return {(key if type(key) is str else str(key)): (value if type(value) in scalarTypes else makeSafeValue(value))
+                for key, value in entry.items()}
+
+    def _makeSafeValue(self, value: Any) -> Any:
+        scalarTypes = JSON_SCALAR_TYPES
+        if type(value) in scalarTypes:
+            return value
+        if isinstance(value, (list, tuple)):
+            # sequences of scalars, ex. grid states, are already JSON compatible
+            if all(type(item) in scalarTypes for item in value):
+                return value
+            return [self._makeSafeValue(item) for item in value]
+        if isinstance(value, Mapping):
+            return self._makeSafe(value)
+        if isinstance(value, (str, int, float)):
+            return value
+        try:
+            return repr(value)
+        except Exception:
+            return f"<unrepresentable object of type {type(value).__name__}>"
 
-            try:
-                dumps(value)
-                safe_value = value
-            except (TypeError, ValueError):
+class ConcurrentSearchLogger(SearchLogger):
+    def __init__(self, logFile: Path, maxLines: int = MAX_LINES_PER_FILE, queueSize: int = LOG_QUEUE_SIZE,
+                 logFormat: Union[str, LogSerializer] = 'json') -> None:
+        """
+        Initializes a search logger whose file I/O is performed by a background writer thread.
+        Entries are serialized by the caller and handed to the writer through a bounded queue, the writer keeps a single
+        file handle open and writes queued batches together.
+        :param logFile: path to Logfile, by default relative to repository root
+        :param maxLines: Optional, determines threshold after which the logFile is switched to a new index
+        :param queueSize: Optional, maximum number of pending batches before logWrite blocks on the writer
+        :param logFormat: Optional, record format of the log file, see SearchLogger
+        """
+        super().__init__(logFile, maxLines, logFormat)
+        self._queue = Queue(maxsize=queueSize)
+        self._writer = None
+        self._writerError = None
+        return
+
+    def logWrite(self, options=None) -> None:
+        """
+        Hands the current log entries to the background writer, does not block on file I/O unless the queue is full.
+        Ensures that the directory exists before handing entries over.
+
+        :param options: Write Options Dictionary
+            Possible options:
+                - 'createParent': determines if the parent directory should be created when missing (default: False)
+        """
+        if options is None:
+            options = {}
+        create_parent = options.get("createParent", False)
+
+        self._raiseWriterError()
+        self._ensureParentDirectory(create_parent)
+
+        batch = []
+        for entry in self.log_entries:
+            entry.update({"Log Entry Number": self.entryNumber})
+            self.entryNumber += 1
+            batch.append(self.serializer.serialize(entry))
+
+        if self._writer is None:
+            self._writer = Thread(target=self._writerLoop, name="SearchLoggerWriter", daemon=True)
+            self._writer.start()
+        self._queue.put(batch)
+
+        self._reset()
+        return
+
+    def closeLog(self) -> None:
+        """
+        Flushes all pending entries, writes the footer of the log format and stops the background writer.
+        Must be called at the end of execution of search algorithm
+        """
+        if self._writer is None:
+            return
+        self._queue.put(None)
+        self._writer.join()
+        self._writer = None
+        self._raiseWriterError()
+
+    def _raiseWriterError(self) -> None:
+        """
+        Re-raises an error encountered by the background writer in the calling thread
+        """
+        if self._writerError is not None:
+            err, self._writerError = self._writerError, None
+            raise IOError(f"Background log writer failed on {self.logFile}: {err}")
+
+    def _writerLoop(self) -> None:
+        """
+        Background writer, consumes batches of serialized entries until the close sentinel is received.
+        """
+        serializer = self.serializer
+        file = None
+        has_entries = False
+        running = True
+        while running:
+            batches = [self._queue.get()]
+            # Drain whatever else is pending so it can be written in one go
+            while batches[-1] is not None:
                 try:
-                    safe_value = repr(value)
-                except Exception:
-                    safe_value = f"<unrepresentable object of type {type(value).__name__}>"
+                    batches.append(self._queue.get_nowait())
+                except Empty:
+                    break
+            if batches[-1] is None:
+                batches.pop()
+                running = False
+
+            if self._writerError is not None:
+                continue  # keep draining so producers never block on a dead writer
+            try:
+                for batch in batches:
+                    if file is None:
+                        file = open(self.logFile.resolve(), serializer.mode)
+                        # an empty pre-existing file is treated as new
+                        has_entries = file.tell() > 0
+                    chunks = []
+                    for record in batch:
+                        chunks.append(serializer.separator if has_entries else serializer.header)
+                        chunks.append(record)
+                        chunks.append(serializer.terminator)
+                        has_entries = True
+                        self.lines += serializer.lineCount(record)
+                    file.write(serializer.join(chunks))
+
+                    if self.lines >= self.maxLines:
+                        file.write(serializer.footer)
+                        file.close()
+                        file = None
+                        self.file_index += 1
+                        self.lines = 0
+                        self._changeLogFile(self.logFile.with_stem(f"{self.stem}_{self.file_index}"))
+            except Exception as err:
+                self._writerError = err
+
+        if file is not None:
+            try:
+                if has_entries:
+                    file.write(serializer.footer)
+                file.close()
+            except Exception as err:
+                self._writerError = err
+        return
 
-            if isinstance(value, dict):
-                safe_value = self._makeSafe(value)
+class SearchDelta():
+    def __init__(self, keyframeInterval: int = KEYFRAME_INTERVAL) -> None:
+        """
+        Accumulates the changes made to the search memory between two log events, used by the delta log encoding
+        :param keyframeInterval: number of logged events between two full snapshots of the search memory
+        """
+        if keyframeInterval < 1:
+            raise ValueError("Keyframe interval must be a positive integer")
+        self.keyframeInterval = keyframeInterval
+        self.eventsSinceKeyframe = keyframeInterval # first logged event is always a keyframe
+        self._clear()
+        return
+
+    def recordParent(self, state: Any, parent: Any) -> None:
+        self.parents[state] = parent
+
+    def recordCost(self, state: Any, cost: float) -> None:
+        self.costs[state] = cost
 
-            safe_entry[safe_key] = safe_value
+    def recordPush(self, item: Any) -> None:
+        self.pushed.append(item)
 
-        return safe_entry
+    def recordPop(self, item: Any) -> None:
+        self.popped.append(item)
+
+    def keyframeDue(self) -> bool:
+        """
+        Counts a logged event, returns True when the event should carry a keyframe instead of a delta
+        """
+        if self.eventsSinceKeyframe >= self.keyframeInterval:
+            self.eventsSinceKeyframe = 1
+            self._clear()
+            return True
+        self.eventsSinceKeyframe += 1
+        return False
+
+    def flush(self) -> Dict:
+        """
+        Returns the changes recorded since the last logged event and starts a new delta
+        """
+        delta = {}
+        if self.parents:
+            delta["Parents"] = self.parents
+        if self.costs:
+            delta["Costs"] = self.costs
+        if self.pushed:
+            delta["Pushed"] = self.pushed
+        if self.popped:
+            delta["Popped"] = self.popped
+        self._clear()
+        return delta
+
+    def _clear(self) -> None:
+        self.parents = {}
+        self.costs = {}
+        self.pushed = []
+        self.popped = []
 
 class VisualizableForwardSearch(ForwardSearch):
-    def __init__(self, problem: DiscretePlanningProblem, logFile: Path, queue_options: Optional[Dict]=None , createParent: bool = False) -> None:
+    def __init__(self, problem: DiscretePlanningProblem, logFile: Optional[Path], queue_options: Optional[Dict]=None , createParent: bool = False,
+                 log_options: Optional[Dict] = None, store_options: Optional[Dict] = None,
+                 metrics_options: Optional[Dict] = None) -> None:
         """
         initializes search class with logfile
         :param problem: Planning problem to solve, must be an instance of DiscretePlanningProblem
-        :param logFile: Path object representing the logFile
+        :param logFile: Path object representing the logFile, if None the search runs without instrumentation
+            (no log entries are built or serialized) and returns the same solution as the logged search
         :param queue_options: Dictionary of options dictating what kind of priority queue to initialize
             Possible Options:
                 - 'type' : Indicates the type of priority queue to initialize
                     Possible Values:
                         - 'deque' to use deque queue from collections package (used for FIFO/LIFO style implementations)
                         - 'heapq' to use a binary heap using the heapq package
+                        - 'indexed' to use a binary heap supporting decrease-key
         :param createParent: Boolean indicating if the parent directory should be created when missing (default: False)
+        :param log_options: Dictionary of options dictating how the search log is written
+            Possible Options:
+                - 'concurrent' : Bool, hands log writes to a background writer thread (default: False)
+                - 'queueSize' : Maximum number of pending writes for the concurrent logger (default: LOG_QUEUE_SIZE)
+                - 'maxLines' : Lines after which the log is switched to a new file (default: MAX_LINES_PER_FILE)
+                - 'format' : Record format of the log file, 'json' for an indented JSON array (default), 'jsonl' for
+                  JSON Lines with one compact event per line, 'binary' for length-prefixed binary records or a
+                  LogSerializer instance, logFile must end with the format's suffix, see SearchLogger
+                - 'encoding' : How the search memory is recorded in each event
+                    Possible Values:
+                        - 'snapshot' every event carries the full Frontier, Visitation Table and Cost Table (default)
+                        - 'delta' events carry only the changes since the previous event, with periodic full keyframes
+                - 'keyframeInterval' : Events between two keyframes of the delta encoding (default: KEYFRAME_INTERVAL)
+                - 'solution' : How the solution is recorded in the "Solution Generated" event
+                    Possible Values:
+                        - 'embed' the stringified solution is stored in the event (default)
+                        - 'file' the solution is streamed to a plan file that the event references, for huge plans
+                - 'solutionFile' : Path of the plan file (default: '<log file stem>_solution.txt' next to the log file)
+                - 'solutionOptions' : Formatting options of the solution, see DiscretePlanningSolver.iterSolutionChunks
+        :param store_options: Dictionary of options dictating how visited states, parents and costs are stored,
+            see ForwardSearch
+        :param metrics_options: Dictionary of options dictating which SearchMetrics are collected, see ForwardSearch
         """
-        super().__init__(problem, queue_options)
-        self.logger = SearchLogger(logFile)
+        super().__init__(problem, queue_options, store_options, metrics_options)
+        if log_options is None:
+            log_options = {}
+        # the execution path is fixed here, algorithms only build log entries when instrumented
+        self.instrumented = logFile is not None
+        self.logger = self._createLogger(logFile, log_options) if self.instrumented else None
         self.parentOption = createParent
-        self.visitedTable = {}
 
-    def generateSolution(self) -> Optional[List[Any]]:
+        self.solutionOutput = log_options.get('solution', 'embed')
+        if self.solutionOutput not in ('embed', 'file'):
+            raise ValueError("Invalid Solution Output Provided")
+        self.solutionOptions = log_options.get('solutionOptions')
+        self.solutionFile = None
+        if self.instrumented and self.solutionOutput == 'file':
+            solutionFile = log_options.get('solutionFile')
+            self.solutionFile = logFile.with_name(f"{logFile.stem}_solution.txt") if solutionFile is None \
+                else Path(solutionFile)
+
+        self.logEncoding = log_options.get('encoding', 'snapshot')
+        if not self.instrumented:
+            self._delta = None
+        elif self.logEncoding == 'snapshot':
+            self._delta = None
+        elif self.logEncoding == 'delta':
+            self._delta = SearchDelta(log_options.get('keyframeInterval', KEYFRAME_INTERVAL))
+        else:
+            raise ValueError("Invalid Log Encoding Provided")
+
+    def _resetSearch(self) -> None:
+        super()._resetSearch()
+        if self._delta is not None:
+            # the first event of every logged search is a keyframe
+            self._delta = SearchDelta(self._delta.keyframeInterval)
+
+    def _search(self) -> Optional[List[Any]]:
+        if not self.instrumented:
+            return super()._search()
+
         problem = self.problem
         visitedTable = self.visitedTable # if entry present state visited, value corresponds to preceding value
         self.addToFrontier(problem.initialState)
         visitedTable[problem.initialState] = None
-        self.logger.logState("Initialization Event", {"Frontier": str(self.frontier), "Visitation Table": visitedTable})
+        self._recordParent(problem.initialState, None)
+        self._logEvent("Initialization Event", {})
 
+        generated = duplicates = peakFrontier = 0
         while self.frontier:
+            peakFrontier = max(peakFrontier, len(self.frontier))
             currentState = self.expandFrontier()
-            self.logger.logState("State Consideration", {"Frontier": str(self.frontier), "Visitation Table": visitedTable, "State": currentState})
+            self.expansions += 1
+            self._logEvent("State Consideration", {"State": currentState})
 
             if problem.is_goal_state(currentState):
-                self.logger.logState("Goal State Recognized", {"Frontier": str(self.frontier), "Visitation Table": visitedTable, "State": currentState})
+                self._logEvent("Goal State Recognized", {"State": currentState})
 
                 self._generateSolutionPath(currentState, visitedTable)
 
-                self.logger.logState("Solution Generated", {"Frontier": str(self.frontier), "Visitation Table": visitedTable, "State": currentState, "Solution" : self.stringifySolution(self.solution)})
+                self._logEvent("Solution Generated", {"State": currentState, **self._solutionEntry()})
                 self.logger.logWrite(options={"createParent": self.parentOption})
                 self.logger.closeLog()
                 self.logger._reset()
+                self._recordMetrics(generated, duplicates, peakFrontier, self.expansions)
                 return self.solution
 
             self.logger.logWrite(options={"createParent": self.parentOption})
-            for action in problem.actionFunction(currentState):
-                successor = problem.transitionFunction(currentState, action)
-                self.logger.logState("Considering Successor",
-                                     {"Frontier": str(self.frontier), "Visitation Table": visitedTable,
-                                      "State": currentState, "Successor": successor, "Action": action})
+            for action, successor, edgeCost in problem.get_successors(currentState, self.usesEdgeCosts):
+                generated += 1
+                self._logEvent("Considering Successor", {"State": currentState, "Successor": successor, "Action": action})
                 self.logger.logWrite(options={"createParent": self.parentOption})
                 if successor not in visitedTable:
                     visitedTable[successor] = currentState
-                    self.addToFrontier(successor, currentState, action)
+                    self._recordParent(successor, currentState)
+                    self.addToFrontier(successor, currentState, action, edgeCost)
 
-                    self.logger.logState("Successor Not Previously Visited, Added to Memory",
-                                         {"Frontier": str(self.frontier), "Visitation Table": visitedTable,
-                                          "State": currentState, "Successor": successor, "Action": action})
+                    self._logEvent("Successor Not Previously Visited, Added to Memory",
+                                   {"State": currentState, "Successor": successor, "Action": action})
                 else:
-                    self.logger.logState("State Previously Visited, Resolving Duplicate",
-                                         {"Frontier": str(self.frontier), "Visitation Table": visitedTable,
-                                          "State": currentState, "Successor": successor, "Action": action})
-
-                    self.resolveDuplicateSuccessor(successor, currentState, action)
+                    self._logEvent("State Previously Visited, Resolving Duplicate",
+                                   {"State": currentState, "Successor": successor, "Action": action})
+                    duplicates += 1
+                    self.resolveDuplicateSuccessor(successor, currentState, action, edgeCost)
 
-        self.logger.logState("No Solution Generated", {"Frontier": self.frontier, "Visitation Table": visitedTable, "Solution": None})
+        self._logEvent("No Solution Generated", {"Solution": None})
         self.logger.logWrite(options={"createParent":self.parentOption})
         self.logger.closeLog()
         self.logger._reset()
+        self._recordMetrics(generated, duplicates, peakFrontier, self.expansions)
         return None
-    # TODO: We can get a good speedup if logger acts concurrently, this way search algorithm does not have to block itself for I/O operations
-    def _generateSolutionPath(self, currentState: Any, visitedTable: Dict):
-        self.solution = []
-        while currentState is not None:
-            self.solution.append(currentState)
-            currentState = visitedTable[currentState]
-
-        self.solution.reverse()
+
+    def _logEvent(self, event: str, entry: Dict) -> None:
+        """
+        Logs an event together with the search memory, encoded as described by the 'encoding' log option.
+        Snapshot events carry the full Frontier, Visitation Table and Cost Table, delta events carry a "Delta" entry
+        holding the parents set, costs set, frontier pushes and frontier pops since the previous event, and every
+        keyframeInterval events a "Keyframe" entry holding the full memory instead.
+
+        :param event: Meant to indicate the step in the search algorithm being executed
+        :param entry: Dictionary of event specific variables, search memory is added by this method
+        """
+        if self._delta is None:
+            self.logger.logState(event, {**self._snapshot(str(self.frontier)), **entry})
+        elif self._delta.keyframeDue():
+            self.logger.logState(event, {**entry, "Keyframe": self._snapshot(list(self.frontier))})
+        else:
+            self.logger.logState(event, {**entry, "Delta": self._delta.flush()})
         return
 
+    def _snapshot(self, frontier: Any) -> Dict:
+        snapshot = {"Frontier": frontier, "Visitation Table": self.visitedTable}
+        costTable = getattr(self, 'costTable', None)
+        if costTable is not None:
+            snapshot["Cost Table"] = costTable
+        return snapshot
+
+    def _recordParent(self, state: Any, parent: Any) -> None:
+        if self._delta is not None:
+            self._delta.recordParent(state, parent)
+
+    def _recordCost(self, state: Any, cost: float) -> None:
+        if self._delta is not None:
+            self._delta.recordCost(state, cost)
+
+    def _recordPush(self, item: Any, replaced: Any = None) -> None:
+        if self._delta is not None:
+            if replaced is not None:
+                self._delta.recordPop(replaced) # a decrease-key removes the previous item of the state
+            self._delta.recordPush(item)
+
+    def _recordPop(self, item: Any) -> None:
+        if self._delta is not None:
+            self._delta.recordPop(item)
+
+    def _solutionEntry(self) -> Dict[str, Any]:
+        """
+        Builds the solution fields of the "Solution Generated" event, writing the plan file first if the solution is
+        not embedded in the log
+        """
+        if self.solutionOutput == 'embed':
+            return {"Solution": self.stringifySolution(self.solution, self.solutionOptions)}
+        # the plan file can be written before any log shard, so its directory is checked like the log file's
+        ensureParentDirectory(self.solutionFile, self.parentOption)
+        self.writeSolution(self.solution, self.solutionFile, self.solutionOptions)
+        return {"Solution File": str(self.solutionFile), "Solution Length": len(self.solution)}
+
+    def _createLogger(self, logFile: Path, log_options: Dict) -> SearchLogger:
+        """
+        Creates the search logger described by the log options
+        :param logFile: Path object representing the logFile
+        :param log_options: Dictionary of log options, see __init__
+        """
+        maxLines = log_options.get('maxLines', MAX_LINES_PER_FILE)
+        logFormat = log_options.get('format', 'json')
+        if log_options.get('concurrent', False):
+            return ConcurrentSearchLogger(logFile, maxLines, log_options.get('queueSize', LOG_QUEUE_SIZE), logFormat)
+        return SearchLogger(logFile, maxLines, logFormat)
@@ -0,0 +1,123 @@
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class IndexedPriorityQueue:
+    """
+    Binary min-heap of (priority, state) items holding at most one item per state.
+    A position index (state -> heap slot) allows pushing a state that is already queued to update its priority in
+    place (decrease-key), so no stale items are left in the heap and no state is popped twice for one insertion.
+    Items are ordered exactly as heapq orders (priority, state) tuples.
+
+    Attributes
+    ----------
+    replacements : int
+        Number of pushes that replaced the queued item of their state instead of inserting one
+    """
+    def __init__(self) -> None:
+        self.heap: List[Tuple[float, Any]] = []
+        self.position: Dict[Any, int] = {}
+        self.replacements = 0
+
+    def push(self, item: Tuple[float, Any]) -> Optional[Tuple[float, Any]]:
+        """
+        Inserts a (priority, state) item, or replaces the queued item of the same state
+        :param item: (priority, state) tuple
+        :return: The replaced item if the state was already queued, None otherwise
+        """
+        state = item[1]
+        index = self.position.get(state)
+        if index is None:
+            self.heap.append(item)
+            self.position[state] = len(self.heap) - 1
+            self._siftUp(len(self.heap) - 1)
+            return None
+
+        replaced = self.heap[index]
+        self.heap[index] = item
+        self.replacements += 1
+        if item < replaced:
+            self._siftUp(index)
+        else:
+            self._siftDown(index)
+        return replaced
+
+    def pop(self) -> Tuple[float, Any]:
+        """
+        Removes and returns the (priority, state) item with the lowest priority
+        """
+        heap = self.heap
+        last = heap.pop()
+        if not heap:
+            del self.position[last[1]]
+            return last
+        top = heap[0]
+        heap[0] = last
+        self.position[last[1]] = 0
+        del self.position[top[1]]
+        self._siftDown(0)
+        return top
+
+    def priority(self, state: Any) -> float:
+        """
+        Returns the priority of a queued state
+        """
+        return self.heap[self.position[state]][0]
+
+    def __contains__(self, state: Any) -> bool:
+        return state in self.position
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __bool__(self) -> bool:
+        return bool(self.heap)
+
+    def __getitem__(self, index: int) -> Tuple[float, Any]:
+        # index 0 is the lowest priority item, as for heapq lists
+        return self.heap[index]
+
+    def __iter__(self) -> Iterator[Tuple[float, Any]]:
+        return iter(self.heap)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, IndexedPriorityQueue):
+            return self.heap == other.heap
+        return self.heap == other
+
+    def __str__(self) -> str:
+        return str(self.heap)
+
+    def __repr__(self) -> str:
+        return f'IndexedPriorityQueue({self.heap!r})'
+
+    def _siftUp(self, index: int) -> None:
+        heap, position = self.heap, self.position
+        item = heap[index]
+        while index > 0:
+            parentIndex = (index - 1) >> 1
+            parent = heap[parentIndex]
+            if not item < parent:
+                break
+            heap[index] = parent
+            position[parent[1]] = index
+            index = parentIndex
+        heap[index] = item
+        position[item[1]] = index
+
+    def _siftDown(self, index: int) -> None:
+        heap, position = self.heap, self.position
+        size = len(heap)
+        item = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if not heap[child] < item:
+                break
+            heap[index] = heap[child]
+            position[heap[index][1]] = index
+            index = child
+        heap[index] = item
+        position[item[1]] = index
@@ -0,0 +1,102 @@
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from typing import Callable, Dict, Iterator
+from DiscretePlanning.planningProblem import DiscretePlanningProblem
+
+# problem callbacks timed when metrics_options['timeCallbacks'] is set
+TIMED_CALLBACKS = ('actionFunction', 'transitionFunction', 'costFunction', 'successorFunction')
+
+class SearchMetrics:
+    """
+    Counters and timers of the last generateSolution (or generateShortestPathTree) call of a ForwardSearch or GridSearch,
+    collected without search logging. Every call starts from zero
+
+    ...
+
+    Attributes
+    ----------
+    expansions : int
+        States popped from the frontier and expanded
+    generated : int
+        Successors generated from the expanded states
+    duplicates : int
+        Generated successors that were already visited and handed to resolveDuplicateSuccessor
+    pushes : int
+        Entries inserted into the frontier, decrease-key updates of an 'indexed' queue included
+    stalePops : int
+        Pops of heap entries superseded by a cheaper entry of the same state, always 0 for 'deque' and 'indexed'
+    peakFrontier : int
+        Largest number of entries held by the frontier, stale entries included
+    peakVisited : int
+        Number of states in the visitation table when the search ended
+    elapsed : float
+        Seconds spent in generateSolution
+    callbackTime : dict
+        Seconds spent in each problem callback, only measured if callback timing was enabled
+    callbackCalls : dict
+        Number of calls to each problem callback, only counted if callback timing was enabled. With the successor cache
+        enabled callbacks only run on cache misses, costFunction is never called by algorithms ignoring edge costs
+
+    Methods
+    -------
+    searchTime : Seconds of elapsed not spent in timed callbacks.
+
+    asDict : Return the metrics as a JSON compatible dictionary.
+    """
+    def __init__(self) -> None:
+        self.expansions = 0
+        self.generated = 0
+        self.duplicates = 0
+        self.pushes = 0
+        self.stalePops = 0
+        self.peakFrontier = 0
+        self.peakVisited = 0
+        self.elapsed = 0.0
+        self.callbackTime: Dict[str, float] = dict.fromkeys(TIMED_CALLBACKS, 0.0)
+        self.callbackCalls: Dict[str, int] = dict.fromkeys(TIMED_CALLBACKS, 0)
+
+    def searchTime(self) -> float:
+        return self.elapsed - sum(self.callbackTime.values())
+
+    def asDict(self) -> Dict:
+        entry = {key: value for key, value in vars(self).items() if not isinstance(value, dict)}
+        entry['callbackTime'] = dict(self.callbackTime)
+        entry['callbackCalls'] = dict(self.callbackCalls)
+        entry['searchTime'] = self.searchTime()
+        return entry
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.asDict()!r})'
+
+
+def _timed(callback: Callable, name: str, metrics: SearchMetrics) -> Callable:
+    callbackTime = metrics.callbackTime
+    callbackCalls = metrics.callbackCalls
+
+    @wraps(callback)
+    def timedCallback(*args):
+        start = perf_counter()
+        try:
+            return callback(*args)
+        finally:
+            callbackTime[name] += perf_counter() - start
+            callbackCalls[name] += 1
+    return timedCallback
+
+
+@contextmanager
+def timedCallbacks(problem: DiscretePlanningProblem, metrics: SearchMetrics) -> Iterator[None]:
+    """
+    Replaces the problem callbacks by timing wrappers for the duration of a search and restores them afterwards.
+    Callbacks are swapped without clearing the edge cost and successor caches.
+    """
+    callbacks = {name: getattr(problem, '_' + name) for name in TIMED_CALLBACKS}
+    for name, callback in callbacks.items():
+        if callback is not None:
+            setattr(problem, '_' + name, _timed(callback, name, metrics))
+    try:
+        yield
+    finally:
+        for name, callback in callbacks.items():
+            setattr(problem, '_' + name, callback)
@@ -0,0 +1,103 @@
+from math import inf
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Union
+import pickle
+from DiscretePlanning.stateStore import CompactParentTable
+
+SHORTEST_PATH_TREE_VERSION = 1
+
+class ShortestPathTree:
+    """
+    Result of a single source Dijkstra search run to exhaustion or to a cost bound, answers path and cost queries to
+    any reached state by walking parents, without searching again
+
+    ...
+
+    Attributes
+    ----------
+    root :
+        The source state of the search
+    costTable : Mapping
+        state -> least cost from the root, for every reached state
+    visitedTable : Mapping
+        state -> preceding state on a least cost path, None for the root
+    costBound : float
+        Cost bound the search was run to, None if it ran to exhaustion
+
+    Methods
+    -------
+    pathTo : Given a state, return the least cost path from the root to it.
+
+    costTo : Given a state, return its least cost from the root.
+
+    save : Pickle the tree to a file.
+
+    load : Load a tree saved by save.
+    """
+    def __init__(self, root: Any, costTable: Mapping, visitedTable: Mapping, costBound: Optional[float] = None):
+        """
+        :param root: The source state of the search
+        :param costTable: Table of least costs from the root, dictionary or CompactCostTable
+        :param visitedTable: Table of preceding states, dictionary or CompactParentTable
+        :param costBound: Cost bound the search was run to, None if it ran to exhaustion
+        """
+        self.root = root
+        self.costTable = costTable
+        self.visitedTable = visitedTable
+        self.costBound = costBound
+
+    def __contains__(self, state: Any) -> bool:
+        return state in self.costTable
+
+    def __len__(self) -> int:
+        return len(self.costTable)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.costTable)
+
+    def costTo(self, state: Any) -> float:
+        """
+        :param state: Any state
+        :return: Least cost from the root to the state, inf if it was not reached
+        """
+        return self.costTable[state] if state in self.costTable else inf
+
+    def pathTo(self, state: Any) -> Optional[List[Any]]:
+        """
+        Rebuilds the least cost path to a state in O(path length)
+        :param state: Any state
+        :return: List of states from the root to the state, None if it was not reached
+        """
+        if state not in self.costTable:
+            return None
+        visitedTable = self.visitedTable
+        if isinstance(visitedTable, CompactParentTable):
+            return visitedTable.pathTo(state)
+        path = []
+        while state is not None:
+            path.append(state)
+            state = visitedTable[state]
+        path.reverse()
+        return path
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Pickles the tree, compact tables are saved as dictionaries so the state bijection does not need to be picklable
+        :param path: File to write
+        """
+        data = {'version': SHORTEST_PATH_TREE_VERSION, 'root': self.root, 'costBound': self.costBound,
+                'costTable': dict(self.costTable.items()), 'visitedTable': dict(self.visitedTable.items())}
+        with Path(path).open('wb') as file:
+            pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'ShortestPathTree':
+        """
+        Loads a tree written by save, only load files from trusted sources as they are unpickled
+        :param path: File to read
+        """
+        with Path(path).open('rb') as file:
+            data: Dict = pickle.load(file)
+        if not isinstance(data, dict) or data.get('version') != SHORTEST_PATH_TREE_VERSION:
+            raise ValueError(f"{path} is not a saved ShortestPathTree")
+        return cls(data['root'], data['costTable'], data['visitedTable'], data['costBound'])
@@ -0,0 +1,210 @@
+from array import array
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+NO_PARENT = -1  # parent id stored for the root of the search tree
+ABSENT = -2     # parent id stored for ids that are not in the table
+ABSENT_COST = float('nan')
+
+
+class StateInterner:
+    """
+    Maps every state seen by a search to a dense integer id, ids are assigned in order of first appearance.
+    Interning keeps a state -> id dictionary and an id -> state list, so compact tables over an interner are not smaller
+    than dictionaries keyed by states (a BFS parent table is larger), they only pay off over a StateEncoder bijection.
+
+    Attributes
+    ----------
+    ids : dict
+        state -> id
+    states : list
+        id -> state
+    """
+    def __init__(self) -> None:
+        self.ids = {}
+        self.states = []
+
+    def intern(self, state: Any) -> int:
+        """
+        Return the id of a state, assigning the next free id if the state was never seen
+        """
+        index = self.ids.get(state)
+        if index is None:
+            index = len(self.states)
+            self.ids[state] = index
+            self.states.append(state)
+        return index
+
+    def find(self, state: Any) -> Optional[int]:
+        """
+        Return the id of a state, or None if the state was never interned
+        """
+        return self.ids.get(state)
+
+    def state(self, index: int) -> Any:
+        return self.states[index]
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+
+class StateEncoder:
+    """
+    Interning layer for state spaces that already have a bijection onto 0..size-1, ex. grid cells packed as y*W+x.
+    No per state Python objects are kept, ids are computed by the user provided callbacks.
+    """
+    def __init__(self, stateToIndex: Callable[[Any], int], indexToState: Callable[[int], Any], size: int) -> None:
+        """
+        :param stateToIndex: A function that maps a state to its integer id in [0, size)
+        :param indexToState: The inverse of stateToIndex
+        :param size: The number of states in the state space
+        """
+        self.stateToIndex = stateToIndex
+        self.indexToState = indexToState
+        self.size = size
+
+    def intern(self, state: Any) -> int:
+        index = self.stateToIndex(state)
+        if not 0 <= index < self.size:
+            raise ValueError(f"State {state!r} maps to id {index}, outside of [0, {self.size})")
+        return index
+
+    def find(self, state: Any) -> Optional[int]:
+        """
+        Return the id of a state, or None if it falls outside of [0, size)
+        """
+        index = self.stateToIndex(state)
+        return index if 0 <= index < self.size else None
+
+    def state(self, index: int) -> Any:
+        if not 0 <= index < self.size:
+            raise IndexError(f"State id {index} outside of [0, {self.size})")
+        return self.indexToState(index)
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class _CompactTable(MutableMapping):
+    """
+    Dictionary-like table keyed by states whose values live in a typed array column indexed by state id.
+    Tables created on the same interner share the state ids.
+    """
+    typecode = 'q'
+    absent = ABSENT
+
+    def __init__(self, index) -> None:
+        self.index = index
+        self.column = array(self.typecode)
+        self._length = 0
+        if isinstance(index, StateEncoder):
+            self.column = array(self.typecode, [self.absent]) * index.size
+
+    def _isAbsent(self, value) -> bool:
+        return value == self.absent
+
+    def _encode(self, value: Any):
+        return value
+
+    def _decode(self, value):
+        return value
+
+    def _slot(self, state: Any) -> int:
+        index = self.index.intern(state)
+        if index < 0:
+            # negative ids would wrap around to the slot of another state
+            raise ValueError(f"State {state!r} maps to negative id {index}")
+        column = self.column
+        if index >= len(column):
+            column.extend(array(self.typecode, [self.absent]) * (index + 1 - len(column)))
+        return index
+
+    def __setitem__(self, state: Any, value: Any) -> None:
+        index = self._slot(state)
+        if self._isAbsent(self.column[index]):
+            self._length += 1
+        self.column[index] = self._encode(value)
+
+    def __getitem__(self, state: Any) -> Any:
+        index = self.index.find(state)
+        if index is None or not 0 <= index < len(self.column) or self._isAbsent(self.column[index]):
+            raise KeyError(state)
+        return self._decode(self.column[index])
+
+    def __contains__(self, state: Any) -> bool:
+        index = self.index.find(state)
+        return index is not None and 0 <= index < len(self.column) and not self._isAbsent(self.column[index])
+
+    def __delitem__(self, state: Any) -> None:
+        index = self.index.find(state)
+        if index is None or not 0 <= index < len(self.column) or self._isAbsent(self.column[index]):
+            raise KeyError(state)
+        self.column[index] = self.absent
+        self._length -= 1
+
+    def __iter__(self) -> Iterator[Any]:
+        for index, value in enumerate(self.column):
+            if not self._isAbsent(value):
+                yield self.index.state(index)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({dict(self.items())!r})'
+
+
+class CompactParentTable(_CompactTable):
+    """
+    Replacement for a visitation table (state -> preceding state), parents are stored as ids in an array('q')
+    """
+    def _encode(self, parent: Any) -> int:
+        return NO_PARENT if parent is None else self.index.intern(parent)
+
+    def _decode(self, parentIndex: int) -> Any:
+        return None if parentIndex == NO_PARENT else self.index.state(parentIndex)
+
+    def pathTo(self, state: Any) -> List[Any]:
+        """
+        Rebuilds the path from the root of the search tree to a state by walking parent ids
+        :param state: A state present in the table
+        :return: List of states from the root to the given state
+        """
+        column = self.column
+        index = self.index.find(state)
+        if index is None or not 0 <= index < len(column) or column[index] == ABSENT:
+            raise KeyError(state)
+        ids = []
+        while index != NO_PARENT:
+            ids.append(index)
+            index = column[index]
+        return [self.index.state(index) for index in reversed(ids)]
+
+
+class CompactCostTable(_CompactTable):
+    """
+    Replacement for a cost table (state -> cost), costs are stored in an array('d')
+    """
+    typecode = 'd'
+    absent = ABSENT_COST
+
+    def _isAbsent(self, value) -> bool:
+        return value != value  # NaN marks absent entries
+
+    def _decode(self, value: float) -> float:
+        return value
+
+
+def createStateIndex(store_options: Dict):
+    """
+    Creates the interning layer described by a store options dictionary with 'type' set to 'compact'
+    :param store_options: see ForwardSearch
+    """
+    stateToIndex = store_options.get('stateToIndex')
+    if stateToIndex is None:
+        return StateInterner()
+    indexToState = store_options.get('indexToState')
+    size = store_options.get('size')
+    if indexToState is None or size is None:
+        raise ValueError("'stateToIndex' store option requires 'indexToState' and 'size'")
+    return StateEncoder(stateToIndex, indexToState, size)
@@ -117,6 +117,22 @@ class test_AStar(unittest.TestCase):
         solution = self.solver.generateSolution()
         self.assertIsNotNone(solution)
         self.assertTrue(self.solver.validateSolution(solution))
+
+    def test_AStar_no_logging(self):
+        self.problem.costFunction = self.special_costFunction
+        quietSolver = ForwardAStar(problem=self.problem, heuristic=self.hueristicFunction)
+        self.assertFalse(quietSolver.instrumented)
+        self.assertIsNone(quietSolver.logger)
+        self.assertEqual(quietSolver.generateSolution(), self.solver.generateSolution())
+        self.assertEqual(quietSolver.costTable, self.solver.costTable)
+        self.assertEqual(quietSolver.visitedTable, self.solver.visitedTable)
+
+    def test_AStar_indexed_queue(self):
+        self.problem.costFunction = self.special_costFunction
+        indexedSolver = ForwardAStar(problem=self.problem, heuristic=self.hueristicFunction, queue_options={'type': 'indexed'})
+        solution = indexedSolver.generateSolution()
+        self.assertEqual(solution, self.solver.generateSolution())
+        self.assertEqual(indexedSolver.costTable, self.solver.costTable)
 if __name__ == '__main__':
     unittest.main()
     #TODO: weird bug where initial cost calculations appear before initialization event
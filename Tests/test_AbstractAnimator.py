@@ -1,9 +1,13 @@
 import unittest
-from DiscretePlanning.Animators import AbstractAnimator
+from DiscretePlanning.Animators import AbstractAnimator, iter_log_events
 from pathlib import Path
 from unittest.mock import patch, MagicMock, Mock, mock_open, call, create_autospec
 from typing import Dict
 from json import loads, JSONDecodeError, dumps
+from io import StringIO
+from ast import literal_eval
+from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from DiscretePlanning.forwardSearchAlgorithms import ForwardDijkstraSearch
 
 class ConcreteAnimator(AbstractAnimator):
     def save_animation(self, output_file: str):
@@ -203,7 +207,7 @@ class test_AbstractAnimator(unittest.TestCase):
             self.assertTrue("No JSON files found in directory" in str(context.exception))
 
     # ~~~~ _get_next() ~~~~
-    @patch.object(Path, attribute='read_text', return_value=mock_read_1)
+    @patch.object(Path, attribute='open', new_callable=lambda: mock_open(read_data=mock_read_1))
     @patch.object(Path, attribute='glob', return_value=[Path('test1.json')])
     @patch.object(Path, attribute='exists', return_value=True)
     def test_AbstractAnimator_get_next_success(self,mock_exists, mock_glob, mock_open):
@@ -233,16 +237,16 @@ class test_AbstractAnimator(unittest.TestCase):
     @patch.object(Path, attribute='glob', return_value=[Path('test_1.json'), Path('test_2.json'), Path('test_3.json')])
     @patch.object(Path, attribute='exists', return_value=True)
     def test_AbstractAnimator_get_next_success_multiple_files(self,mock_exists, mock_glob):
-        def mock_file_read(self):
+        def mock_file_open(self, *args, **kwargs):
             if self.name == 'test_1.json':
                 content = mock_read_1
             elif self.name == 'test_2.json':
                 content = mock_read_2
             else:
                 content = mock_read_3
-            return content
+            return StringIO(content)
 
-        with patch.object(Path, 'read_text', new=mock_file_read):
+        with patch.object(Path, 'open', new=mock_file_open):
             animator = ConcreteAnimator(self.json_dir)
 
             #file1
@@ -299,7 +303,7 @@ class test_AbstractAnimator(unittest.TestCase):
             '{name: "John"}'  # Non-string key
         ]
         for invalid_json in invalid_json_examples:
-            with patch.object(Path, 'read_text', return_value=invalid_json):
+            with patch.object(Path, 'open', mock_open(read_data=invalid_json)):
                 animator = ConcreteAnimator(self.json_dir)
                 with self.assertRaises(JSONDecodeError) as context:
                     animator._get_next()
@@ -307,7 +311,7 @@ class test_AbstractAnimator(unittest.TestCase):
 
     @patch.object(Path, attribute='glob', return_value=[Path('test1.json')])
     @patch.object(Path, attribute='exists', return_value=True)
-    @patch.object(Path, 'read_text', side_effect=IOError("File Error"))
+    @patch.object(Path, 'open', side_effect=IOError("File Error"))
     def test_AbstractAnimator_get_next_fail_IO_Error(self, mock_read, mock_exists, mock_glob):
         animator = ConcreteAnimator(self.json_dir)
         with self.assertRaises(IOError) as context:
@@ -316,7 +320,7 @@ class test_AbstractAnimator(unittest.TestCase):
 
     @patch.object(Path, attribute='glob', return_value=[Path('test1.json')])
     @patch.object(Path, attribute='exists', return_value=True)
-    @patch.object(Path, 'read_text', side_effect=FileNotFoundError)
+    @patch.object(Path, 'open', side_effect=FileNotFoundError)
     def test_AbstractAnimator_get_next_fail_UnknownError(self, mock_read, mock_exists, mock_glob):
         animator = ConcreteAnimator(self.json_dir)
         with self.assertRaises(Exception) as context:
@@ -326,7 +330,7 @@ class test_AbstractAnimator(unittest.TestCase):
     # ~~~~ _validate_event ~~~~
     @patch.object(Path, attribute='glob', return_value=[Path('test1.json')])
     @patch.object(Path, attribute='exists', return_value=True)
-    @patch.object(Path, 'read_text', return_value=mock_read_combined)
+    @patch.object(Path, 'open', new_callable=lambda: mock_open(read_data=mock_read_combined))
     def test_AbstractAnimator_validate_event_success(self, mock_read, mock_exists, mock_glob):
         #initialize Animator
         animator = ConcreteAnimator(self.json_dir)
@@ -821,7 +825,7 @@ class test_AbstractAnimator(unittest.TestCase):
         expected_call_sequences = [(1,3,1,3,1,3), (1,2,1,2,2,2,1), (3,3,3), (2,2,2,2)]
 
         read_data = dumps(event_sequence_dict)
-        with patch.object(Path, attribute='read_text', return_value=read_data):
+        with patch.object(Path, attribute='open', new=mock_open(read_data=read_data)):
             animator = ConcreteAnimator(self.json_dir)
             animator.setup_animation = MagicMock(name="setup_animation")
             animator.save_animation = MagicMock(name="save_animation")
@@ -842,5 +846,164 @@ class test_AbstractAnimator(unittest.TestCase):
         return
         # with patch.object(Path, 'read_text',return_value=):
 
+class test_AbstractAnimator_delta_log(unittest.TestCase):
+    grid = {
+        'A': {'right': ('B', 2.0), 'down': ('D', 1.0)},
+        'B': {'left': ('A', 2.0), 'right': ('C', 2.0), 'down': ('E', 3.0)},
+        'C': {'left': ('B', 2.0), 'down': ('F', 2.0)},
+        'D': {'up': ('A', 1.0), 'right': ('E', 4.0), 'down': ('G', 2.0)},
+        'E': {'up': ('B', 3.0), 'left': ('D', 4.0), 'right': ('F', 1.0), 'down': ('H', 2.0)},
+        'F': {'up': ('C', 2.0), 'left': ('E', 1.0), 'down': ('I', 3.0)},
+        'G': {'up': ('D', 2.0), 'right': ('H', 3.0)},
+        'H': {'up': ('E', 2.0), 'left': ('G', 3.0), 'right': ('I', 2.0)},
+        'I': {'up': ('F', 3.0), 'left': ('H', 2.0)}
+    }
+
+    def setUp(self):
+        self.problem = DiscretePlanningProblem(lambda state: state in self.grid,
+                                               lambda state: set(self.grid[state].keys()),
+                                               lambda state, action: self.grid[state][action][0],
+                                               'A', {'I'},
+                                               costFunction=lambda state, action: self.grid[state][action][1])
+        self.snapshot_dir = Path("Tests/TestPath/Snapshot")
+        self.delta_dir = Path("Tests/TestPath/Delta")
+
+    def tearDown(self):
+        for directory in [self.snapshot_dir, self.delta_dir]:
+            for file in directory.glob("*.json"):
+                file.unlink()
+            directory.rmdir()
+        self.snapshot_dir.parent.rmdir()
+
+    def test_AbstractAnimator_reconstruct_snapshot_from_delta_log(self):
+        self._assert_delta_log_reconstructs_snapshots({'type': 'heapq'})
+
+    def test_AbstractAnimator_reconstruct_snapshot_from_delta_log_indexed_queue(self):
+        self._assert_delta_log_reconstructs_snapshots({'type': 'indexed'})
+
+    def _assert_delta_log_reconstructs_snapshots(self, queue_options):
+        ForwardDijkstraSearch(self.problem, self.snapshot_dir / "log.json", True,
+                              queue_options=queue_options).generateSolution()
+        ForwardDijkstraSearch(self.problem, self.delta_dir / "log.json", True, queue_options=queue_options,
+                              log_options={'encoding': 'delta', 'keyframeInterval': 7}).generateSolution()
+
+        snapshot_events = loads((self.snapshot_dir / "log.json").read_text())
+        delta_events = loads((self.delta_dir / "log.json").read_text())
+        self.assertEqual(len(snapshot_events), len(delta_events))
+        self.assertTrue(any("Delta" in event["Entry"] for event in delta_events))
+
+        animator = ConcreteAnimator(self.delta_dir)
+        reconstructed = []
+        def reconstruct_callback(event: Dict) -> None:
+            reconstructed.append(animator.reconstruct_snapshot())
+        animator.subscribe_to_event({event["Event"] for event in delta_events}, reconstruct_callback, "reconstruct")
+        animator.run("")
+
+        self.assertEqual(len(reconstructed), len(snapshot_events))
+        for snapshot, event in zip(reconstructed, snapshot_events):
+            expected = event["Entry"]
+            self.assertEqual(snapshot["Visitation Table"], expected["Visitation Table"])
+            self.assertEqual(snapshot["Cost Table"], expected["Cost Table"])
+            expected_frontier = [list(item) for item in literal_eval(expected["Frontier"])]
+            self.assertCountEqual(snapshot["Frontier"], expected_frontier)
+
+class test_AbstractAnimator_jsonl_log(unittest.TestCase):
+    def setUp(self):
+        self.problem = DiscretePlanningProblem(lambda state: state in test_AbstractAnimator_delta_log.grid,
+                                               lambda state: set(test_AbstractAnimator_delta_log.grid[state].keys()),
+                                               lambda state, action: test_AbstractAnimator_delta_log.grid[state][action][0],
+                                               'A', {'I'},
+                                               costFunction=lambda state, action: test_AbstractAnimator_delta_log.grid[state][action][1])
+        self.json_dir = Path("Tests/TestPath/Json")
+        self.jsonl_dir = Path("Tests/TestPath/JsonLines")
+
+    def tearDown(self):
+        for directory in [self.json_dir, self.jsonl_dir]:
+            for file in directory.glob("*"):
+                file.unlink()
+            directory.rmdir()
+        self.json_dir.parent.rmdir()
+
+    def _replay(self, directory: Path):
+        animator = ConcreteAnimator(directory)
+        events = []
+        event = animator._get_next()
+        while event is not None:
+            events.append(event)
+            event = animator._get_next()
+        return events
+
+    def test_AbstractAnimator_reads_jsonl_log(self):
+        ForwardDijkstraSearch(self.problem, self.json_dir / "log.json", True,
+                              log_options={'maxLines': 300}).generateSolution()
+        ForwardDijkstraSearch(self.problem, self.jsonl_dir / "log.jsonl", True,
+                              log_options={'format': 'jsonl', 'maxLines': 20}).generateSolution()
+        self.assertGreater(len(list(self.jsonl_dir.glob("*.jsonl"))), 1)
+        json_events = self._replay(self.json_dir)
+        jsonl_events = self._replay(self.jsonl_dir)
+        self.assertEqual(len(jsonl_events), len(json_events))
+        self.assertEqual([event["Log Entry Number"] for event in jsonl_events],
+                         list(range(1, len(json_events) + 1)))
+
+    def test_AbstractAnimator_reads_binary_log(self):
+        ForwardDijkstraSearch(self.problem, self.json_dir / "log.json", True).generateSolution()
+        ForwardDijkstraSearch(self.problem, self.jsonl_dir / "log.slog", True,
+                              log_options={'format': 'binary', 'maxLines': 20}).generateSolution()
+        self.assertGreater(len(list(self.jsonl_dir.glob("*.slog"))), 1)
+        self.assertEqual(self._replay(self.jsonl_dir), self._replay(self.json_dir))
+
+class test_iter_log_events(unittest.TestCase):
+    def setUp(self):
+        self.dir = Path("Tests/TestPath/Reader")
+        self.dir.mkdir(parents=True, exist_ok=True)
+
+    def tearDown(self):
+        for file in self.dir.glob("*"):
+            file.unlink()
+        self.dir.rmdir()
+        self.dir.parent.rmdir()
+
+    def test_iter_log_events_matches_loads_for_any_chunk_size(self):
+        path = self.dir / "log.json"
+        path.write_text(mock_read_combined)
+        expected = loads(mock_read_combined)
+        for chunk_size in [1, 2, 7, 64, 1 << 16]:
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(list(iter_log_events(path, chunk_size)), expected)
+
+    def test_iter_log_events_large_events_and_scalars(self):
+        path = self.dir / "log.json"
+        events = [{"Event": "Big", "Entry": {"Data": "x" * 5000}, "Log Entry Number": 1}, 12345, [1, 2], "text"]
+        path.write_text(dumps(events, indent=4))
+        self.assertEqual(list(iter_log_events(path, 16)), events)
+        path.write_text("[]")
+        self.assertEqual(list(iter_log_events(path, 16)), [])
+
+    def test_iter_log_events_jsonl(self):
+        path = self.dir / "log.jsonl"
+        expected = loads(mock_read_combined)
+        path.write_text("\n".join(dumps(event) for event in expected) + "\n\n")
+        self.assertEqual(list(iter_log_events(path)), expected)
+
+    def test_iter_log_events_invalid(self):
+        path = self.dir / "log.json"
+        for invalid in ['', '[{"a": 1}', '[{"a": 1} {"b": 2}]', '[{"a": 1},]', '[{"a": 1}] extra', '{"a": 1}']:
+            with self.subTest(invalid=invalid):
+                path.write_text(invalid)
+                with self.assertRaises(JSONDecodeError):
+                    list(iter_log_events(path, 4))
+
+    def test_AbstractAnimator_reads_shards_in_numeric_order(self):
+        for index in [0, 2, 10, 1]:
+            name = "log.json" if index == 0 else f"log_{index}.json"
+            (self.dir / name).write_text(dumps([{"Event": "Event", "Entry": {}, "Log Entry Number": index}]))
+        animator = ConcreteAnimator(self.dir)
+        numbers = []
+        event = animator._get_next()
+        while event is not None:
+            numbers.append(event["Log Entry Number"])
+            event = animator._get_next()
+        self.assertEqual(numbers, [0, 1, 2, 10])
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
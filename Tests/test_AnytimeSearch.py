@@ -0,0 +1,97 @@
+import unittest
+from math import hypot
+import numpy as np
+from DiscretePlanning.anytimeSearch import ForwardARAStar, AnytimeSolution
+from DiscretePlanning.forwardSearchAlgorithms import ForwardDijkstraSearch, ForwardWeightedAStar
+from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from DiscretePlanning.Environments.HillClimber import HillClimber
+
+def height_function(x, y):
+    return 10 * np.sin(x / 6) * np.cos(y / 9) + 8 * np.exp(-((x - 20)**2 + (y - 20)**2) / 60)
+
+def distance_to_goal(state):
+    return hypot(state[0] - 39, state[1])
+
+class TestAnytimeSearch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.climber = HillClimber(height_function, (40, 40), (0, 39), {(39, 0)}, stateEncoding='tuple')
+        dijkstra = ForwardDijkstraSearch(cls.climber.problem)
+        dijkstra.generateSolution()
+        cls.leastCost = dijkstra.costTable[(39, 0)]
+        cls.dijkstraExpansions = dijkstra.expansions
+
+    def test_invalid_options(self):
+        problem = self.climber.problem
+        with self.assertRaises(ValueError):
+            ForwardWeightedAStar(problem, weight=0.5)
+        with self.assertRaises(ValueError):
+            ForwardARAStar(problem, initialWeight=0.5)
+        with self.assertRaises(ValueError):
+            ForwardARAStar(problem, weightStep=0.0)
+
+    def test_weighted_AStar_bound(self):
+        for weight in [1.0, 1.5, 3.0]:
+            with self.subTest(weight=weight):
+                solver = ForwardWeightedAStar(self.climber.problem, heuristic=distance_to_goal, weight=weight)
+                solution = solver.generateSolution()
+                self.assertTrue(solver.validateSolution(solution))
+                cost = solver.costTable[(39, 0)]
+                self.assertLessEqual(cost, weight * self.leastCost + 1e-9)
+                if weight == 1.0:
+                    self.assertAlmostEqual(cost, self.leastCost, places=9)
+                else:
+                    self.assertLess(solver.expansions, self.dijkstraExpansions)
+
+    def test_ARAStar_improves_to_optimal(self):
+        solver = ForwardARAStar(self.climber.problem, distance_to_goal, initialWeight=3.0, weightStep=0.5)
+        published = list(solver.iterSolutions())
+        self.assertEqual(published, solver.solutions)
+        self.assertGreaterEqual(len(published), 1)
+        for solution in published:
+            self.assertIsInstance(solution, AnytimeSolution)
+            self.assertTrue(solver.validateSolution(solution.solution))
+            self.assertLessEqual(solution.cost, solution.bound * self.leastCost + 1e-9)
+            self.assertLessEqual(solution.bound, solution.weight)
+        for previous, current in zip(published, published[1:]):
+            self.assertLess(current.cost, previous.cost)
+            self.assertGreaterEqual(current.expansions, previous.expansions)
+        self.assertAlmostEqual(published[-1].cost, self.leastCost, places=9)
+        self.assertEqual(published[-1].bound, 1.0)
+        self.assertEqual(solver.metrics.expansions, solver.expansions)
+
+    def test_ARAStar_budgets(self):
+        solver = ForwardARAStar(self.climber.problem, distance_to_goal, expansionBudget=200)
+        solution = solver.generateSolution()
+        self.assertTrue(solver.validateSolution(solution))
+        self.assertLessEqual(solver.expansions, 200)
+        self.assertGreater(solver.solutions[-1].bound, 1.0)
+        self.assertIsNone(ForwardARAStar(self.climber.problem, distance_to_goal, expansionBudget=5).generateSolution())
+        self.assertIsNotNone(ForwardARAStar(self.climber.problem, distance_to_goal, timeBudget=60.0).generateSolution())
+
+    def test_ARAStar_trivial_and_unreachable(self):
+        problem = DiscretePlanningProblem(lambda state: state in 'ABZ', lambda state: {'next'} if state == 'A' else set(),
+                                          lambda state, action: 'B', 'A', {'Z'}, costFunction=lambda state, action: 1.0)
+        self.assertIsNone(ForwardARAStar(problem).generateSolution())
+        problem.goalStates = {'A'}
+        solver = ForwardARAStar(problem)
+        self.assertEqual(solver.generateSolution(), ['A'])
+        self.assertEqual(solver.solutions[-1].bound, 1.0)
+
+    def test_ARAStar_runs_twice(self):
+        edges = {0: {'a': (1, 1.0), 'b': (2, 1.0)}, 1: {'c': (3, 1.0)}, 2: {'c': (3, 5.0)}, 3: {}}
+        problem = DiscretePlanningProblem(lambda state: state in edges, lambda state: set(edges[state]),
+                                          lambda state, action: edges[state][action][0], 0, {3},
+                                          costFunction=lambda state, action: edges[state][action][1])
+        for options in [{}, {'expansionBudget': 10}, {'store_options': {'type': 'compact'}}]:
+            with self.subTest(options=options):
+                solver = ForwardARAStar(problem, **options)
+                first = solver.generateSolution()
+                firstSolutions = [solution._replace(elapsed=0.0) for solution in solver.solutions]
+                self.assertEqual(first, [0, 1, 3])
+                self.assertEqual(solver.generateSolution(), first)
+                self.assertEqual([solution._replace(elapsed=0.0) for solution in solver.solutions], firstSolutions)
+                self.assertEqual(solver.metrics.expansions, firstSolutions[-1].expansions)
+
+if __name__ == '__main__':
+    unittest.main()
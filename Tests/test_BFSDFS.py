@@ -4,6 +4,7 @@ import unittest
 from typing import Any, Set
 from pathlib import Path
 from os import remove, rmdir
+from tempfile import TemporaryDirectory
 
 class testForwardBFS(unittest.TestCase):
     def actionFunction(self,state: str) -> Set[str]:
@@ -58,6 +59,36 @@ class testForwardBFS(unittest.TestCase):
         self.assertIsNotNone(solution)
         self.assertTrue(self.solver.validateSolution(solution))
 
+    def test_BFS_no_logging(self):
+        quietSolver = ForwardBFS(self.problem)
+        self.assertFalse(quietSolver.instrumented)
+        self.assertEqual(quietSolver.generateSolution(), self.solver.generateSolution())
+        self.assertEqual(quietSolver.visitedTable, self.solver.visitedTable)
+
+class testSolutionFile(unittest.TestCase):
+    def setUp(self):
+        # the initial state is a goal, so the plan file is written before any log shard
+        self.problem = DiscretePlanningProblem(lambda x: x in 'AB', lambda state: {'move'},
+                                               lambda state, action: 'B' if state == 'A' else 'A', 'A', {'A'})
+
+    def test_missing_directory_created(self):
+        with TemporaryDirectory() as directory:
+            logFile = Path(directory) / 'logs' / 'ForwardBFS.json'
+            solutionFile = Path(directory) / 'plans' / 'plan.txt'
+            solver = ForwardBFS(self.problem, logFile, True,
+                                log_options={'solution': 'file', 'solutionFile': solutionFile})
+            self.assertEqual(solver.generateSolution(), ['A'])
+            self.assertEqual(solutionFile.read_text(encoding='utf-8'), solver.stringifySolution(['A']))
+            self.assertTrue(logFile.exists())
+
+    def test_missing_directory_rejected(self):
+        with TemporaryDirectory() as directory:
+            logFile = Path(directory) / 'logs' / 'ForwardBFS.json'
+            solver = ForwardBFS(self.problem, logFile, False, log_options={'solution': 'file'})
+            with self.assertRaises(ValueError):
+                solver.generateSolution()
+            self.assertFalse(logFile.parent.exists())
+
 class testForwardDFS(unittest.TestCase):
     def actionFunction(self,state: str) -> Set[str]:
         grid = {
@@ -111,6 +142,12 @@ class testForwardDFS(unittest.TestCase):
         self.assertIsNotNone(solution)
         self.assertTrue(self.solver.validateSolution(solution))
 
+    def test_DFS_no_logging(self):
+        quietSolver = ForwardDFS(self.problem)
+        self.assertFalse(quietSolver.instrumented)
+        self.assertEqual(quietSolver.generateSolution(), self.solver.generateSolution())
+        self.assertEqual(quietSolver.visitedTable, self.solver.visitedTable)
+
 
 # TODO: Implement a more robust automated test for BFS/DFS behaviour, avoid manual inspection of search log
 if __name__ == '__main__':
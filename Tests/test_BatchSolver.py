@@ -0,0 +1,64 @@
+import unittest
+import numpy as np
+from DiscretePlanning.batchSolver import BatchSolver, QueryResult
+from DiscretePlanning.forwardSearchAlgorithms import ForwardBFS, ForwardDijkstraSearch
+from DiscretePlanning.Environments.HillClimber import HillClimber
+
+def height_function(x, y):
+    return 20 * np.exp(-((x - 8)**2 + (y - 8)**2) / 20) + 8 * np.exp(-((x - 15)**2 + (y - 15)**2) / 30)
+
+# module level so the factories can be pickled into worker processes
+def climberFactory():
+    return HillClimber(height_function, (20, 20), (0, 0), {(19, 19)}, stateEncoding='tuple')
+
+class TestBatchSolver(unittest.TestCase):
+    queries = [((1, 19), {(19, 1)}), ((0, 0), {(10, 10)}), ((5, 5), {(5, 5)}), ((19, 19), {(0, 0), (19, 0)})]
+
+    def expected(self, solverClass):
+        solutions = []
+        for initialState, goalStates in self.queries:
+            problem = HillClimber(height_function, (20, 20), initialState, goalStates, stateEncoding='tuple').problem
+            solutions.append(solverClass(problem).generateSolution())
+        return solutions
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            BatchSolver(climberFactory, maxWorkers=-1)
+        with self.assertRaises(ValueError):
+            BatchSolver(climberFactory, chunkSize=0)
+
+    def test_serial_matches_single_queries(self):
+        results = BatchSolver(climberFactory, maxWorkers=1).solve(self.queries)
+        self.assertEqual([result.solution for result in results], self.expected(ForwardDijkstraSearch))
+        for result, (initialState, goalStates) in zip(results, self.queries):
+            self.assertIsInstance(result, QueryResult)
+            self.assertEqual((result.initialState, result.goalStates), (initialState, goalStates))
+            self.assertGreaterEqual(result.elapsed, 0.0)
+            self.assertGreater(result.expansions, 0)
+        self.assertEqual(results[2].solution, [(5, 5)])
+        self.assertEqual(results[2].expansions, 1)
+
+    def test_process_pool_preserves_order(self):
+        for chunkSize in [1, 3]:
+            with self.subTest(chunkSize=chunkSize):
+                results = BatchSolver(climberFactory, ForwardBFS, maxWorkers=2, chunkSize=chunkSize).solve(self.queries)
+                self.assertEqual([result.solution for result in results], self.expected(ForwardBFS))
+                self.assertEqual([result.initialState for result in results], [query[0] for query in self.queries])
+
+    def test_validate(self):
+        results = BatchSolver(climberFactory, maxWorkers=1).solve(self.queries)
+        invalid = [((1, 19), {(19, 1)}, [(1, 19), (19, 1)]), ((0, 0), {(1, 1)}, None),
+                   ((0, 0), {(1, 1)}, [(0, 0), (1, 1)], ['up-right']), ((0, 0), {(1, 1)}, [(0, 0), (1, 1)], ['up'])]
+        expected = [True] * len(results) + [False, False, True, False]
+        for maxWorkers in [1, 2]:
+            with self.subTest(maxWorkers=maxWorkers):
+                self.assertEqual(BatchSolver(climberFactory, maxWorkers=maxWorkers).validate(results + invalid), expected)
+        self.assertEqual(BatchSolver(climberFactory).validate([]), [])
+
+    def test_invalid_query_and_empty_batch(self):
+        self.assertEqual(BatchSolver(climberFactory).solve([]), [])
+        with self.assertRaises(ValueError):
+            BatchSolver(climberFactory, maxWorkers=0).solve([((30, 30), {(0, 0)})])
+
+if __name__ == '__main__':
+    unittest.main()
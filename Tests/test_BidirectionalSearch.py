@@ -0,0 +1,108 @@
+import unittest
+from typing import Set, Tuple
+import numpy as np
+from DiscretePlanning.bidirectionalSearch import BidirectionalBFS, BidirectionalDijkstraSearch
+from DiscretePlanning.forwardSearchAlgorithms import ForwardBFS, ForwardDijkstraSearch
+from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from DiscretePlanning.Environments.HillClimber import HillClimber
+
+def height_function(x, y):
+    return 20 * np.exp(-((x - 8)**2 + (y - 8)**2) / 20) + 8 * np.exp(-((x - 15)**2 + (y - 15)**2) / 30)
+
+def pathCost(problem: DiscretePlanningProblem, solution) -> float:
+    cost = 0.0
+    for state, successor in zip(solution, solution[1:]):
+        action = next(action for action in problem.actionFunction(state)
+                      if problem.transitionFunction(state, action) == successor)
+        cost += problem.costFunction(state, action)
+    return cost
+
+class TestBidirectionalSearch(unittest.TestCase):
+    grid = {
+        'A': {'right': ('B', 2.0), 'down': ('D', 1.0)},
+        'B': {'left': ('A', 2.0), 'right': ('C', 2.0), 'down': ('E', 3.0)},
+        'C': {'left': ('B', 2.0), 'down': ('F', 2.0)},
+        'D': {'up': ('A', 1.0), 'right': ('E', 4.0), 'down': ('G', 2.0)},
+        'E': {'up': ('B', 3.0), 'left': ('D', 4.0), 'right': ('F', 1.0), 'down': ('H', 2.0)},
+        'F': {'up': ('C', 2.0), 'left': ('E', 1.0), 'down': ('I', 3.0)},
+        'G': {'up': ('D', 2.0), 'right': ('H', 3.0)},
+        'H': {'up': ('E', 2.0), 'left': ('G', 3.0), 'right': ('I', 2.0)},
+        'I': {'up': ('F', 3.0), 'left': ('H', 2.0)}
+    }
+
+    def predecessorFunction(self, state: str) -> Set[Tuple[str, str]]:
+        return {(predecessor, action) for predecessor, actions in self.grid.items()
+                for action, (successor, _) in actions.items() if successor == state}
+
+    def gridProblem(self, initialState: str, goalStates: Set[str]) -> DiscretePlanningProblem:
+        return DiscretePlanningProblem(lambda state: state in self.grid, lambda state: set(self.grid[state].keys()),
+                                       lambda state, action: self.grid[state][action][0], initialState, goalStates,
+                                       predecessorFunction=self.predecessorFunction,
+                                       costFunction=lambda state, action: self.grid[state][action][1])
+
+    def test_requires_predecessor_function(self):
+        problem = DiscretePlanningProblem(lambda state: True, lambda state: set(), lambda state, action: state, 'A', {'B'},
+                                          costFunction=lambda state, action: 1.0)
+        for solverClass in [BidirectionalBFS, BidirectionalDijkstraSearch]:
+            with self.assertRaises(ValueError):
+                solverClass(problem)
+
+    def test_BFS_fewest_transitions(self):
+        problem = self.gridProblem('A', {'I'})
+        solver = BidirectionalBFS(problem)
+        solution = solver.generateSolution()
+        self.assertTrue(solver.validateSolution(solution))
+        self.assertEqual(len(solution), len(ForwardBFS(problem).generateSolution()))
+
+    def test_Dijkstra_least_cost(self):
+        for queueType in ['heapq', 'indexed']:
+            with self.subTest(queue=queueType):
+                problem = self.gridProblem('A', {'I'})
+                solver = BidirectionalDijkstraSearch(problem, queue_options={'type': queueType})
+                solution = solver.generateSolution()
+                self.assertTrue(solver.validateSolution(solution))
+                self.assertEqual(solution, ForwardDijkstraSearch(problem).generateSolution())
+                self.assertEqual(solver.solutionCost, 8.0)
+
+    def test_multiple_goals_and_initial_goal(self):
+        problem = self.gridProblem('A', {'C', 'G'})
+        self.assertIn(BidirectionalBFS(problem).generateSolution(), [['A', 'D', 'G'], ['A', 'B', 'C']])
+        self.assertEqual(BidirectionalDijkstraSearch(problem).generateSolution(), ['A', 'D', 'G'])
+        for solverClass in [BidirectionalBFS, BidirectionalDijkstraSearch]:
+            self.assertEqual(solverClass(self.gridProblem('E', {'E'})).generateSolution(), ['E'])
+
+    def test_unreachable_goal(self):
+        problem = self.gridProblem('A', {'I'})
+        problem.actionFunction = lambda state: set() if state == 'A' else set(self.grid[state].keys())
+        for solverClass in [BidirectionalBFS, BidirectionalDijkstraSearch]:
+            self.assertIsNone(solverClass(problem).generateSolution())
+
+    def test_open_grid_expands_fewer_states(self):
+        # the forward search covers a ball of radius d around the start, both searches together two balls of radius d/2
+        climber = HillClimber(lambda x, y: 0.0 * x, (101, 101), (50, 40), {(50, 60)}, stateEncoding='tuple')
+        for forwardClass, solverClass in [(ForwardBFS, BidirectionalBFS), (ForwardDijkstraSearch, BidirectionalDijkstraSearch)]:
+            with self.subTest(solver=solverClass.__name__):
+                forward = forwardClass(climber.problem)
+                forwardSolution = forward.generateSolution()
+                solver = solverClass(climber.problem)
+                solution = solver.generateSolution()
+                self.assertTrue(solver.validateSolution(solution))
+                self.assertEqual(len(solution), len(forwardSolution))
+                self.assertLess(len(solver.visitedTable) + len(solver.successorTable), len(forward.visitedTable))
+
+    def test_HillClimber_matches_forward(self):
+        for encoding, start, goal in [('tuple', (1, 19), (19, 1)), ('string', '(1, 19)', '(19, 1)')]:
+            with self.subTest(encoding=encoding):
+                climber = HillClimber(height_function, (20, 20), start, {goal}, stateEncoding=encoding)
+                bfs = BidirectionalBFS(climber.problem).generateSolution()
+                self.assertTrue(BidirectionalBFS(climber.problem).validateSolution(bfs))
+                self.assertEqual(len(bfs), len(ForwardBFS(climber.problem).generateSolution()))
+                solver = BidirectionalDijkstraSearch(climber.problem, store_options={'type': 'compact'})
+                solution = solver.generateSolution()
+                self.assertTrue(solver.validateSolution(solution))
+                expected = ForwardDijkstraSearch(climber.problem).generateSolution()
+                self.assertAlmostEqual(pathCost(climber.problem, solution), pathCost(climber.problem, expected), places=9)
+                self.assertAlmostEqual(solver.solutionCost, pathCost(climber.problem, solution), places=9)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from DiscretePlanning.caches import LRUCache
+
+class TestLRUCache(unittest.TestCase):
+    def test_get_put_statistics(self):
+        cache = LRUCache(2)
+        self.assertIsNone(cache.get('A'))
+        cache.put('A', 1)
+        self.assertEqual(cache.get('A'), 1)
+        self.assertEqual(cache.get('B', 'default'), 'default')
+        self.assertEqual(cache.stats(), {"size": 1, "maxSize": 2, "hits": 1, "misses": 2, "evictions": 0})
+
+    def test_least_recently_used_evicted(self):
+        cache = LRUCache(2)
+        cache.put('A', 1)
+        cache.put('B', 2)
+        cache.get('A')
+        cache.put('C', 3)
+        self.assertIn('A', cache)
+        self.assertNotIn('B', cache)
+        self.assertIn('C', cache)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_zero_size_disables_cache(self):
+        cache = LRUCache(0)
+        cache.put('A', 1)
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.get('A'))
+
+    def test_clear(self):
+        cache = LRUCache(2)
+        cache.put('A', 1)
+        cache.get('A')
+        cache.clear()
+        self.assertEqual(cache.stats(), {"size": 0, "maxSize": 2, "hits": 0, "misses": 0, "evictions": 0})
+
+    def test_negative_size(self):
+        with self.assertRaises(ValueError):
+            LRUCache(-1)
+
+if __name__ == '__main__':
+    unittest.main()
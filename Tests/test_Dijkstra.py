@@ -2,6 +2,7 @@ import unittest
 from typing import Set
 from pathlib import Path
 from os import rmdir, remove
+from json import loads
 from DiscretePlanning.forwardSearchAlgorithms import ForwardDijkstraSearch
 from DiscretePlanning.planningProblem import DiscretePlanningProblem
 class testForwardDijakstra(unittest.TestCase):
@@ -74,6 +75,46 @@ class testForwardDijakstra(unittest.TestCase):
         self.assertIsNotNone(solution)
         self.assertTrue(self.solver.validateSolution(solution))
 
+    def test_ForwardDijakstra_concurrent_log(self):
+        concurrentLogFile = self.logFile.with_stem("ForwardDijkstraConcurrent")
+        solver = ForwardDijkstraSearch(self.problem, concurrentLogFile, True, log_options={'concurrent': True})
+        solution = solver.generateSolution()
+        self.assertEqual(solution, self.solver.generateSolution())
+        events = loads(concurrentLogFile.read_text())
+        remove(concurrentLogFile)
+        self.assertEqual(events[-1]["Event"], "Solution Generated")
+        self.assertEqual([event["Log Entry Number"] for event in events], list(range(1, len(events) + 1)))
+
+    def test_ForwardDijakstra_solution_file(self):
+        solver = ForwardDijkstraSearch(self.problem, self.logFile, True, log_options={'solution': 'file'})
+        solution = solver.generateSolution()
+        solutionFile = self.logFile.with_name("ForwardDijkstra_solution.txt")
+        events = loads(self.logFile.read_text())
+        plan = solutionFile.read_text(encoding='utf-8')
+        remove(solutionFile)
+        self.assertEqual(events[-1]["Event"], "Solution Generated")
+        entry = events[-1]["Entry"]
+        self.assertNotIn("Solution", entry)
+        self.assertEqual(entry["Solution File"], str(solutionFile))
+        self.assertEqual(entry["Solution Length"], len(solution))
+        self.assertEqual(plan, solver.stringifySolution(solution))
+        with self.assertRaises(ValueError):
+            ForwardDijkstraSearch(self.problem, self.logFile, True, log_options={'solution': 'inline'})
+
+    def test_ForwardDijakstra_no_logging(self):
+        quietSolver = ForwardDijkstraSearch(self.problem)
+        self.assertFalse(quietSolver.instrumented)
+        self.assertEqual(quietSolver.generateSolution(), self.solver.generateSolution())
+        self.assertEqual(quietSolver.costTable, self.solver.costTable)
+        self.assertEqual(quietSolver.visitedTable, self.solver.visitedTable)
+
+    def test_ForwardDijakstra_indexed_queue(self):
+        indexedSolver = ForwardDijkstraSearch(self.problem, queue_options={'type': 'indexed'})
+        self.assertEqual(indexedSolver.generateSolution(), self.solver.generateSolution())
+        self.assertEqual(indexedSolver.costTable, self.solver.costTable)
+        with self.assertRaises(ValueError):
+            ForwardDijkstraSearch(self.problem, queue_options={'type': 'deque'})
+
     def test_ForwardDijakstra_no_solution(self):
         self.problem.goalStates= {'Z'}
         solution = self.solver.generateSolution()
@@ -319,5 +319,171 @@ class TestDiscretePlanningProblem(unittest.TestCase):
             self.assertEqual(planningProblem.get_cost(state='C', action='right'), 2)
             self.assertTrue("Returned cost is negative" in str(context.exception))
 
+    #get_edge_cost
+    def test_getEdgeCost_cached(self):
+        calls = []
+        def counting_cost_function(state, action):
+            calls.append((state, action))
+            return float(2)
+        planningProblem = DiscretePlanningProblem(
+            actionFunction=self.actionFunction,
+            belongingFunction=self.belongingFunction,
+            transitionFunction=self.transitionFunction,
+            costFunction=counting_cost_function,
+            actionSpace=self.actionSpace,
+            initialState=self.initialState,
+            goalStates=self.goalStates
+        )
+        self.assertEqual(planningProblem.get_edge_cost('C', 'right'), 2)
+        self.assertEqual(planningProblem.get_edge_cost('C', 'right'), 2)
+        self.assertEqual(planningProblem.get_edge_cost('C', 'left'), 2)
+        self.assertEqual(calls, [('C', 'right'), ('C', 'left')])
+        self.assertEqual(planningProblem.costCache.hits, 1)
+        self.assertEqual(planningProblem.costCache.misses, 2)
+
+        # replacing the cost function invalidates memoized costs
+        planningProblem.costFunction = self.cost_function_invalid_range
+        self.assertEqual(len(planningProblem.costCache), 0)
+        self.assertEqual(planningProblem.get_edge_cost('C', 'right'), -1)
+
+    def test_getEdgeCost_cache_bounded(self):
+        planningProblem = DiscretePlanningProblem(
+            actionFunction=self.actionFunction,
+            belongingFunction=self.belongingFunction,
+            transitionFunction=self.transitionFunction,
+            costFunction=self.cost_function_valid,
+            actionSpace=self.actionSpace,
+            initialState=self.initialState,
+            goalStates=self.goalStates,
+            costCacheSize=1
+        )
+        planningProblem.get_edge_cost('C', 'right')
+        planningProblem.get_edge_cost('C', 'left')
+        self.assertEqual(len(planningProblem.costCache), 1)
+        self.assertEqual(planningProblem.costCache.evictions, 1)
+        self.assertNotIn(('C', 'right'), planningProblem.costCache)
+
+    def test_getEdgeCost_validation_debug_mode(self):
+        planningProblem = DiscretePlanningProblem(
+            actionFunction=self.actionFunction,
+            belongingFunction=self.belongingFunction,
+            transitionFunction=self.transitionFunction,
+            costFunction=self.cost_function_valid,
+            actionSpace=self.actionSpace,
+            initialState=self.initialState,
+            goalStates=self.goalStates,
+            validateCosts=True
+        )
+        with self.assertRaisesRegex(ValueError, "Action not in action set associated with State"):
+            planningProblem.get_edge_cost('A', 'up')
+
+    #get_successors tests
+    def test_getSuccessors_from_callbacks(self):
+        planningProblem = DiscretePlanningProblem(
+            actionFunction=self.actionFunction,
+            belongingFunction=self.belongingFunction,
+            transitionFunction=self.transitionFunction,
+            costFunction=self.cost_function_valid,
+            actionSpace=self.actionSpace,
+            initialState=self.initialState,
+            goalStates=self.goalStates,
+            successorCacheSize=16
+        )
+        self.assertCountEqual(planningProblem.get_successors('C'), [('left', 'B', 2.0), ('right', 'D', 2.0)])
+        self.assertEqual(planningProblem.get_successors('Z'), ())
+        # the second query and get_next_states are served by the successor cache
+        planningProblem.get_successors('C')
+        self.assertCountEqual(planningProblem.get_next_states('C'), ['B', 'D'])
+        self.assertEqual(planningProblem.successorCache.misses, 2)
+        self.assertEqual(planningProblem.successorCache.hits, 2)
+
+    def test_getSuccessors_without_cost_function(self):
+        planningProblem = DiscretePlanningProblem(
+            actionFunction=self.actionFunction,
+            belongingFunction=self.belongingFunction,
+            transitionFunction=self.transitionFunction,
+            actionSpace=self.actionSpace,
+            initialState=self.initialState,
+            goalStates=self.goalStates
+        )
+        self.assertEqual(list(planningProblem.get_successors('A')), [('right', 'B', None)])
+
+    def test_getSuccessors_successor_function(self):
+        calls = []
+        def successor_function(state):
+            calls.append(state)
+            return [(action, test_transition_function(state, action), 3.0) for action in test_action_function(state)]
+        planningProblem = DiscretePlanningProblem(
+            actionFunction=self.actionFunction,
+            belongingFunction=self.belongingFunction,
+            transitionFunction=self.transitionFunction,
+            costFunction=self.cost_function_valid,
+            actionSpace=self.actionSpace,
+            initialState=self.initialState,
+            goalStates=self.goalStates,
+            successorFunction=successor_function,
+            successorCacheSize=16
+        )
+        self.assertEqual(planningProblem.get_successors('B'), (('right', 'C', 3.0),))
+        self.assertEqual(planningProblem.get_next_states('B'), ['C'])
+        self.assertEqual(calls, ['B'])
+
+    def test_getSuccessors_cache_invalidation(self):
+        planningProblem = DiscretePlanningProblem(
+            actionFunction=self.actionFunction,
+            belongingFunction=self.belongingFunction,
+            transitionFunction=self.transitionFunction,
+            costFunction=self.cost_function_valid,
+            actionSpace=self.actionSpace,
+            initialState=self.initialState,
+            goalStates=self.goalStates,
+            successorCacheSize=16
+        )
+        planningProblem.get_successors('A')
+        planningProblem.transitionFunction = lambda state, action: 'Z'
+        self.assertEqual(len(planningProblem.successorCache), 0)
+        self.assertEqual(planningProblem.get_successors('A'), (('right', 'Z', 2.0),))
+        planningProblem.costFunction = lambda state, action: 5.0
+        self.assertEqual(planningProblem.get_successors('A'), (('right', 'Z', 5.0),))
+        planningProblem.actionFunction = lambda state: set()
+        self.assertEqual(planningProblem.get_successors('A'), ())
+
+    def test_getSuccessors_without_costs(self):
+        costCalls = []
+        def counted_cost_function(state, action):
+            costCalls.append((state, action))
+            return 2.0
+        planningProblem = DiscretePlanningProblem(
+            actionFunction=self.actionFunction,
+            belongingFunction=self.belongingFunction,
+            transitionFunction=self.transitionFunction,
+            costFunction=counted_cost_function,
+            actionSpace=self.actionSpace,
+            initialState=self.initialState,
+            goalStates=self.goalStates,
+            successorCacheSize=16
+        )
+        self.assertCountEqual(planningProblem.get_successors('C', withCosts=False), [('left', 'B', None), ('right', 'D', None)])
+        self.assertEqual(costCalls, [])
+        # cost-free triples are not cached, a later caller may need the costs
+        self.assertEqual(len(planningProblem.successorCache), 0)
+        self.assertCountEqual(planningProblem.get_successors('C'), [('left', 'B', 2.0), ('right', 'D', 2.0)])
+        self.assertCountEqual(planningProblem.get_successors('C', withCosts=False), [('left', 'B', 2.0), ('right', 'D', 2.0)])
+        self.assertEqual(len(costCalls), 2)
+
+    def test_getSuccessors_cache_disabled(self):
+        planningProblem = DiscretePlanningProblem(
+            actionFunction=self.actionFunction,
+            belongingFunction=self.belongingFunction,
+            transitionFunction=self.transitionFunction,
+            actionSpace=self.actionSpace,
+            initialState=self.initialState,
+            goalStates=self.goalStates,
+            successorCacheSize=0
+        )
+        planningProblem.get_successors('C')
+        self.assertEqual(len(planningProblem.successorCache), 0)
+        self.assertCountEqual(planningProblem.get_next_states('C'), ['B', 'D'])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,7 +1,12 @@
 import unittest
 from collections import deque
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from DiscretePlanning.planningSearch import DiscretePlanningSolver, ForwardSearch
 from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from DiscretePlanning.priorityQueue import IndexedPriorityQueue
+from DiscretePlanning.caches import LRUCache
 
 def test_transition_function(state, action):
     match (state,action):
@@ -114,6 +119,57 @@ class TestDiscretePlanningSolver(unittest.TestCase):
         solver = DiscretePlanningSolver(self.problem)
         solution = ['A', 'B']
         self.assertTrue(solver.validateSolution(solution))
+
+    def test_validate_solution_with_actions(self):
+        solver = DiscretePlanningSolver(self.problem)
+        solution = ['A', 'B', 'C', 'D']
+        self.assertTrue(solver.validateSolution(solution, ['right', 'right', 'right']))
+        self.assertFalse(solver.validateSolution(solution, ['right', 'right', 'left']))
+        self.assertFalse(solver.validateSolution(['A', 'L', 'B'], ['right', 'right']))
+        with self.assertRaises(ValueError):
+            solver.validateSolution(solution, ['right'])
+
+    def test_validate_solution_illegal_action(self):
+        # +1 is defined by the transition function everywhere but is not applicable at state 2
+        for cacheSize in [0, 16]:
+            with self.subTest(cacheSize=cacheSize):
+                line = DiscretePlanningProblem(lambda state: state in range(4), lambda state: {1} if state != 2 else set(),
+                                               lambda state, action: state + action, 0, {3},
+                                               successorCacheSize=cacheSize)
+                solver = DiscretePlanningSolver(line)
+                self.assertFalse(solver.validateSolution([0, 1, 2, 3]))
+                self.assertFalse(solver.validateSolution([0, 1, 2, 3], [1, 1, 1]))
+                for state in range(3):
+                    line.get_successors(state)
+                self.assertFalse(solver.validateSolution([0, 1, 2, 3], [1, 1, 1]))
+
+    def test_validate_solution_with_actions_cached(self):
+        calls = []
+        def counted_transition_function(state, action):
+            calls.append((state, action))
+            return test_transition_function(state, action)
+        self.problem.transitionFunction = counted_transition_function
+        self.problem.successorCache = LRUCache(16)
+        solver = DiscretePlanningSolver(self.problem)
+        for state in ['A', 'B', 'C']:
+            self.problem.get_successors(state)
+        calls.clear()
+        solution = ['A', 'B', 'C', 'D']
+        self.assertTrue(solver.validateSolution(solution, ['right', 'right', 'right']))
+        # the action must match the cached transition, not only the successor
+        self.assertFalse(solver.validateSolution(['A', 'B', 'C', 'B'], ['right', 'right', 'right']))
+        # cached actions are checked for applicability, 'left' can not be taken from 'B'
+        self.assertFalse(solver.validateSolution(['A', 'B', 'C', 'D'], ['right', 'left', 'right']))
+        self.assertEqual(calls, [])
+
+    def test_validate_solutions(self):
+        solver = DiscretePlanningSolver(self.problem)
+        solutions = [['A', 'B'], None, ['A', 'C'], ['A', 'B', 'C', 'D']]
+        self.assertEqual(solver.validateSolutions(solutions), [True, False, False, True])
+        self.assertEqual(solver.validateSolutions(solutions, [['right'], None, None, ['right', 'right', 'right']]),
+                         [True, False, False, True])
+        with self.assertRaises(ValueError):
+            solver.validateSolutions(solutions, [])
     
     #stringifySolution
     def test_stringify_solution_empty(self):
@@ -150,6 +206,35 @@ class TestDiscretePlanningSolver(unittest.TestCase):
         expected_output = "1. A -> 2. B -> 3. C"
         self.assertEqual(solver.stringifySolution(solution, options), expected_output)
 
+    #iterSolutionChunks / writeSolution
+    def test_iter_solution_chunks(self):
+        solver = DiscretePlanningSolver(self.problem)
+        solution = [f'S{i}' for i in range(200)]
+        options = {'separator': ' | ', 'include_indices': True, 'chunk_size': 64}
+        chunks = list(solver.iterSolutionChunks(solution, options))
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) < 64 + len('200. S199 | ') for chunk in chunks))
+        self.assertEqual(''.join(chunks), solver.stringifySolution(solution, options))
+
+    def test_iter_solution_chunks_empty(self):
+        solver = DiscretePlanningSolver(self.problem)
+        with self.assertRaises(ValueError):
+            solver.iterSolutionChunks([])
+        with self.assertRaises(ValueError):
+            solver.iterSolutionChunks(['A'], {'chunk_size': 0})
+
+    def test_write_solution(self):
+        solver = DiscretePlanningSolver(self.problem)
+        solution = ['A', 'B', 'C']
+        output = StringIO()
+        written = solver.writeSolution(solution, output, {'chunk_size': 1})
+        self.assertEqual(output.getvalue(), 'A -> B -> C')
+        self.assertEqual(written, len('A -> B -> C'))
+        with TemporaryDirectory() as directory:
+            planFile = Path(directory) / 'plan.txt'
+            solver.writeSolution(solution, planFile, {'state_formatter': str.lower})
+            self.assertEqual(planFile.read_text(encoding='utf-8'), 'a -> b -> c')
+
 class TestForwardSearch(TestDiscretePlanningSolver):
     def setUp(self):
         super().setUp()
@@ -172,6 +257,12 @@ class TestForwardSearch(TestDiscretePlanningSolver):
         self.assertEqual(solver.queue_type, 'heapq')
         self.assertEqual(solver.frontier, [])
 
+        # indexed option
+        solver = ForwardSearch(problem=self.problem, queue_options={'type': 'indexed'})
+        self.assertEqual(solver.queue_type, 'indexed')
+        self.assertIsInstance(solver.frontier, IndexedPriorityQueue)
+        self.assertEqual(len(solver.frontier), 0)
+
     def test_ForwardSearch_init_default(self):
         solver = ForwardSearch(problem=self.problem)
         self.assertEqual(solver.problem, self.problem)
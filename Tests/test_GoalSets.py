@@ -0,0 +1,161 @@
+import pickle
+import unittest
+import numpy as np
+from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from DiscretePlanning.goalSets import GoalBitmap
+from DiscretePlanning.forwardSearchAlgorithms import ForwardBFS, ForwardDijkstraSearch
+from DiscretePlanning.anytimeSearch import ForwardARAStar
+from DiscretePlanning.bidirectionalSearch import BidirectionalBFS
+from DiscretePlanning.gridSearch import GridSearch
+from DiscretePlanning.Environments.HillClimber import HillClimber
+
+def chain_problem(goalStates=None, goalPredicate=None, validateGoals=True):
+    # 0 -> 1 -> ... -> 9, moving right costs 1
+    return DiscretePlanningProblem(lambda state: type(state) is int and 0 <= state < 10,
+                                   lambda state: {'right'} if state < 9 else set(),
+                                   lambda state, action: state + 1, 0, goalStates,
+                                   predecessorFunction=lambda state: {(state - 1, 'right')} if state > 0 else set(),
+                                   costFunction=lambda state, action: 1.0,
+                                   goalPredicate=goalPredicate, validateGoals=validateGoals)
+
+# module level so the problem can be pickled
+def in_chain(state):
+    return type(state) is int and 0 <= state < 10
+
+def chain_actions(state):
+    return {'right'} if state < 9 else set()
+
+def chain_transition(state, action):
+    return state + 1
+
+def is_multiple_of_four(state):
+    return state > 0 and state % 4 == 0
+
+def height_function(x, y):
+    return 3.0 * np.sin(x / 3) + 0.5 * y
+
+class TestGoalPredicates(unittest.TestCase):
+    def test_predicate_goal(self):
+        problem = chain_problem(goalPredicate=lambda state: state % 7 == 6)
+        self.assertIsNone(problem.goalStates)
+        self.assertTrue(problem.is_goal_state(6))
+        self.assertFalse(problem.is_goal_state(5))
+        solver = ForwardBFS(problem, None)
+        solution = solver.generateSolution()
+        self.assertEqual(solution, list(range(7)))
+        self.assertTrue(solver.validateSolution(solution))
+
+    def test_goal_set_or_predicate(self):
+        problem = chain_problem(goalStates={8}, goalPredicate=lambda state: state == 4)
+        self.assertTrue(problem.is_goal_state(8))
+        self.assertTrue(problem.is_goal_state(4))
+        self.assertFalse(problem.is_goal_state(5))
+        self.assertEqual(ForwardDijkstraSearch(problem, None).generateSolution()[-1], 4)
+
+    def test_no_goals(self):
+        with self.assertRaises(ValueError):
+            chain_problem()
+
+    def test_lazy_goal_validation(self):
+        with self.assertRaises(ValueError):
+            chain_problem(goalStates={5, 42})
+        problem = chain_problem(goalStates={5, 42}, validateGoals=False)
+        self.assertEqual(ForwardBFS(problem, None).generateSolution()[-1], 5)
+
+    def test_setters_rebind_goal_test(self):
+        problem = chain_problem(goalStates={3})
+        problem.goalStates = {5}
+        self.assertFalse(problem.is_goal_state(3))
+        self.assertTrue(problem.is_goal_state(5))
+        problem.goalPredicate = lambda state: state == 2
+        self.assertTrue(problem.is_goal_state(2))
+        self.assertTrue(problem.is_goal_state(5))
+        problem.goalStates = None
+        self.assertFalse(problem.is_goal_state(5))
+        self.assertTrue(problem.is_goal_state(2))
+
+    def test_anytime_search_with_predicate(self):
+        problem = chain_problem(goalPredicate=lambda state: state >= 3)
+        solver = ForwardARAStar(problem)
+        self.assertEqual(solver.generateSolution(), [0, 1, 2, 3])
+
+    def test_pickle_goal_set_and_predicate(self):
+        problem = DiscretePlanningProblem(in_chain, chain_actions, chain_transition, 0, {6}, goalPredicate=is_multiple_of_four)
+        restored = pickle.loads(pickle.dumps(problem))
+        self.assertEqual([state for state in range(10) if restored.is_goal_state(state)], [4, 6, 8])
+        restored.goalPredicate = None
+        self.assertEqual([state for state in range(10) if restored.is_goal_state(state)], [6])
+
+    def test_enumerable_goals_required(self):
+        problem = chain_problem(goalPredicate=lambda state: state == 3)
+        with self.assertRaises(ValueError):
+            BidirectionalBFS(problem, None)
+
+
+class TestGoalBitmap(unittest.TestCase):
+    def setUp(self):
+        self.bitmap = GoalBitmap.fromStates({2, 5, 7}, lambda state: state, lambda index: index, 10)
+
+    def test_membership(self):
+        self.assertIn(5, self.bitmap)
+        self.assertNotIn(4, self.bitmap)
+        self.assertNotIn(12, self.bitmap)
+        self.assertNotIn('5', GoalBitmap(lambda state: state + 0, lambda index: index, 10))
+        self.assertTrue(self.bitmap(7))
+
+    def test_enumeration(self):
+        self.assertEqual(len(self.bitmap), 3)
+        self.assertEqual(list(self.bitmap), [2, 5, 7])
+        self.bitmap.add(9)
+        self.bitmap.add(9)
+        self.assertEqual(len(self.bitmap), 4)
+        with self.assertRaises(ValueError):
+            self.bitmap.add(10)
+
+    def test_from_predicate(self):
+        bitmap = GoalBitmap.fromPredicate(lambda state: state % 3 == 0, lambda state: state, lambda index: index, 10)
+        self.assertEqual(list(bitmap), [0, 3, 6, 9])
+
+    def test_size_mismatch(self):
+        with self.assertRaises(ValueError):
+            GoalBitmap(lambda state: state, lambda index: index, 10, bytes(9))
+
+    def test_bitmap_goal_problem(self):
+        problem = chain_problem(goalStates=self.bitmap)
+        self.assertEqual(ForwardDijkstraSearch(problem, None).generateSolution(), [0, 1, 2])
+
+
+class TestHillClimberGoalRegion(unittest.TestCase):
+    def test_height_region(self):
+        for encoding in ('string', 'tuple', 'index'):
+            with self.subTest(encoding=encoding):
+                mask = HillClimber._evaluateHeightField(height_function, (12, 9)) >= 5.0
+                climber = HillClimber(height_function, (12, 9), self._origin(encoding), mask, stateEncoding=encoding)
+                goals = climber.problem.goalStates
+                self.assertIsInstance(goals, GoalBitmap)
+                expected = {climber.encodeState(int(x), int(y)) for x, y in zip(*np.nonzero(mask))}
+                self.assertEqual(set(goals), expected)
+                solution = ForwardDijkstraSearch(climber.problem, None).generateSolution()
+                self.assertIn(solution[-1], expected)
+                self.assertTrue(all(not climber.problem.is_goal_state(state) for state in solution[:-1]))
+
+    def test_grid_search_matches(self):
+        mask = HillClimber._evaluateHeightField(height_function, (12, 9)) >= 5.0
+        climber = HillClimber(height_function, (12, 9), (0, 0), mask, stateEncoding='tuple')
+        expected = ForwardDijkstraSearch(climber.problem, None).generateSolution()
+        grid = GridSearch(climber)
+        solution = grid.generateSolution()
+        self.assertEqual(solution[-1], expected[-1])
+
+    def test_mask_shape(self):
+        climber = HillClimber(height_function, (12, 9), (0, 0), {(0, 0)}, stateEncoding='tuple')
+        with self.assertRaises(ValueError):
+            climber.goalRegion(np.ones((9, 12), dtype=bool))
+
+    @staticmethod
+    def _origin(encoding):
+        return {'string': '(0, 0)', 'tuple': (0, 0), 'index': 0}[encoding]
+
+
+if __name__ == '__main__':
+    unittest.main()
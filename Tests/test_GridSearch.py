@@ -0,0 +1,106 @@
+import unittest
+from typing import Any, List
+import numpy as np
+from DiscretePlanning.gridSearch import GridSearch
+from DiscretePlanning.forwardSearchAlgorithms import ForwardDijkstraSearch
+from DiscretePlanning.Environments.HillClimber import HillClimber
+
+def height_function(x, y):
+    peak1 = 20 * np.exp(-((x - 8)**2 + (y - 8)**2) / 20)
+    peak2 = 8 * np.exp(-((x - 15)**2 + (y - 15)**2) / 30)
+    return peak1 + peak2
+
+def pathCost(climber: HillClimber, solution: List[Any]) -> float:
+    problem = climber.problem
+    cost = 0.0
+    for state, successor in zip(solution, solution[1:]):
+        action = next(action for action in problem.actionFunction(state)
+                      if problem.transitionFunction(state, action) == successor)
+        cost += problem.costFunction(state, action)
+    return cost
+
+class TestGridSearch(unittest.TestCase):
+    size = (20, 20)
+
+    def test_invalid_algorithm(self):
+        climber = HillClimber(height_function, self.size, (1, 19), {(19, 1)}, stateEncoding='tuple')
+        with self.assertRaises(ValueError):
+            GridSearch(climber, algorithm='invalid')
+
+    def test_matches_forward_dijkstra(self):
+        for encoding, start, goal in [('tuple', (1, 19), (19, 1)), ('index', 19 * 20 + 1, 1 * 20 + 19),
+                                      ('string', '(1, 19)', '(19, 1)')]:
+            climber = HillClimber(height_function, self.size, start, {goal}, stateEncoding=encoding)
+            expected = ForwardDijkstraSearch(climber.problem).generateSolution()
+            for algorithm in ['dijkstra', 'astar']:
+                with self.subTest(encoding=encoding, algorithm=algorithm):
+                    solver = GridSearch(climber, algorithm=algorithm)
+                    solution = solver.generateSolution()
+                    self.assertTrue(solver.validateSolution(solution))
+                    self.assertEqual(solution[0], start)
+                    self.assertEqual(solution[-1], goal)
+                    self.assertAlmostEqual(pathCost(climber, solution), pathCost(climber, expected), places=9)
+                    self.assertAlmostEqual(float(solver.costs[climber.decodeState(goal)[1] * 20 + climber.decodeState(goal)[0]]),
+                                           pathCost(climber, solution), places=9)
+
+    def test_astar_expands_fewer_states(self):
+        climber = HillClimber(height_function, self.size, (1, 19), {(19, 1)}, stateEncoding='tuple')
+        dijkstra = GridSearch(climber)
+        astar = GridSearch(climber, algorithm='astar')
+        dijkstra.generateSolution()
+        astar.generateSolution()
+        self.assertLess(astar.expansions, dijkstra.expansions)
+
+    def test_from_heights_multiple_goals(self):
+        heights = np.zeros((6, 4))
+        heights[2, :3] = 100.0 # wall with a gap at y = 3
+        solver = GridSearch.fromHeights(heights, (0, 0), {(5, 0), (5, 3)}, algorithm='astar')
+        solution = solver.generateSolution()
+        self.assertTrue(solver.validateSolution(solution))
+        self.assertIn((2, 3), solution)
+        self.assertEqual(solver.climber.size, (6, 4))
+
+    def test_edge_costs_not_copied(self):
+        climber = HillClimber(height_function, self.size, (1, 19), {(19, 1)}, stateEncoding='tuple')
+        solver = GridSearch(climber)
+        self.assertTrue(np.shares_memory(solver._edgeRows, climber.edgeCosts))
+
+    def test_inconsistent_heuristic(self):
+        # zeroing the default heuristic on random cells keeps it admissible but makes it inconsistent, closed cells
+        # then have to be reopened for A* to stay optimal
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                rng = np.random.default_rng(seed)
+                heights = rng.uniform(0.0, 4.0, (10, 10))
+                dijkstra = GridSearch.fromHeights(heights, (0, 0), {(9, 9)})
+                dijkstra.generateSolution()
+                terrain = GridSearch.fromHeights(heights, (0, 0), {(9, 9)}, algorithm='astar')._terrainDistance()
+                heuristic = terrain * (rng.random((10, 10)) < 0.5)
+                astar = GridSearch.fromHeights(heights, (0, 0), {(9, 9)}, algorithm='astar', heuristic=heuristic)
+                solution = astar.generateSolution()
+                self.assertTrue(astar.validateSolution(solution))
+                self.assertAlmostEqual(pathCost(astar.climber, solution), float(dijkstra.costs[99]), places=9)
+
+    def test_dense_goal_region(self):
+        mask = np.zeros((60, 50), dtype=bool)
+        mask[35:, 10:40] = True
+        climber = HillClimber(height_function, (60, 50), (0, 0), mask, stateEncoding='tuple')
+        def enumerated(index):
+            raise AssertionError("goal region enumerated")
+        climber.problem.goalStates.indexToState = enumerated
+        dijkstra = GridSearch(climber)
+        astar = GridSearch(climber, algorithm='astar')
+        expected, solution = dijkstra.generateSolution(), astar.generateSolution()
+        self.assertTrue(astar.validateSolution(solution))
+        self.assertAlmostEqual(pathCost(climber, solution), pathCost(climber, expected), places=9)
+        self.assertLessEqual(astar.expansions, dijkstra.expansions)
+        # the bounding box bound is exact on the box and a lower bound outside of it
+        self.assertEqual(float(astar.heuristic[20 * 60 + 40]), 0.0)
+        self.assertLessEqual(float(astar.heuristic[0]), pathCost(climber, solution))
+
+    def test_start_is_goal(self):
+        solver = GridSearch.fromHeights(np.zeros((3, 3)), (1, 1), {(1, 1)})
+        self.assertEqual(solver.generateSolution(), [(1, 1)])
+
+if __name__ == '__main__':
+    unittest.main()
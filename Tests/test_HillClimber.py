@@ -1,5 +1,5 @@
 from DiscretePlanning.Environments.HillClimber import HillClimber
-from DiscretePlanning.forwardSearchAlgorithms import ForwardAStar
+from DiscretePlanning.forwardSearchAlgorithms import ForwardAStar, ForwardBFS, ForwardDijkstraSearch
 import unittest
 from pathlib import Path
 import numpy as np
@@ -49,5 +49,114 @@ class test_HillClimber(unittest.TestCase):
             self.assertIn("Solution valid", result)
             self.assertIn(ExpectedSolution, result)
 
+class test_HillClimber_encodings(unittest.TestCase):
+        size = (20, 20)
+        start, goal = (1, 19), (19, 1)
+
+        def climber(self, encoding: str) -> HillClimber:
+            encode = lambda x, y: {'string': repr((x, y)), 'tuple': (x, y), 'index': y * self.size[0] + x}[encoding]
+            return HillClimber(test_height_function, self.size, encode(*self.start), {encode(*self.goal)},
+                               stateEncoding=encoding)
+
+        def test_invalid_encoding(self):
+            with self.assertRaises(ValueError):
+                HillClimber(test_height_function, self.size, (0, 0), {(1, 1)}, stateEncoding='invalid')
+
+        def test_encode_decode_round_trip(self):
+            for encoding in ['string', 'tuple', 'index']:
+                with self.subTest(encoding=encoding):
+                    climber = self.climber(encoding)
+                    self.assertEqual(climber.decodeState(climber.encodeState(3, 7)), (3, 7))
+            self.assertEqual(self.climber('index').encodeState(3, 7), 7 * 20 + 3)
+            self.assertEqual(self.climber('string').encodeState(3, 7), '(3, 7)')
+
+        def test_encodings_agree_on_callbacks(self):
+            climbers = {encoding: self.climber(encoding) for encoding in ['string', 'tuple', 'index']}
+            for x, y in [(0, 0), (19, 19), (0, 10), (19, 5), (10, 0), (7, 19), (8, 8)]:
+                actions = {encoding: set(climber.problem.actionFunction(climber.encodeState(x, y)))
+                           for encoding, climber in climbers.items()}
+                self.assertEqual(actions['string'], actions['tuple'])
+                self.assertEqual(actions['string'], actions['index'])
+                for action in actions['string']:
+                    for climber in climbers.values():
+                        state = climber.encodeState(x, y)
+                        successor = climber.problem.transitionFunction(state, action)
+                        self.assertTrue(climber.problem.belongingFunction(successor))
+                        self.assertEqual(climber.problem.costFunction(state, action),
+                                         climbers['string'].problem.costFunction(repr((x, y)), action))
+            for climber in climbers.values():
+                self.assertFalse(climber.problem.belongingFunction(climber.encodeState(0, 20)))
+            self.assertFalse(climbers['string'].problem.belongingFunction("(1.5, 2)"))
+            self.assertFalse(climbers['tuple'].problem.belongingFunction((1.5, 2)))
+            self.assertFalse(climbers['index'].problem.belongingFunction(-1))
+
+        def test_encodings_same_solution(self):
+            solutions = {}
+            for encoding in ['string', 'tuple', 'index']:
+                climber = self.climber(encoding)
+                for solverClass in [ForwardDijkstraSearch, ForwardBFS]:
+                    solver = solverClass(climber.problem)
+                    solution = solver.generateSolution()
+                    self.assertTrue(solver.validateSolution(solution))
+                    solutions[encoding, solverClass] = [climber.decodeState(state) for state in solution]
+            for solverClass in [ForwardDijkstraSearch, ForwardBFS]:
+                self.assertEqual(solutions['string', solverClass][-1], self.goal)
+                self.assertEqual(len(solutions['tuple', solverClass]), len(solutions['string', solverClass]))
+                self.assertEqual(len(solutions['index', solverClass]), len(solutions['string', solverClass]))
+            self.assertEqual(solutions['tuple', ForwardDijkstraSearch], solutions['string', ForwardDijkstraSearch])
+            self.assertEqual(solutions['index', ForwardDijkstraSearch], solutions['string', ForwardDijkstraSearch])
+
+        def test_successor_function_matches_callbacks(self):
+            for encoding in ['tuple', 'index']:
+                for precompute in [True, False]:
+                    with self.subTest(encoding=encoding, precomputeCosts=precompute):
+                        climber = self.climber(encoding)
+                        if not precompute:
+                            climber.edgeCosts = None
+                        problem = climber.problem
+                        for x, y in [(0, 0), (19, 19), (0, 10), (8, 8)]:
+                            state = climber.encodeState(x, y)
+                            expected = {(action, problem.transitionFunction(state, action),
+                                         problem.costFunction(state, action)) for action in problem.actionFunction(state)}
+                            self.assertEqual(set(problem.get_successors(state)), expected)
+
+        def test_compact_store_options(self):
+            climber = self.climber('index')
+            dictSolver = ForwardDijkstraSearch(climber.problem)
+            compactSolver = ForwardDijkstraSearch(climber.problem, store_options=climber.compactStoreOptions())
+            self.assertEqual(compactSolver.generateSolution(), dictSolver.generateSolution())
+
+class test_HillClimber_cost_field(unittest.TestCase):
+        size = (12, 9)
+
+        def test_scalar_height_function_fallback(self):
+            def scalar_height_function(x: int, y: int) -> float:
+                if x > y: # not array friendly, forces the per cell evaluation
+                    return float(x - y)
+                return 0.5 * y
+            climber = HillClimber(scalar_height_function, self.size, (0, 0), {(11, 8)}, stateEncoding='tuple')
+            self.assertEqual(climber.heightField.shape, self.size)
+            for x, y in [(0, 0), (5, 2), (3, 7), (11, 8)]:
+                self.assertEqual(climber.heightField[x, y], scalar_height_function(x, y))
+
+        def test_edge_costs_match_norm(self):
+            climber = HillClimber(test_height_function, self.size, (0, 0), {(11, 8)}, stateEncoding='tuple')
+            lazyClimber = HillClimber(test_height_function, self.size, (0, 0), {(11, 8)}, stateEncoding='tuple',
+                                      precomputeCosts=False)
+            self.assertEqual(climber.edgeCosts.shape, self.size + (8,))
+            self.assertIsNone(lazyClimber.edgeCosts)
+            for x in range(self.size[0]):
+                for y in range(self.size[1]):
+                    for action in climber.problem.actionFunction((x, y)):
+                        x_prime, y_prime = climber.problem.transitionFunction((x, y), action)
+                        coordinates = np.array([x, y, test_height_function(x, y)])
+                        coordinates_prime = np.array([x_prime, y_prime, test_height_function(x_prime, y_prime)])
+                        expected = float(np.linalg.norm(coordinates_prime - coordinates))
+                        cost = climber.problem.costFunction((x, y), action)
+                        self.assertIsInstance(cost, float)
+                        self.assertAlmostEqual(cost, expected, places=12)
+                        self.assertAlmostEqual(lazyClimber.problem.costFunction((x, y), action), expected, places=12)
+            self.assertEqual(climber.edgeCosts[0, 0, 1], np.inf) # 'left' leaves the grid
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,128 @@
+import unittest
+from math import hypot
+import numpy as np
+from DiscretePlanning.memoryBoundedSearch import ForwardIDAStar, ForwardSMAStar
+from DiscretePlanning.forwardSearchAlgorithms import ForwardDijkstraSearch
+from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from DiscretePlanning.Environments.HillClimber import HillClimber
+
+def height_function(x, y):
+    return 20 * np.exp(-((x - 4)**2 + (y - 4)**2) / 8)
+
+def distance_to_goal(state):
+    return hypot(state[0] - 8, state[1])
+
+class TestMemoryBoundedSearch(unittest.TestCase):
+    grid = {
+        'A': {'right': ('B', 2.0), 'down': ('D', 1.0)},
+        'B': {'left': ('A', 2.0), 'right': ('C', 2.0), 'down': ('E', 3.0)},
+        'C': {'left': ('B', 2.0), 'down': ('F', 2.0)},
+        'D': {'up': ('A', 1.0), 'right': ('E', 4.0), 'down': ('G', 2.0)},
+        'E': {'up': ('B', 3.0), 'left': ('D', 4.0), 'right': ('F', 1.0), 'down': ('H', 2.0)},
+        'F': {'up': ('C', 2.0), 'left': ('E', 1.0), 'down': ('I', 3.0)},
+        'G': {'up': ('D', 2.0), 'right': ('H', 3.0)},
+        'H': {'up': ('E', 2.0), 'left': ('G', 3.0), 'right': ('I', 2.0)},
+        'I': {'up': ('F', 3.0), 'left': ('H', 2.0)},
+        'Z': {}
+    }
+
+    def gridProblem(self, goalStates) -> DiscretePlanningProblem:
+        return DiscretePlanningProblem(lambda state: state in self.grid, lambda state: set(self.grid[state].keys()),
+                                       lambda state, action: self.grid[state][action][0], 'A', goalStates,
+                                       costFunction=lambda state, action: self.grid[state][action][1])
+
+    def climber(self) -> HillClimber:
+        # climbing costs at least the horizontal distance, so distance_to_goal is admissible
+        return HillClimber(height_function, (9, 9), (0, 8), {(8, 0)}, stateEncoding='tuple')
+
+    def test_requires_cost_function(self):
+        problem = DiscretePlanningProblem(lambda state: True, lambda state: set(), lambda state, action: state, 'A', {'B'})
+        for solverClass in [ForwardIDAStar, ForwardSMAStar]:
+            with self.assertRaises(ValueError):
+                solverClass(problem)
+        with self.assertRaises(ValueError):
+            ForwardSMAStar(self.gridProblem({'I'}), nodeBudget=1)
+
+    def test_grid_least_cost(self):
+        expected = ForwardDijkstraSearch(self.gridProblem({'I'})).generateSolution()
+        for solver in [ForwardIDAStar(self.gridProblem({'I'})), ForwardSMAStar(self.gridProblem({'I'}), nodeBudget=6)]:
+            with self.subTest(solver=type(solver).__name__):
+                self.assertEqual(solver.generateSolution(), expected)
+                self.assertEqual(solver.solutionCost, 8.0)
+                self.assertTrue(solver.validateSolution(solver.solution))
+
+    def test_initial_goal_and_unreachable(self):
+        for solverClass in [ForwardIDAStar, ForwardSMAStar]:
+            with self.subTest(solver=solverClass.__name__):
+                self.assertEqual(solverClass(self.gridProblem({'A'})).generateSolution(), ['A'])
+                self.assertIsNone(solverClass(self.gridProblem({'Z'})).generateSolution())
+
+    def test_HillClimber_matches_Dijkstra(self):
+        climber = self.climber()
+        dijkstra = ForwardDijkstraSearch(climber.problem)
+        expected = dijkstra.generateSolution()
+        expectedCost = dijkstra.costTable[(8, 0)]
+        ida = ForwardIDAStar(climber.problem, distance_to_goal)
+        solution = ida.generateSolution()
+        self.assertAlmostEqual(ida.solutionCost, expectedCost, places=9)
+        self.assertEqual(len(solution), len(expected))
+        self.assertGreater(ida.iterations, 1)
+        self.assertLessEqual(ida.metrics.peakVisited, 81) # the path is simple, at most one visit per cell
+        for budget in [10000, 50, 20]:
+            with self.subTest(budget=budget):
+                sma = ForwardSMAStar(climber.problem, distance_to_goal, nodeBudget=budget)
+                solution = sma.generateSolution()
+                self.assertTrue(sma.validateSolution(solution))
+                self.assertAlmostEqual(sma.solutionCost, expectedCost, places=9)
+                # the budget holds between expansions, an expansion adds at most 8 successors
+                self.assertLessEqual(sma.metrics.peakVisited, budget + 8)
+
+    def test_budget_too_small(self):
+        # a corridor 0 -> 1 -> ... -> 9, the solution has 10 states
+        corridor = DiscretePlanningProblem(lambda state: 0 <= state < 10,
+                                           lambda state: {action for action, valid in [('forward', state < 9), ('back', state > 0)] if valid},
+                                           lambda state, action: state + 1 if action == 'forward' else state - 1, 0, {9},
+                                           costFunction=lambda state, action: 1.0)
+        self.assertIsNone(ForwardSMAStar(corridor, nodeBudget=9).generateSolution())
+        solver = ForwardSMAStar(corridor, nodeBudget=10)
+        self.assertEqual(solver.generateSolution(), list(range(10)))
+        self.assertEqual(solver.solutionCost, 9.0)
+
+    def test_SMAStar_parallel_edges(self):
+        # 'expensive' is seen before 'cheap', both lead from 0 to 2
+        edges = {0: [('expensive', 2, 7.0), ('cheap', 2, 2.0), ('detour', 1, 1.0)], 1: [('on', 2, 3.0)],
+                 2: [('last', 3, 1.0)], 3: []}
+        problem = DiscretePlanningProblem(lambda state: state in edges,
+                                          lambda state: [action for action, _, _ in edges[state]],
+                                          lambda state, action: next(successor for name, successor, _ in edges[state] if name == action),
+                                          0, {3},
+                                          costFunction=lambda state, action: next(cost for name, _, cost in edges[state] if name == action))
+        for budget in [3, 4, 16]:
+            with self.subTest(budget=budget):
+                solver = ForwardSMAStar(problem, nodeBudget=budget)
+                self.assertEqual(solver.generateSolution(), [0, 2, 3])
+                self.assertEqual(solver.solutionCost, 3.0)
+
+    def test_SMAStar_random_multigraphs(self):
+        rng = np.random.default_rng(0)
+        for trial in range(30):
+            edges = {state: [] for state in range(8)}
+            for index in range(24):
+                source, target = rng.integers(0, 8, 2).tolist()
+                edges[source].append((index, target, float(rng.integers(1, 10))))
+            problem = DiscretePlanningProblem(lambda state: state in edges,
+                                              lambda state: [action for action, _, _ in edges[state]],
+                                              lambda state, action: next(successor for name, successor, _ in edges[state] if name == action),
+                                              0, {7},
+                                              costFunction=lambda state, action: next(cost for name, _, cost in edges[state] if name == action))
+            dijkstra = ForwardDijkstraSearch(problem)
+            if dijkstra.generateSolution() is None:
+                continue
+            with self.subTest(trial=trial):
+                # a budget of 8 always fits the solution, smaller trees force pruned branches to be regenerated
+                solver = ForwardSMAStar(problem, nodeBudget=8)
+                solver.generateSolution()
+                self.assertEqual(solver.solutionCost, dijkstra.costTable[7])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+from math import inf
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import numpy as np
+from DiscretePlanning.forwardSearchAlgorithms import ForwardAStar, ForwardDijkstraSearch
+from DiscretePlanning.patternDatabase import PatternDatabase
+from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from DiscretePlanning.Environments.HillClimber import HillClimber
+
+def height_function(x, y):
+    return 20 * np.exp(-((x - 8)**2 + (y - 8)**2) / 20) + 8 * np.exp(-((x - 15)**2 + (y - 15)**2) / 30)
+
+class TestPatternDatabase(unittest.TestCase):
+    size = (20, 20)
+
+    def climber(self, start=(1, 19), goal=(19, 1)) -> HillClimber:
+        return HillClimber(height_function, self.size, start, {goal}, stateEncoding='tuple')
+
+    def test_requires_predecessor_function(self):
+        problem = DiscretePlanningProblem(lambda state: True, lambda state: set(), lambda state, action: state, 'A', {'B'},
+                                          costFunction=lambda state, action: 1.0)
+        with self.assertRaises(ValueError):
+            PatternDatabase(problem)
+
+    def test_rejects_goal_predicate(self):
+        # the predicate goals can not seed the backward search, the table would overestimate their cost-to-go
+        problem = DiscretePlanningProblem(lambda state: state in 'ABC', lambda state: {'next'} if state != 'C' else set(),
+                                          lambda state, action: chr(ord(state) + 1), 'A', {'C'},
+                                          predecessorFunction=lambda state: {(chr(ord(state) - 1), 'next')} if state != 'A' else set(),
+                                          costFunction=lambda state, action: 1.0, goalPredicate=lambda state: state == 'B')
+        with self.assertRaises(ValueError):
+            PatternDatabase(problem)
+        self.assertEqual(PatternDatabase(problem, goalStates={'B', 'C'})('A'), 1.0)
+
+    def test_cost_to_go_is_exact(self):
+        climber = self.climber()
+        for store_options in [None, climber.compactStoreOptions()]:
+            with self.subTest(store=store_options and store_options['type']):
+                database = PatternDatabase(climber.problem, store_options=store_options)
+                self.assertEqual(database.expansions, self.size[0] * self.size[1])
+                self.assertEqual(database((19, 1)), 0.0)
+                # climbing costs more than descending, so compare against a forward search from each start
+                for start in [(1, 19), (0, 0), (10, 10)]:
+                    solver = ForwardDijkstraSearch(self.climber(start=start).problem)
+                    solver.generateSolution()
+                    self.assertAlmostEqual(database(start), solver.costTable[(19, 1)], places=9)
+                self.assertEqual(len(database.costToGo), self.size[0] * self.size[1])
+
+    def test_AStar_expansions_follow_path(self):
+        climber = self.climber()
+        database = PatternDatabase(climber.problem)
+        dijkstra = ForwardDijkstraSearch(climber.problem)
+        expected = dijkstra.generateSolution()
+        astar = ForwardAStar(climber.problem, heuristic=database)
+        solution = astar.generateSolution()
+        self.assertAlmostEqual(astar.costTable[(19, 1)], dijkstra.costTable[(19, 1)], places=9)
+        self.assertEqual(len(solution), len(expected))
+        self.assertLessEqual(astar.expansions, 2 * len(solution))
+        self.assertLess(astar.expansions, dijkstra.expansions)
+
+    def test_abstraction_and_unreachable(self):
+        # a 1-dimensional abstraction of the grid: rows, with unit cost between neighbouring rows
+        rows = DiscretePlanningProblem(lambda row: 0 <= row < 20, lambda row: {'up', 'down'},
+                                       lambda row, action: row - 1 if action == 'up' else row + 1, 0, {0},
+                                       predecessorFunction=lambda row: {(predecessor, action) for predecessor, action in
+                                                                        [(row + 1, 'up'), (row - 1, 'down')] if 0 <= predecessor < 20},
+                                       costFunction=lambda row, action: 1.0)
+        database = PatternDatabase(rows, abstraction=lambda state: state[1])
+        self.assertEqual(database((7, 5)), 5.0)
+        self.assertEqual(database((7, 25)), inf)
+
+    def test_cache_file(self):
+        climber = self.climber()
+        with TemporaryDirectory() as directory:
+            cacheFile = Path(directory) / 'pdb.pkl'
+            built = PatternDatabase(climber.problem, cacheFile=cacheFile)
+            self.assertTrue(cacheFile.is_file())
+            loaded = PatternDatabase(climber.problem, cacheFile=cacheFile, store_options=climber.compactStoreOptions())
+            self.assertEqual(loaded.expansions, 0)
+            self.assertEqual(dict(loaded.costToGo.items()), dict(built.costToGo.items()))
+            rebuilt = PatternDatabase(climber.problem, goalStates={(0, 0)}, cacheFile=cacheFile)
+            self.assertGreater(rebuilt.expansions, 0)
+            self.assertEqual(rebuilt((0, 0)), 0.0)
+
+    def test_cache_file_rejects_other_problems(self):
+        climber = self.climber()
+        flat = HillClimber(lambda x, y: 0.0 * x, self.size, (1, 19), {(19, 1)}, stateEncoding='tuple')
+        with TemporaryDirectory() as directory:
+            cacheFile = Path(directory) / 'pdb.pkl'
+            PatternDatabase(climber.problem, cacheFile=cacheFile, cacheKey='hills')
+            # same goals and key on another height field, caught by the sampled cost check
+            rebuilt = PatternDatabase(flat.problem, cacheFile=cacheFile, cacheKey='hills')
+            self.assertGreater(rebuilt.expansions, 0)
+            self.assertAlmostEqual(rebuilt((1, 19)), 18 * 2 ** 0.5, places=9)
+            # the cache now holds the flat table, the key and the abstraction are part of its identity
+            self.assertGreater(PatternDatabase(flat.problem, cacheFile=cacheFile, cacheKey='flat').expansions, 0)
+            self.assertEqual(PatternDatabase(flat.problem, cacheFile=cacheFile, cacheKey='flat').expansions, 0)
+            self.assertGreater(PatternDatabase(flat.problem, cacheFile=cacheFile, cacheKey='flat',
+                                               abstraction=lambda state: state).expansions, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+import numpy as np
+from DiscretePlanning.plan import Plan
+from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from DiscretePlanning.forwardSearchAlgorithms import ForwardBFS, ForwardDijkstraSearch
+from DiscretePlanning.stateStore import StateInterner
+from DiscretePlanning.Environments.HillClimber import HillClimber
+
+def height_function(x, y):
+    return 20 * np.exp(-((x - 8)**2 + (y - 8)**2) / 20) + 8 * np.exp(-((x - 15)**2 + (y - 15)**2) / 30)
+
+class TestPlan(unittest.TestCase):
+    # multigraph, 'A' reaches 'B' through a cheap and an expensive action
+    edges = {
+        'A': {'cheap': ('B', 1.0), 'expensive': ('B', 5.0), 'skip': ('C', 7.0)},
+        'B': {'next': ('C', 2.0)},
+        'C': {'next': ('D', 3.0)},
+        'D': {},
+    }
+
+    def problem(self, withCosts: bool = True) -> DiscretePlanningProblem:
+        edges = self.edges
+        return DiscretePlanningProblem(lambda state: state in edges, lambda state: set(edges[state]),
+                                       lambda state, action: edges[state][action][0], 'A', {'D'},
+                                       costFunction=(lambda state, action: edges[state][action][1]) if withCosts else None)
+
+    def test_from_states(self):
+        plan = Plan.fromStates(self.problem(), ['A', 'B', 'C', 'D'])
+        self.assertEqual(len(plan), 4)
+        self.assertEqual(list(plan), ['A', 'B', 'C', 'D'])
+        self.assertEqual(plan[0], 'A')
+        self.assertEqual(plan[-1], 'D')
+        self.assertEqual(plan.actions, ['cheap', 'next', 'next'])
+        self.assertEqual(plan.totalCost, 6.0)
+        self.assertEqual(list(plan.cumulativeCosts), [0.0, 1.0, 3.0, 6.0])
+        self.assertEqual(plan.nbytes, 4 * 4 + 3 * 4 + 4 * 8)
+
+    def test_without_costs(self):
+        plan = Plan.fromStates(self.problem(withCosts=False), ['A', 'B', 'C'])
+        self.assertIsNone(plan.totalCost)
+        self.assertIsNone(plan.cumulativeCosts)
+        self.assertEqual(len(plan.actions), 2)
+
+    def test_invalid_plans(self):
+        with self.assertRaises(ValueError):
+            Plan.fromStates(self.problem(), ['A', 'D'])
+        with self.assertRaises(ValueError):
+            Plan.fromStates(self.problem(), [])
+
+    def test_zero_copy_slicing(self):
+        plan = Plan.fromStates(self.problem(), ['A', 'B', 'C', 'D'])
+        tail = plan[1:]
+        self.assertEqual(list(tail), ['B', 'C', 'D'])
+        self.assertEqual(tail.actions, ['next', 'next'])
+        self.assertEqual(tail.totalCost, 5.0)
+        self.assertIs(tail.stateIds.obj, plan.stateIds.obj)
+        self.assertEqual(list(plan[1:2]), ['B'])
+        self.assertEqual(plan[1:2].actions, [])
+        with self.assertRaises(ValueError):
+            plan[::2]
+        with self.assertRaises(ValueError):
+            plan[2:2]
+
+    def test_shared_indices(self):
+        stateIndex, actionIndex = StateInterner(), StateInterner()
+        problem = self.problem()
+        first = Plan.fromStates(problem, ['A', 'B', 'C'], stateIndex, actionIndex)
+        second = Plan.fromStates(problem, ['B', 'C', 'D'], stateIndex, actionIndex)
+        self.assertEqual(len(stateIndex), 4)
+        self.assertEqual(len(actionIndex), 2)
+        self.assertEqual(list(second.stateIds), [1, 2, 3])
+        self.assertEqual(list(first), ['A', 'B', 'C'])
+
+    def test_generate_and_validate_plan(self):
+        problem = self.problem()
+        solver = ForwardDijkstraSearch(problem)
+        plan = solver.generatePlan()
+        self.assertEqual(list(plan), solver.solution)
+        self.assertEqual(plan.totalCost, 6.0)
+        self.assertTrue(solver.validateSolution(plan))
+        self.assertFalse(solver.validateSolution(plan[:1]))
+        self.assertEqual(solver.stringifySolution(plan), 'A -> B -> C -> D')
+
+    def test_unreachable_goal(self):
+        problem = self.problem()
+        problem.goalStates = {'Z'}
+        self.assertIsNone(ForwardBFS(problem).generatePlan())
+
+    def test_compact_solver_shares_state_ids(self):
+        climber = HillClimber(height_function, (20, 20), 0, {19 * 20 + 19}, stateEncoding='index')
+        solver = ForwardDijkstraSearch(climber.problem, store_options=climber.compactStoreOptions())
+        plan = solver.generatePlan()
+        self.assertIs(plan.stateIndex, solver.stateIndex)
+        self.assertEqual(list(plan.stateIds), solver.solution)
+        self.assertTrue(solver.validateSolution(plan))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import heapq
+import random
+from DiscretePlanning.priorityQueue import IndexedPriorityQueue
+
+class TestIndexedPriorityQueue(unittest.TestCase):
+    def test_push_pop_order(self):
+        queue = IndexedPriorityQueue()
+        for item in [(3.0, 'C'), (1.0, 'A'), (2.0, 'B'), (1.0, 'Z')]:
+            self.assertIsNone(queue.push(item))
+        self.assertEqual(len(queue), 4)
+        self.assertEqual([queue.pop() for _ in range(4)], [(1.0, 'A'), (1.0, 'Z'), (2.0, 'B'), (3.0, 'C')])
+        self.assertFalse(queue)
+
+    def test_decrease_key(self):
+        queue = IndexedPriorityQueue()
+        queue.push((5.0, 'A'))
+        queue.push((3.0, 'B'))
+        replaced = queue.push((1.0, 'A'))
+        self.assertEqual(replaced, (5.0, 'A'))
+        self.assertEqual(len(queue), 2)
+        self.assertEqual(queue.priority('A'), 1.0)
+        self.assertEqual(queue.pop(), (1.0, 'A'))
+        self.assertNotIn('A', queue)
+        self.assertIn('B', queue)
+
+    def test_increase_key(self):
+        queue = IndexedPriorityQueue()
+        queue.push((1.0, 'A'))
+        queue.push((2.0, 'B'))
+        queue.push((3.0, 'A'))
+        self.assertEqual([queue.pop(), queue.pop()], [(2.0, 'B'), (3.0, 'A')])
+
+    def test_matches_heapq_without_stale_items(self):
+        rng = random.Random(7)
+        queue = IndexedPriorityQueue()
+        reference = []
+        best = {}
+        for _ in range(500):
+            if reference and rng.random() < 0.3:
+                # drop stale reference items before comparing pops
+                while reference[0][0] != best.get(reference[0][1]):
+                    heapq.heappop(reference)
+                expected = heapq.heappop(reference)
+                del best[expected[1]]
+                self.assertEqual(queue.pop(), expected)
+            else:
+                state = rng.randrange(50)
+                priority = float(rng.randrange(100))
+                if state in best and best[state] <= priority:
+                    continue
+                best[state] = priority
+                heapq.heappush(reference, (priority, state))
+                queue.push((priority, state))
+            self.assertEqual(len(queue), len(best))
+
+if __name__ == '__main__':
+    unittest.main()
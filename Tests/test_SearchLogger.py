@@ -2,7 +2,10 @@ import os
 import unittest
 import json
 from pathlib import Path
-from DiscretePlanning.planningSearchVisualization import SearchLogger
+from json import dumps
+from unittest.mock import patch
+from DiscretePlanning.planningSearchVisualization import SearchLogger, ConcurrentSearchLogger
+from DiscretePlanning.logSerializers import BinaryRecordSerializer, JsonLinesSerializer, createSerializer, serializerForPath
 
 class TestSearchLogger(unittest.TestCase):
     def setUp(self):
@@ -266,5 +269,223 @@ class TestSearchLogger(unittest.TestCase):
         with open(self.non_existing_log_file, 'r') as file:
             log_data = json.load(file)
             self.assertEqual(log_data, [entry])
+class TestConcurrentSearchLogger(unittest.TestCase):
+    def setUp(self):
+        self.existing_dir = Path("Tests/TestPath")
+        self.existing_dir.mkdir(exist_ok=True)
+        self.non_existing_dir = Path("non_existing_logs")
+        self.logFile = self.existing_dir / "test_concurrent_log.json"
+        self.non_existing_log_file = self.non_existing_dir / "test_concurrent_log.json"
+
+    def tearDown(self):
+        for file in self.existing_dir.glob("*.json"):
+            os.remove(file)
+        if self.existing_dir.exists():
+            os.rmdir(self.existing_dir)
+        if self.non_existing_dir.exists():
+            os.rmdir(self.non_existing_dir)
+
+    def test_concurrent_log_write_multiple_writes(self):
+        logger = ConcurrentSearchLogger(self.logFile, queueSize=2)
+        entries = [{"Event": f"expand_node_{i}", "Entry": {"current state": i, "frontier": [i + 1, i + 2]}} for i in range(50)]
+        for entry in entries:
+            logger.logState(entry["Event"], entry["Entry"])
+            logger.logWrite()
+        logger.closeLog()
+
+        with open(self.logFile, 'r') as f:
+            log_data = json.load(f)
+        updated_entries = [{**entry, "Log Entry Number": i + 1} for i, entry in enumerate(entries)]
+        self.assertEqual(log_data, updated_entries)
+
+    def test_concurrent_log_write_matches_synchronous_logger(self):
+        syncFile = self.existing_dir / "test_sync_log.json"
+        loggers = [SearchLogger(syncFile), ConcurrentSearchLogger(self.logFile)]
+        for logger in loggers:
+            for i in range(5):
+                logger.logState("expand_node", {"state": str(i), (i, i): {"nested_key": i}})
+                logger.logState("consider_node", {"state": str(i)})
+                logger.logWrite()
+            logger.closeLog()
+
+        self.assertEqual(syncFile.read_text(), self.logFile.read_text())
+
+    def test_concurrent_log_write_switches_files(self):
+        logger = ConcurrentSearchLogger(self.logFile, maxLines=10)
+        for i in range(6):
+            logger.logState("expand_node", {"state": i})
+            logger.logWrite()
+        logger.closeLog()
+
+        log_files = sorted(self.existing_dir.glob("test_concurrent_log*.json"))
+        self.assertGreater(len(log_files), 1)
+        log_data = []
+        for file in log_files:
+            with open(file, 'r') as f:
+                log_data += json.load(f)
+        self.assertEqual([event["Entry"]["state"] for event in log_data], list(range(6)))
+
+    def test_concurrent_log_write_empty(self):
+        logger = ConcurrentSearchLogger(self.logFile)
+        logger.logWrite()
+        logger.closeLog()
+
+        with open(self.logFile, 'r') as f:
+            logData = f.read()
+
+        self.assertEqual(logData, "")
+
+    def test_concurrent_close_without_write(self):
+        logger = ConcurrentSearchLogger(self.logFile)
+        logger.closeLog()
+        self.assertFalse(self.logFile.exists())
+
+    def test_concurrent_log_write_directory_does_not_exist_no_create_option(self):
+        logger = ConcurrentSearchLogger(self.non_existing_log_file)
+        logger.logState("Test", {"State": "A", "Next": "B"})
+
+        with self.assertRaises(ValueError) as context:
+            logger.logWrite()
+
+        logger.closeLog()
+        self.assertTrue(f'Parent Directory {self.non_existing_dir} does not exist' in str(context.exception))
+
+class TestJsonLinesSearchLogger(unittest.TestCase):
+    def setUp(self):
+        self.existing_dir = Path("Tests/TestPath")
+        self.existing_dir.mkdir(exist_ok=True)
+        self.logFile = self.existing_dir / "test_log.jsonl"
+
+    def tearDown(self):
+        for file in self.existing_dir.glob("*"):
+            os.remove(file)
+        os.rmdir(self.existing_dir)
+
+    def _read_lines(self, path: Path):
+        return [json.loads(line) for line in path.read_text().splitlines()]
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            SearchLogger(self.logFile, logFormat='xml')
+
+    def test_suffix_matches_format(self):
+        # a JSON Lines log under a '.json' name would be replayed as a JSON array
+        for loggerClass in [SearchLogger, ConcurrentSearchLogger]:
+            with self.subTest(logger=loggerClass.__name__):
+                with self.assertRaises(ValueError):
+                    loggerClass(self.existing_dir / "test_log.json", logFormat='jsonl')
+                with self.assertRaises(ValueError):
+                    loggerClass(self.logFile)
+
+    def test_jsonl_one_compact_entry_per_line(self):
+        logger = SearchLogger(self.logFile, logFormat='jsonl')
+        logger.logState("expand_node", {"current_state": "A", "frontier": ["B", "C"]})
+        logger.logState("expand_node", {"current_state": "B"})
+        logger.logWrite()
+        logger.logState("goal", {"current_state": "C"})
+        logger.logWrite()
+        logger.closeLog()
+
+        content = self.logFile.read_text()
+        self.assertNotIn("[\n", content)
+        self.assertNotIn("    ", content)
+        self.assertEqual(content.count("\n"), 3)
+        entries = self._read_lines(self.logFile)
+        self.assertEqual([entry["Log Entry Number"] for entry in entries], [1, 2, 3])
+        self.assertEqual(entries[0]["Entry"], {"current_state": "A", "frontier": ["B", "C"]})
+        self.assertEqual(logger.lines, 3)
+
+    def test_jsonl_switches_files(self):
+        logger = SearchLogger(self.logFile, maxLines=2, logFormat='jsonl')
+        for i in range(5):
+            logger.logState("step", {"i": i})
+            logger.logWrite()
+        logger.closeLog()
+        files = [self.logFile, self.logFile.with_stem("test_log_1"), self.logFile.with_stem("test_log_2")]
+        entries = [entry["Entry"]["i"] for file in files for entry in self._read_lines(file)]
+        self.assertEqual(entries, list(range(5)))
+
+    def test_concurrent_jsonl_matches_synchronous_logger(self):
+        concurrentFile = self.existing_dir / "concurrent_log.jsonl"
+        loggers = [SearchLogger(self.logFile, logFormat='jsonl'),
+                   ConcurrentSearchLogger(concurrentFile, logFormat='jsonl')]
+        for logger in loggers:
+            for i in range(10):
+                logger.logState("step", {"i": i})
+                logger.logWrite()
+            logger.closeLog()
+        self.assertEqual(self.logFile.read_text(), concurrentFile.read_text())
+
+    def test_json_close_reads_tail_only(self):
+        logFile = self.existing_dir / "test_log.json"
+        logger = SearchLogger(logFile)
+        logger.logState("step", {"value": "x" * 1000})
+        logger.logWrite()
+        logger.closeLog()
+        logger.closeLog() # closing twice must not add a second bracket
+        self.assertEqual(json.loads(logFile.read_text())[0]["Entry"]["value"], "x" * 1000)
+
+class TestLogSerializers(unittest.TestCase):
+    def setUp(self):
+        self.existing_dir = Path("Tests/TestPath")
+        self.existing_dir.mkdir(exist_ok=True)
+
+    def tearDown(self):
+        for file in self.existing_dir.glob("*"):
+            os.remove(file)
+        os.rmdir(self.existing_dir)
+
+    def _write(self, logger, count: int):
+        for i in range(count):
+            logger.logState("step", {"i": i, "state": (i, i + 1), "table": {(i, 0): "A"}})
+            logger.logWrite()
+        logger.closeLog()
+
+    def test_binary_round_trip(self):
+        for loggerClass in [SearchLogger, ConcurrentSearchLogger]:
+            with self.subTest(logger=loggerClass.__name__):
+                logFile = self.existing_dir / f"{loggerClass.__name__}.slog"
+                self._write(loggerClass(logFile, logFormat='binary'), 5)
+                self.assertTrue(logFile.read_bytes().startswith(BinaryRecordSerializer.header))
+                with logFile.open('rb') as file:
+                    entries = list(BinaryRecordSerializer().iterRecords(file))
+                self.assertEqual([entry["Entry"]["i"] for entry in entries], list(range(5)))
+                self.assertEqual(entries[2]["Entry"], {"i": 2, "state": [2, 3], "table": {"(2, 0)": "A"}})
+                self.assertEqual([entry["Log Entry Number"] for entry in entries], [1, 2, 3, 4, 5])
+
+    def test_binary_requires_slog_suffix(self):
+        with self.assertRaises(ValueError):
+            SearchLogger(self.existing_dir / "log.json", logFormat='binary')
+        self.assertEqual(serializerForPath(self.existing_dir / "log.slog").suffix, '.slog')
+
+    def test_binary_truncated_record(self):
+        logFile = self.existing_dir / "log.slog"
+        self._write(SearchLogger(logFile, logFormat='binary'), 2)
+        logFile.write_bytes(logFile.read_bytes()[:-3])
+        with logFile.open('rb') as file:
+            with self.assertRaises(ValueError):
+                list(BinaryRecordSerializer().iterRecords(file))
+
+    def test_entries_serialized_once(self):
+        class CountingSerializer(JsonLinesSerializer):
+            calls = 0
+            def serialize(self, entry):
+                CountingSerializer.calls += 1
+                return super().serialize(entry)
+
+        for loggerClass in [SearchLogger, ConcurrentSearchLogger]:
+            with self.subTest(logger=loggerClass.__name__):
+                CountingSerializer.calls = 0
+                logFile = self.existing_dir / f"{loggerClass.__name__}.jsonl"
+                with patch('DiscretePlanning.logSerializers.dumps', wraps=dumps) as mock_dumps:
+                    self._write(loggerClass(logFile, logFormat=CountingSerializer()), 4)
+                self.assertEqual(CountingSerializer.calls, 4)
+                self.assertEqual(mock_dumps.call_count, 4)
+
+    def test_invalid_serializer(self):
+        with self.assertRaises(ValueError):
+            createSerializer('msgpack')
+        self.assertIsInstance(createSerializer('jsonl'), JsonLinesSerializer)
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,169 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from json import dumps
+import numpy as np
+from DiscretePlanning.forwardSearchAlgorithms import ForwardBFS, ForwardDFS, ForwardDijkstraSearch, ForwardAStar
+from DiscretePlanning.bidirectionalSearch import BidirectionalBFS, BidirectionalDijkstraSearch
+from DiscretePlanning.memoryBoundedSearch import ForwardIDAStar, ForwardSMAStar
+from DiscretePlanning.gridSearch import GridSearch
+from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from DiscretePlanning.searchMetrics import SearchMetrics, TIMED_CALLBACKS
+from DiscretePlanning.Environments.HillClimber import HillClimber
+
+def height_function(x, y):
+    return 20 * np.exp(-((x - 8)**2 + (y - 8)**2) / 20) + 8 * np.exp(-((x - 15)**2 + (y - 15)**2) / 30)
+
+class TestSearchMetrics(unittest.TestCase):
+    grid = {
+        'A': {'right': ('B', 2.0), 'down': ('D', 1.0)},
+        'B': {'left': ('A', 2.0), 'right': ('C', 2.0), 'down': ('E', 3.0)},
+        'C': {'left': ('B', 2.0), 'down': ('F', 2.0)},
+        'D': {'up': ('A', 1.0), 'right': ('E', 4.0), 'down': ('G', 2.0)},
+        'E': {'up': ('B', 3.0), 'left': ('D', 4.0), 'right': ('F', 1.0), 'down': ('H', 2.0)},
+        'F': {'up': ('C', 2.0), 'left': ('E', 1.0), 'down': ('I', 3.0)},
+        'G': {'up': ('D', 2.0), 'right': ('H', 3.0)},
+        'H': {'up': ('E', 2.0), 'left': ('G', 3.0), 'right': ('I', 2.0)},
+        'I': {'up': ('F', 3.0), 'left': ('H', 2.0)}
+    }
+
+    def predecessorFunction(self, state: str):
+        return {(predecessor, action) for predecessor, actions in self.grid.items()
+                for action, (successor, _) in actions.items() if successor == state}
+
+    def gridProblem(self, successorCacheSize: int = 0) -> DiscretePlanningProblem:
+        return DiscretePlanningProblem(lambda state: state in self.grid, lambda state: set(self.grid[state].keys()),
+                                       lambda state, action: self.grid[state][action][0], 'A', {'I'},
+                                       predecessorFunction=self.predecessorFunction,
+                                       costFunction=lambda state, action: self.grid[state][action][1],
+                                       successorCacheSize=successorCacheSize)
+
+    @staticmethod
+    def counters(metrics: SearchMetrics) -> dict:
+        counters = metrics.asDict()
+        del counters['elapsed'], counters['searchTime']
+        return counters
+
+    def test_counters(self):
+        for solverClass in [ForwardBFS, ForwardDFS, ForwardDijkstraSearch, ForwardAStar]:
+            with self.subTest(solver=solverClass.__name__):
+                solver = solverClass(self.gridProblem())
+                solver.generateSolution()
+                metrics = solver.metrics
+                self.assertIsInstance(metrics, SearchMetrics)
+                self.assertEqual(metrics.expansions, solver.expansions)
+                self.assertGreater(metrics.expansions, 0)
+                self.assertEqual(metrics.pushes, metrics.expansions + len(solver.frontier))
+                self.assertEqual(metrics.peakVisited, len(solver.visitedTable))
+                self.assertGreaterEqual(metrics.generated, metrics.duplicates)
+                self.assertGreaterEqual(metrics.peakFrontier, 1)
+                self.assertGreater(metrics.elapsed, 0.0)
+                self.assertEqual(metrics.callbackCalls, dict.fromkeys(TIMED_CALLBACKS, 0))
+
+    def test_stale_pops(self):
+        # on the terrain many states are reached again at a lower cost, leaving superseded entries in a plain heap
+        climber = HillClimber(height_function, (20, 20), (1, 19), {(19, 1)}, stateEncoding='tuple')
+        for queueType, expectStale in [('heapq', True), ('indexed', False)]:
+            with self.subTest(queue=queueType):
+                dijkstra = ForwardDijkstraSearch(climber.problem, queue_options={'type': queueType})
+                dijkstra.generateSolution()
+                astar = ForwardAStar(climber.problem, queue_options={'type': queueType})
+                astar.generateSolution()
+                for solver in [dijkstra, astar]:
+                    self.assertEqual(solver.metrics.stalePops > 0, expectStale)
+                self.assertEqual(dijkstra.metrics.stalePops, astar.metrics.stalePops)
+
+    def test_repeated_searches_start_over(self):
+        climber = HillClimber(height_function, (12, 12), (1, 11), {(10, 2)}, stateEncoding='tuple')
+        solvers = [ForwardBFS(climber.problem), ForwardDFS(climber.problem), ForwardDijkstraSearch(climber.problem),
+                   ForwardAStar(climber.problem, queue_options={'type': 'indexed'}), ForwardIDAStar(self.gridProblem()),
+                   ForwardSMAStar(self.gridProblem(), nodeBudget=6), BidirectionalBFS(self.gridProblem()),
+                   BidirectionalDijkstraSearch(self.gridProblem()), GridSearch(climber, 'astar')]
+        for solver in solvers:
+            with self.subTest(solver=type(solver).__name__):
+                first = solver.generateSolution()
+                counters = self.counters(solver.metrics)
+                self.assertGreater(counters['expansions'], 0)
+                self.assertEqual(solver.generateSolution(), first)
+                self.assertEqual(self.counters(solver.metrics), counters)
+
+    def test_indexed_pushes_include_decrease_keys(self):
+        # both queues push once per cost improvement, the indexed queue replaces the entry instead of adding one
+        climber = HillClimber(height_function, (20, 20), (1, 19), {(19, 1)}, stateEncoding='tuple')
+        heap = ForwardDijkstraSearch(climber.problem)
+        heap.generateSolution()
+        indexed = ForwardDijkstraSearch(climber.problem, queue_options={'type': 'indexed'})
+        indexed.generateSolution()
+        self.assertGreater(indexed.frontier.replacements, 0)
+        self.assertEqual(indexed.metrics.pushes, heap.metrics.pushes)
+        self.assertEqual(indexed.metrics.pushes,
+                         indexed.metrics.expansions + len(indexed.frontier) + indexed.frontier.replacements)
+
+    def test_other_searches_fill_metrics(self):
+        climber = HillClimber(height_function, (12, 12), (1, 11), {(10, 2)}, stateEncoding='tuple')
+        tree = ForwardDijkstraSearch(climber.problem)
+        tree.generateShortestPathTree()
+        self.assertEqual(tree.metrics.expansions, len(tree.costTable))
+        self.assertEqual(tree.metrics.pushes, tree.metrics.expansions + tree.metrics.stalePops)
+        grid = GridSearch(climber)
+        grid.generateSolution()
+        self.assertEqual(grid.metrics.expansions, grid.expansions)
+        self.assertGreaterEqual(grid.metrics.pushes, grid.metrics.expansions)
+        for solver in [BidirectionalBFS(self.gridProblem()), BidirectionalDijkstraSearch(self.gridProblem())]:
+            with self.subTest(solver=type(solver).__name__):
+                solver.generateSolution()
+                metrics = solver.metrics
+                self.assertEqual(metrics.expansions, solver.expansions)
+                self.assertGreater(metrics.generated, 0)
+                self.assertEqual(metrics.peakVisited, len(solver.visitedTable) + len(solver.successorTable))
+                self.assertGreaterEqual(metrics.pushes, metrics.expansions)
+
+    def test_callback_timing(self):
+        problem = self.gridProblem(successorCacheSize=64)
+        actionFunction, costFunction = problem.actionFunction, problem.costFunction
+        solver = ForwardDijkstraSearch(problem, metrics_options={'timeCallbacks': True})
+        solution = solver.generateSolution()
+        metrics = solver.metrics
+        self.assertEqual(solution, ForwardDijkstraSearch(self.gridProblem()).generateSolution())
+        self.assertEqual(metrics.callbackCalls['actionFunction'], metrics.expansions - 1)
+        self.assertEqual(metrics.callbackCalls['transitionFunction'], metrics.generated)
+        self.assertGreater(metrics.callbackCalls['costFunction'], 0)
+        self.assertLessEqual(sum(metrics.callbackTime.values()), metrics.elapsed)
+        self.assertGreaterEqual(metrics.searchTime(), 0.0)
+        # callbacks are restored and memoized successors (and their costs) kept
+        self.assertIs(problem.actionFunction, actionFunction)
+        self.assertIs(problem.costFunction, costFunction)
+        self.assertGreater(len(problem.successorCache), 0)
+        dumps(metrics.asDict())
+
+    def test_successor_cache_shared(self):
+        problem = self.gridProblem(successorCacheSize=64)
+        first = ForwardDijkstraSearch(problem, metrics_options={'timeCallbacks': True})
+        second = ForwardAStar(problem, metrics_options={'timeCallbacks': True})
+        self.assertEqual(first.generateSolution(), second.generateSolution())
+        self.assertGreater(first.metrics.callbackCalls['actionFunction'], 0)
+        # the second solver expands the same states, their successors come from the problem's cache
+        self.assertEqual(second.metrics.callbackCalls, dict.fromkeys(TIMED_CALLBACKS, 0))
+        self.assertTrue(second.validateSolution(second.solution))
+
+    def test_cost_free_successors(self):
+        # the successor cache is opt-in, BFS and DFS never call the cost function
+        for solverClass in [ForwardBFS, ForwardDFS]:
+            with self.subTest(solver=solverClass.__name__):
+                problem = self.gridProblem()
+                solver = solverClass(problem, metrics_options={'timeCallbacks': True})
+                self.assertTrue(solver.validateSolution(solver.generateSolution()))
+                self.assertEqual(solver.metrics.callbackCalls['costFunction'], 0)
+                self.assertEqual(len(problem.successorCache), 0)
+
+    def test_instrumented_counters_match(self):
+        with TemporaryDirectory() as directory:
+            logged = ForwardAStar(self.gridProblem(), Path(directory) / 'log.json')
+            logged.generateSolution()
+        quiet = ForwardAStar(self.gridProblem())
+        quiet.generateSolution()
+        for counter in ['expansions', 'generated', 'duplicates', 'pushes', 'stalePops', 'peakFrontier', 'peakVisited']:
+            self.assertEqual(getattr(logged.metrics, counter), getattr(quiet.metrics, counter))
+
+if __name__ == '__main__':
+    unittest.main()
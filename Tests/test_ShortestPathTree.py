@@ -0,0 +1,75 @@
+import unittest
+from math import inf
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import numpy as np
+from DiscretePlanning.forwardSearchAlgorithms import ForwardDijkstraSearch
+from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from DiscretePlanning.shortestPathTree import ShortestPathTree
+from DiscretePlanning.Environments.HillClimber import HillClimber
+
+def height_function(x, y):
+    return 20 * np.exp(-((x - 8)**2 + (y - 8)**2) / 20) + 8 * np.exp(-((x - 15)**2 + (y - 15)**2) / 30)
+
+class TestShortestPathTree(unittest.TestCase):
+    grid = {
+        'A': {'right': ('B', 2.0), 'down': ('D', 1.0)},
+        'B': {'left': ('A', 2.0), 'right': ('C', 2.0), 'down': ('E', 3.0)},
+        'C': {'left': ('B', 2.0), 'down': ('F', 2.0)},
+        'D': {'up': ('A', 1.0), 'right': ('E', 4.0), 'down': ('G', 2.0)},
+        'E': {'up': ('B', 3.0), 'left': ('D', 4.0), 'right': ('F', 1.0), 'down': ('H', 2.0)},
+        'F': {'up': ('C', 2.0), 'left': ('E', 1.0), 'down': ('I', 3.0)},
+        'G': {'up': ('D', 2.0), 'right': ('H', 3.0)},
+        'H': {'up': ('E', 2.0), 'left': ('G', 3.0), 'right': ('I', 2.0)},
+        'I': {'up': ('F', 3.0), 'left': ('H', 2.0)},
+        'Z': {}
+    }
+
+    def gridProblem(self, goalStates=frozenset({'I'})) -> DiscretePlanningProblem:
+        return DiscretePlanningProblem(lambda state: state in self.grid, lambda state: set(self.grid[state].keys()),
+                                       lambda state, action: self.grid[state][action][0], 'A', goalStates,
+                                       costFunction=lambda state, action: self.grid[state][action][1])
+
+    def test_exhaustive_tree_matches_goal_searches(self):
+        for queueType in ['heapq', 'indexed']:
+            with self.subTest(queue=queueType):
+                tree = ForwardDijkstraSearch(self.gridProblem(), queue_options={'type': queueType}).generateShortestPathTree()
+                self.assertEqual(len(tree), 9)
+                self.assertIsNone(tree.costBound)
+                for goal in 'ABCDEFGHI':
+                    self.assertEqual(tree.pathTo(goal), ForwardDijkstraSearch(self.gridProblem({goal})).generateSolution())
+                self.assertEqual(tree.costTo('I'), 8.0)
+                self.assertEqual(tree.pathTo('A'), ['A'])
+                self.assertEqual(tree.costTo('Z'), inf)
+                self.assertIsNone(tree.pathTo('Z'))
+                self.assertNotIn('Z', tree)
+
+    def test_cost_bound(self):
+        solver = ForwardDijkstraSearch(self.gridProblem())
+        tree = solver.generateShortestPathTree(costBound=4.0)
+        self.assertEqual(set(tree), {'A', 'B', 'C', 'D', 'G'})
+        self.assertEqual(tree.costTo('C'), 4.0)
+        self.assertEqual(tree.pathTo('G'), ['A', 'D', 'G'])
+        self.assertEqual(tree.costTo('E'), inf)
+        self.assertEqual(solver.expansions, 5)
+
+    def test_save_and_load(self):
+        climber = HillClimber(height_function, (20, 20), (1, 19), {(19, 1)}, stateEncoding='tuple')
+        solver = ForwardDijkstraSearch(climber.problem, store_options=climber.compactStoreOptions())
+        tree = solver.generateShortestPathTree()
+        self.assertEqual(len(tree), 400)
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'tree.pkl'
+            tree.save(path)
+            loaded = ShortestPathTree.load(path)
+            path.write_bytes(b'\x80\x04N.')  # pickled None
+            with self.assertRaises(ValueError):
+                ShortestPathTree.load(path)
+        self.assertEqual(loaded.root, (1, 19))
+        for state in [(19, 1), (0, 0), (10, 10)]:
+            self.assertEqual(loaded.pathTo(state), tree.pathTo(state))
+            self.assertEqual(loaded.costTo(state), tree.costTo(state))
+        self.assertEqual(loaded.pathTo((19, 1)), ForwardDijkstraSearch(climber.problem).generateSolution())
+
+if __name__ == '__main__':
+    unittest.main()
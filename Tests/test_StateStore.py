@@ -0,0 +1,121 @@
+import unittest
+from typing import Set
+from DiscretePlanning.stateStore import StateInterner, StateEncoder, CompactParentTable, CompactCostTable
+from DiscretePlanning.planningProblem import DiscretePlanningProblem
+from DiscretePlanning.planningSearch import ForwardSearch
+from DiscretePlanning.forwardSearchAlgorithms import ForwardBFS, ForwardDijkstraSearch, ForwardAStar
+
+class TestCompactTables(unittest.TestCase):
+    def test_interner_dense_ids(self):
+        interner = StateInterner()
+        self.assertEqual(interner.intern('A'), 0)
+        self.assertEqual(interner.intern('B'), 1)
+        self.assertEqual(interner.intern('A'), 0)
+        self.assertEqual(interner.find('B'), 1)
+        self.assertIsNone(interner.find('C'))
+        self.assertEqual(interner.state(1), 'B')
+        self.assertEqual(len(interner), 2)
+
+    def test_parent_table_mapping_behaviour(self):
+        table = CompactParentTable(StateInterner())
+        table['A'] = None
+        table['B'] = 'A'
+        table['C'] = 'B'
+        self.assertIn('B', table)
+        self.assertNotIn('Z', table)
+        self.assertEqual(table['C'], 'B')
+        self.assertIsNone(table['A'])
+        self.assertEqual(len(table), 3)
+        self.assertEqual(dict(table), {'A': None, 'B': 'A', 'C': 'B'})
+        self.assertEqual(table.pathTo('C'), ['A', 'B', 'C'])
+        with self.assertRaises(KeyError):
+            table['Z']
+        del table['C']
+        self.assertNotIn('C', table)
+        self.assertEqual(len(table), 2)
+
+    def test_tables_share_ids(self):
+        interner = StateInterner()
+        parents = CompactParentTable(interner)
+        costs = CompactCostTable(interner)
+        costs['B'] = 2.5
+        self.assertNotIn('B', parents)
+        parents['A'] = None
+        parents['B'] = 'A'
+        self.assertEqual(costs['B'], 2.5)
+        self.assertNotIn('A', costs)
+        self.assertEqual(len(interner), 2)
+
+    def test_encoder_tables(self):
+        width = 4
+        encoder = StateEncoder(lambda state: state[1] * width + state[0], lambda index: (index % width, index // width), 16)
+        parents = CompactParentTable(encoder)
+        parents[(0, 0)] = None
+        parents[(1, 0)] = (0, 0)
+        parents[(1, 1)] = (1, 0)
+        self.assertEqual(len(parents), 3)
+        self.assertNotIn((3, 3), parents)
+        self.assertEqual(parents.pathTo((1, 1)), [(0, 0), (1, 0), (1, 1)])
+
+    def test_encoder_ids_out_of_range(self):
+        width = 4
+        encoder = StateEncoder(lambda state: state[1] * width + state[0], lambda index: (index % width, index // width), 16)
+        parents = CompactParentTable(encoder)
+        costs = CompactCostTable(encoder)
+        parents[(3, 3)] = None
+        costs[(3, 3)] = 1.0
+        # (-1, 0) maps to -1, which must not alias the last cell (3, 3)
+        self.assertIsNone(encoder.find((-1, 0)))
+        self.assertNotIn((-1, 0), parents)
+        with self.assertRaises(KeyError):
+            costs[(-1, 0)]
+        with self.assertRaises(ValueError):
+            parents[(-1, 0)] = None
+        with self.assertRaises(ValueError):
+            costs[(0, 4)] = 2.0
+        with self.assertRaises(IndexError):
+            encoder.state(16)
+        self.assertEqual(costs[(3, 3)], 1.0)
+        self.assertEqual(len(parents), 1)
+
+class TestCompactStoreSolvers(unittest.TestCase):
+    grid = {
+        'A': {'right': ('B', 2.0), 'down': ('D', 1.0)},
+        'B': {'left': ('A', 2.0), 'right': ('C', 2.0), 'down': ('E', 3.0)},
+        'C': {'left': ('B', 2.0), 'down': ('F', 2.0)},
+        'D': {'up': ('A', 1.0), 'right': ('E', 4.0), 'down': ('G', 2.0)},
+        'E': {'up': ('B', 3.0), 'left': ('D', 4.0), 'right': ('F', 1.0), 'down': ('H', 2.0)},
+        'F': {'up': ('C', 2.0), 'left': ('E', 1.0), 'down': ('I', 3.0)},
+        'G': {'up': ('D', 2.0), 'right': ('H', 3.0)},
+        'H': {'up': ('E', 2.0), 'left': ('G', 3.0), 'right': ('I', 2.0)},
+        'I': {'up': ('F', 3.0), 'left': ('H', 2.0)}
+    }
+
+    def actionFunction(self, state: str) -> Set[str]:
+        return set(self.grid[state].keys())
+
+    def setUp(self):
+        self.problem = DiscretePlanningProblem(lambda state: state in self.grid, self.actionFunction,
+                                               lambda state, action: self.grid[state][action][0], 'A', {'I'},
+                                               costFunction=lambda state, action: self.grid[state][action][1])
+
+    def test_ForwardSearch_invalid_store(self):
+        with self.assertRaises(ValueError):
+            ForwardSearch(self.problem, store_options={'type': 'invalid type'})
+
+    def test_solvers_compact_store_match_dict_store(self):
+        for solverClass in [ForwardBFS, ForwardDijkstraSearch, ForwardAStar]:
+            with self.subTest(solver=solverClass.__name__):
+                dictSolver = solverClass(self.problem)
+                compactSolver = solverClass(self.problem, store_options={'type': 'compact'})
+                self.assertIsInstance(compactSolver.visitedTable, CompactParentTable)
+                solution = compactSolver.generateSolution()
+                self.assertEqual(solution, dictSolver.generateSolution())
+                self.assertTrue(compactSolver.validateSolution(solution))
+                self.assertEqual(dict(compactSolver.visitedTable), dictSolver.visitedTable)
+                if hasattr(dictSolver, 'costTable'):
+                    self.assertIsInstance(compactSolver.costTable, CompactCostTable)
+                    self.assertEqual(dict(compactSolver.costTable), dictSolver.costTable)
+
+if __name__ == '__main__':
+    unittest.main()